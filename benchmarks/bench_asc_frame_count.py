@@ -0,0 +1,97 @@
+#!/usr/bin/env python3.9
+'''
+Benchmark of IdxRecCompare.get_asc_frame_count against the previous
+line-by-line implementation on a synthetic CAN asc-file.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+'''
+import argparse
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+# idx_rec_compare is a standalone script (it's also executed on PC2).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'bosch_hol_sdk'))
+import idx_rec_compare  # noqa: E402
+
+ASC_HEADER = (
+    'date Wed Aug 9 03:54:56.973 pm 2023\n'
+    'base hex  timestamps absolute\n'
+    'internal events logged\n'
+    '// version 8.1.0\n'
+)
+ASC_LINE = '   {ts:.6f} CANFD   1 Rx        18d  VCar01Frame  1 0 8  8 00 11 22 33 44 55 66 77   0    0     3000 0 0 0 0 0\n'
+
+
+def write_asc(path: Path, num_lines: int):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(ASC_HEADER)
+        chunk = 100000
+        for start in range(0, num_lines, chunk):
+            file.write(''.join(
+                ASC_LINE.format(ts=i * 0.001)
+                for i in range(start, min(start + chunk, num_lines))
+            ))
+
+
+def get_asc_frame_count_text(asc_file: Path):
+    """ The previous implementation iterating the decoded lines. """
+    with open(asc_file, 'r', encoding='utf-8') as temp_f:
+        file_iterator = iter(temp_f)
+
+        for line in file_iterator:
+            if line == "// version 8.1.0\n":
+                break
+
+        asc_frame_count = 0
+        for line in file_iterator:
+            asc_frame_count += 1
+
+    return asc_frame_count
+
+
+def measure(func, *args, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--lines', type=int, default=5_000_000)
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    compare_obj = idx_rec_compare.IdxRecCompare(
+        'bench@0.rec', {}, logging.getLogger('bench'),
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asc_file = Path(tmp_dir) / 'VCar01@0.asc'
+        write_asc(asc_file, args.lines)
+        size_mb = asc_file.stat().st_size / 1024 / 1024
+
+        old_count, old_time = measure(
+            get_asc_frame_count_text, asc_file, repeat=args.repeat,
+        )
+        new_count, new_time = measure(
+            compare_obj.get_asc_frame_count, asc_file, repeat=args.repeat,
+        )
+
+    if old_count != new_count:
+        raise RuntimeError(f'Frame counts differ: {old_count} != {new_count}')
+
+    print(f'{args.lines} lines ({size_mb:.1f} MiB)')
+    print(f'  text lines:   {old_time:.3f}s')
+    print(f'  mmap blocks:  {new_time:.3f}s')
+    print(f'  speedup:      {old_time / new_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3.9
+'''
+Benchmark of the ESI variable monitoring path against simulated ESI units.
+
+Every cycle reads all variables of both ESI units concurrently, like
+ReplayPlugin._check_esi_variables, with optional latency and packet loss
+injected into the second unit.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+'''
+import argparse
+import logging
+import statistics
+import time
+
+from dspace.bosch_hol_sdk import esi_xcp_variables
+from dspace.bosch_hol_sdk.xcpinterface import (
+    XCPReadPlan,
+    XCPSession,
+    run_concurrently,
+)
+from dspace.bosch_hol_sdk.xcpsimulator import XCPSlaveSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-c', '--cycles', type=int, default=200)
+    parser.add_argument('-t', '--timeout', type=float, default=1)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--packet-loss', type=float, default=0)
+    parser.add_argument('--no-block-mode', action='store_true')
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bench')
+    simulators = []
+    calls = []
+    for name in ('ESI1', 'ESI2'):
+        esi_info = esi_xcp_variables.get_esi_info(name)
+        simulator = XCPSlaveSimulator(
+            esi_info,
+            block_mode=not args.no_block_mode,
+            seed=0,
+            logger=logger,
+        ).start()
+        simulators.append(simulator)
+        session = XCPSession(
+            *simulator.address,
+            logger=logger,
+            # Reconnect right away, a lost packet is not a broken slave.
+            retry_delay=0,
+            timeout=args.timeout,
+        )
+        plan = XCPReadPlan(esi_info.variables.read_variables())
+        calls.append((session, plan.read))
+    simulators[-1].latency = args.latency
+    simulators[-1].packet_loss = args.packet_loss
+
+    durations = []
+    failures = 0
+    try:
+        for _ in range(args.cycles):
+            start = time.perf_counter()
+            results = run_concurrently(calls, args.timeout)
+            durations.append(time.perf_counter() - start)
+            failures += sum(
+                isinstance(result, Exception) for result in results
+            )
+    finally:
+        for session, _ in calls:
+            session.close()
+        for simulator in simulators:
+            simulator.stop()
+
+    print(f'{args.cycles} cycles, {len(plan.variables)} variables per unit, '
+          f'{simulators[0].commands} commands to ESI1')
+    print(f'  mean cycle:   {statistics.mean(durations) * 1000:.1f}ms')
+    print(f'  max cycle:    {max(durations) * 1000:.1f}ms')
+    print(f'  failed reads: {failures}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3.9
+'''
+Benchmark of IdxRecCompare.data_check on a synthetic replay dataset.
+
+Every measurement runs in a fresh process and reports the wall time, the
+peak RSS and the number of read/write syscalls (from /proc/self/io). Apart
+from the complete check, every sensor is checked on its own, which
+includes parsing the rec-file.
+
+Results can be saved and later compared against to catch regressions:
+
+    bench_idx_rec_compare.py --save baseline.json
+    bench_idx_rec_compare.py --compare baseline.json
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+'''
+import argparse
+import concurrent.futures
+import json
+import logging
+from pathlib import Path
+import resource
+import sys
+import tempfile
+import time
+
+import replay_dataset
+
+# idx_rec_compare is a standalone script (it's also executed on PC2).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'bosch_hol_sdk'))
+import idx_rec_compare  # noqa: E402
+
+
+def _read_syscalls():
+    counters = {}
+    with open('/proc/self/io', encoding='utf-8') as file:
+        for line in file:
+            name, value = line.split(':')
+            counters[name] = int(value)
+    return counters['syscr'] + counters['syscw']
+
+
+def _run_check(rec_file, sensors, workers):
+    logger = logging.getLogger('IdxRecCompare')
+    logger.disabled = True
+    compare_obj = idx_rec_compare.IdxRecCompare(
+        rec_file, sensors, logger, workers=workers,
+    )
+    syscalls = _read_syscalls()
+    start = time.perf_counter()
+    compare_obj.data_check()
+    wall_time = time.perf_counter() - start
+    return {
+        'time': wall_time,
+        # Kilobytes on Linux.
+        'max_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'syscalls': _read_syscalls() - syscalls,
+    }
+
+
+def measure(rec_file, sensors, workers=1, repeat=1):
+    """ Return the best result of several runs, each in a fresh process. """
+    results = []
+    for _ in range(repeat):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(
+                executor.submit(_run_check, rec_file, sensors, workers).result()
+            )
+    return min(results, key=lambda result: result['time'])
+
+
+def run_benchmarks(rec_file, sensors, workers, repeat):
+    results = {'all': measure(rec_file, sensors, workers, repeat)}
+    for key, value in sensors.items():
+        for sensor_name in value:
+            single = {name: [] for name in sensors}
+            single[key] = [sensor_name]
+            results[sensor_name] = measure(rec_file, single, 1, repeat)
+    return results
+
+
+def compare_results(results, baseline, tolerance):
+    """ Return the names of all results slower than the baseline. """
+    regressions = []
+    for name, result in results.items():
+        try:
+            reference = baseline[name]['time']
+        except KeyError:
+            continue
+        if result['time'] > reference * (1 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('--save', type=Path, help='store results as json')
+    parser.add_argument('--compare', type=Path, help='json baseline results')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='allowed relative slow down compared to the baseline',
+    )
+    replay_dataset.add_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rec_file, sensors = replay_dataset.generate_dataset(
+            tmp_dir,
+            replay_dataset.configuration_from_arguments(args),
+        )
+        results = run_benchmarks(rec_file, sensors, args.workers, args.repeat)
+
+    print(f'{"check":<16}{"time [s]":>10}{"max RSS [MiB]":>15}{"syscalls":>10}')
+    for name, result in results.items():
+        print(
+            f'{name:<16}{result["time"]:>10.3f}'
+            f'{result["max_rss"] / 1024:>15.1f}{result["syscalls"]:>10}'
+        )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f'Regressions: {", ".join(regressions)}')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3.9
+'''
+Benchmark of the XCP framing layer against a local stand-in slave.
+
+The slave answers every command with a canned response, so the measured time
+is mostly the master side: packing the commands, receiving and parsing the
+responses.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+'''
+import argparse
+import logging
+import socket
+import struct
+import threading
+import time
+
+from dspace.bosch_hol_sdk.xcpinterface import (
+    DataType,
+    XCPCommand,
+    XCPInterface,
+    XCPReadPlan,
+)
+
+MAX_CTO = 0xFF
+BASE_ADDRESS = 0x70000000
+
+
+class StandInSlave:
+    """ Serves CONNECT, SHORT_UPLOAD, SET_MTA and UPLOAD over TCP. """
+    def __init__(self):
+        self._server = socket.create_server(('127.0.0.1', 0))
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    @staticmethod
+    def _packet(payload):
+        return struct.pack('<HH', len(payload), 0) + bytes(payload)
+
+    def _serve(self):
+        connection, _ = self._server.accept()
+        connect = self._packet([0xFF, 0, 0, MAX_CTO, 0xFF, 0, 1, 1])
+        ok = self._packet([0xFF])
+        data = self._packet([0xFF] + [0x5A] * (MAX_CTO - 1))
+        stream = connection.makefile('rb')
+        while True:
+            header = stream.read(4)
+            if len(header) < 4:
+                break
+            size, _ = struct.unpack('<HH', header)
+            command = stream.read(size)
+            pid = command[0]
+            if pid == 0xFF:
+                connection.sendall(connect)
+            elif pid == 0xF6:
+                connection.sendall(ok)
+            elif pid in (0xF4, 0xF5):
+                # SHORT_UPLOAD and UPLOAD return the requested number of bytes.
+                connection.sendall(self._packet(data[4: 5 + command[1]]))
+            else:
+                connection.sendall(self._packet([0xFE, 0x20]))
+        connection.close()
+
+
+def measure(func, *args, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def short_uploads(communicator, count):
+    for index in range(count):
+        communicator.send(
+            XCPCommand.SHORT_UPLOAD,
+            BASE_ADDRESS + 4 * index,
+            DataType.ULONG,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--commands', type=int, default=20_000)
+    parser.add_argument('-v', '--variables', type=int, default=5_000)
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    variables = [
+        (f'var_{index}', BASE_ADDRESS + 4 * index, DataType.ULONG)
+        for index in range(args.variables)
+    ]
+    plan = XCPReadPlan(variables)
+
+    slave = StandInSlave()
+    with XCPInterface(
+        '127.0.0.1', slave.port, logging.getLogger('bench'),
+    ) as communicator:
+        communicator.execute(XCPCommand.CONNECT)
+        _, short_upload_time = measure(
+            short_uploads, communicator, args.commands, repeat=args.repeat,
+        )
+        values, plan_time = measure(
+            plan.read, communicator, repeat=args.repeat,
+        )
+
+    if len(values) != args.variables:
+        raise RuntimeError(f'Read {len(values)} of {args.variables} values')
+
+    size_kb = args.variables * 4 / 1024
+    print(f'{args.commands} SHORT_UPLOADs')
+    print(f'  {args.commands / short_upload_time:.0f} commands/s')
+    print(f'{args.variables} variables ({size_kb:.1f} KiB) in '
+          f'{len(plan.blocks)} blocks')
+    print(f'  read plan:    {plan_time * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3.9
+'''
+Benchmark of the batched XIL variable reads of the replay monitoring.
+
+Every cycle reads the same batches as ReplayPlugin._sample_xil_monitoring and
+get_replay_state, with XILAPIMAPort.read_variables in three modes:
+
+    sequential  one MAPort.Read after the other (read_workers=1)
+    pool        concurrent MAPort.Read calls (the default read_workers)
+    capture     the captured variables served by a running
+                XILCaptureMonitor, the rest read by the pool
+
+Without --platform and --sdf the XIL API is replaced by a fake MAPort whose
+Read and Fetch calls take --latency seconds, like a round trip to the
+platform.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+'''
+import argparse
+import importlib
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+from dspace.bosch_hol_sdk import xil_variables
+
+CAPTURE_TASK = 'Periodic Task 1'
+
+# The same as replay_plugin.XIL_CAPTURE_VARIABLES.
+CAPTURE_VARIABLES = [
+    *(
+        (name, path)
+        for name, path in xil_variables.ReplayStateMonitor.items()
+        if name != 'replayLength'
+    ),
+    *xil_variables.ReplayDisgnostic_ESI1.items(),
+    *xil_variables.ReplayDisgnostic_ESI2.items(),
+    *xil_variables.ReplayDisgnostic_RTPC1.items(),
+    (
+        'Overrun Count RTPC1',
+        xil_variables.OverrunCounters['Overrun Count RTPC1'],
+    ),
+    (
+        'Task Turnaround RTPC1',
+        xil_variables.OverrunCounters['Task Turnaround RTPC1'],
+    ),
+]
+
+
+class _FakeCapture:
+    def __init__(self, maport):
+        self._maport = maport
+        self._start = None
+        self.Variables = []
+        self.Downsampling = 1
+
+    def Start(self):
+        self._start = time.monotonic()
+
+    def Stop(self):
+        self._start = None
+
+    def Fetch(self, _):
+        time.sleep(self._maport.latency)
+        now = time.monotonic() - self._start
+        signal = types.SimpleNamespace(
+            XVector=types.SimpleNamespace(Value=[now]),
+            FcnValues=types.SimpleNamespace(Value=[1.0]),
+        )
+        return types.SimpleNamespace(
+            ExtractSignalValue=lambda task, path: signal,
+        )
+
+
+class _FakeMAPort:
+    latency = 0.0
+    State = 'running'
+    VariableNames = []
+
+    def LoadConfiguration(self, _):
+        return None
+
+    def Configure(self, *_):
+        pass
+
+    def StartSimulation(self):
+        pass
+
+    def Read(self, _):
+        time.sleep(self.latency)
+        return types.SimpleNamespace(Value=1.0)
+
+    def CreateCapture(self, _):
+        return _FakeCapture(self)
+
+    def Dispose(self):
+        pass
+
+
+def _install_fake_xil_api():
+    """ Registers a fake of the modules of the XIL API used by XILAPIMAPort. """
+    testbench = types.SimpleNamespace(
+        MAPortFactory=types.SimpleNamespace(
+            CreateMAPort=lambda name: _FakeMAPort(),
+        ),
+        ValueFactory=None,
+    )
+    modules = {
+        'ASAM.XIL.Implementation.TestbenchFactory.Testbench': {
+            'TestbenchFactory': lambda: types.SimpleNamespace(
+                CreateVendorSpecificTestbench=lambda *args: testbench,
+            ),
+        },
+        'ASAM.XIL.Interfaces.Testbench.MAPort.Enum': {
+            'MAPortState': types.SimpleNamespace(eSIMULATION_RUNNING='running'),
+        },
+        'System': {
+            'Array': {str: list},
+            'String': str,
+        },
+    }
+    for name, attributes in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+
+
+def _cycle_batches(someip_paths):
+    """ The batches of one monitoring cycle of the plugin. """
+    return [
+        [
+            xil_variables.ReplayStateMonitor[name]
+            for name in ('replayDuration', 'replayProgress', 'replayState')
+        ],
+        list(xil_variables.ReplayDisgnostic_ESI1.values()),
+        list(xil_variables.ReplayDisgnostic_ESI2.values()),
+        list(xil_variables.ReplayDisgnostic_RTPC1.values()),
+        someip_paths,
+    ]
+
+
+def _measure(maport, batches, cycles):
+    durations = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        for batch in batches:
+            maport.read_variables(batch)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('-c', '--cycles', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.002)
+    parser.add_argument('--someip', type=int, default=40,
+                        help='SOME/IP subscription paths read per cycle')
+    parser.add_argument('--platform')
+    parser.add_argument('--sdf')
+    args = parser.parse_args()
+
+    if args.platform is None or args.sdf is None:
+        try:
+            importlib.import_module('ASAM.XIL.Implementation.TestbenchFactory.Testbench')
+        except ImportError:
+            _install_fake_xil_api()
+        else:
+            parser.error('--platform and --sdf are required with the XIL API')
+        _FakeMAPort.latency = args.latency
+        platform, sdf = 'Fake', 'fake.sdf'
+    else:
+        platform, sdf = args.platform, args.sdf
+
+    from dspace.bosch_hol_sdk.DataReplayAPI.drapi.helper.xilapi_maport import XILAPIMAPort
+    from dspace.bosch_hol_sdk.xil_capture_monitor import XILCaptureMonitor
+
+    someip_paths = [
+        f'SCALEXIO()://Fake/BusSystems/Ethernet/SOMEIP/Service{index}/Subscribed'
+        for index in range(args.someip)
+    ]
+    batches = _cycle_batches(someip_paths)
+    num_paths = sum(map(len, batches))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ('sequential', 'pool', 'capture'):
+            maport = XILAPIMAPort(
+                platform, sdf, directory=directory,
+                read_workers=1 if mode == 'sequential' else None,
+            )
+            monitor = None
+            try:
+                if mode == 'capture':
+                    monitor = XILCaptureMonitor(
+                        maport, CAPTURE_VARIABLES, task=CAPTURE_TASK,
+                    )
+                    monitor.start()
+                    maport.batch_reader = monitor.read_variables
+                    # Wait for the first fetch.
+                    while monitor.read_variables(batches[0])[0] is None:
+                        time.sleep(0.01)
+                durations = _measure(maport, batches, args.cycles)
+            finally:
+                if monitor is not None:
+                    maport.batch_reader = None
+                    monitor.stop()
+                maport.cleanup()
+
+            print(f'{mode:<10}  mean cycle: {statistics.mean(durations) * 1000:7.1f}ms'
+                  f'  max cycle: {max(durations) * 1000:7.1f}ms'
+                  f'  ({num_paths} paths)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3.9
+'''
+Generator of synthetic DSU replay datasets for benchmarking the replay data
+check (idx_rec_compare) without a vehicle recording.
+
+A dataset consists of a rec-file listing all samples, an idx- and s8-file
+per camera, an idx- and pcap-file for the lidar and an asc-file per CAN
+sensor. The camera s8-files are created sparse as only their size matters.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+'''
+import argparse
+import array
+import dataclasses
+import heapq
+import json
+from pathlib import Path
+import struct
+import sys
+
+TIMESTAMP = '20230809_155456973558'
+REC_NAME = f'DSU1_auto_20230809_155456@{TIMESTAMP}'
+
+CAMERA_NAMES = (
+    'SideFrontCam01', 'SideFrontCam02', 'SideRearCam01', 'SideRearCam02',
+    'SurCam01', 'SurCam02', 'SurCam03', 'SurCam04',
+    'FrontCam01', 'FrontCam02', 'RearCam01',
+)
+CAN_NAMES = (
+    'VCar01', 'VCar02', 'VCar03',
+    'FrontRadar01', 'CornerRadar01', 'CornerRadar02', 'CornerRadar03',
+    'CornerRadar04', 'VCar04', 'VCar05',
+)
+LIDAR_NAME = 'FrontLidar01'
+
+PCAP_GLOBAL_HEADER = struct.pack('<IHHiIII', 0xa1b2c3d4, 2, 4, 0, 0, 65535, 1)
+PCAP_RECORD_HEADER = struct.Struct('<IIII')
+ASC_HEADER = (
+    'date Wed Aug 9 03:54:56.973 pm 2023\n'
+    'base hex  timestamps absolute\n'
+    'internal events logged\n'
+    '// version 8.1.0\n'
+)
+
+
+@dataclasses.dataclass
+class DatasetConfiguration:
+    cameras: int = 8
+    can: int = 10
+    lidar: bool = True
+    duration: float = 60.0  # seconds
+    camera_rate: float = 30.0  # frames per second
+    lidar_rate: float = 10.0
+    can_rate: float = 100.0
+    camera_frame_size: int = 2 * 1024 * 1024
+    lidar_packets: int = 20  # packets per lidar frame
+    lidar_packet_size: int = 1206
+    # Fraction of the frames cut off the end of every data file.
+    truncate: float = 0.0
+
+
+def _format_timestamp(seconds: float) -> str:
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return f'{hours:02d}:{minutes:02d}:{seconds:09.6f}'
+
+
+def _num_frames(config: DatasetConfiguration, rate: float) -> int:
+    return max(int(config.duration * rate), 2)
+
+
+def _valid_frames(config: DatasetConfiguration, num_frames: int) -> int:
+    return num_frames - int(num_frames * config.truncate)
+
+
+def _write_index(path: Path, offsets):
+    with open(path, 'wb') as file:
+        array.array('q', offsets).tofile(file)
+
+
+def _write_camera(directory: Path, name: str, config: DatasetConfiguration):
+    num_frames = _num_frames(config, config.camera_rate)
+    offsets = range(
+        0,
+        (num_frames + 1) * config.camera_frame_size,
+        config.camera_frame_size,
+    )
+    _write_index(directory / f'{name}@{TIMESTAMP}.idx', offsets)
+
+    # Cut the data in the middle of the first missing frame.
+    valid = _valid_frames(config, num_frames)
+    size = offsets[valid]
+    if valid < num_frames:
+        size += config.camera_frame_size // 2
+    with open(directory / f'{name}@{TIMESTAMP}.s8', 'wb') as file:
+        file.truncate(size)
+
+    return num_frames, config.camera_frame_size
+
+
+def _write_lidar(directory: Path, config: DatasetConfiguration):
+    num_frames = _num_frames(config, config.lidar_rate)
+    valid = _valid_frames(config, num_frames)
+    payload = bytes(config.lidar_packet_size)
+    packet_interval = 1 / config.lidar_rate / config.lidar_packets
+
+    offsets = [len(PCAP_GLOBAL_HEADER)]
+    with open(directory / f'{LIDAR_NAME}@{TIMESTAMP}.pcap', 'wb') as file:
+        file.write(PCAP_GLOBAL_HEADER)
+        for frame in range(num_frames):
+            packets = config.lidar_packets
+            if frame == valid:
+                # Last frame is only partially written.
+                packets //= 2
+            elif frame > valid:
+                packets = 0
+
+            for packet in range(packets):
+                ts = (frame * config.lidar_packets + packet) * packet_interval
+                sec = int(ts)
+                usec = round((ts - sec) * 1000 * 1000)
+                file.write(PCAP_RECORD_HEADER.pack(
+                    sec, usec, len(payload), len(payload),
+                ))
+                file.write(payload)
+            offsets.append(offsets[-1] + config.lidar_packets * (
+                PCAP_RECORD_HEADER.size + len(payload)
+            ))
+
+    _write_index(directory / f'{LIDAR_NAME}@{TIMESTAMP}.idx', offsets)
+    frame_size = config.lidar_packets * config.lidar_packet_size
+    return num_frames, frame_size
+
+
+def _write_can(directory: Path, name: str, config: DatasetConfiguration):
+    num_frames = _num_frames(config, config.can_rate)
+    valid = _valid_frames(config, num_frames)
+    with open(directory / f'{name}@{TIMESTAMP}.asc', 'w', encoding='utf-8') as file:
+        file.write(ASC_HEADER)
+        for frame in range(valid):
+            file.write(
+                f'   {frame / config.can_rate:.6f} CANFD   1 Rx        18d  '
+                f'{name}Frame  1 0 8  8 00 11 22 33 44 55 66 77\n'
+            )
+    return num_frames, 64
+
+
+def _sample_times(name: str, num_frames: int, rate: float):
+    for frame in range(num_frames):
+        yield frame / rate, name
+
+
+def generate_dataset(directory, config: DatasetConfiguration = None):
+    """
+    Write a dataset to the given directory.
+
+    Return:
+        tuple(Path, dict): the rec-file and the sensors argument of
+                           IdxRecCompare for this dataset.
+    """
+    config = config or DatasetConfiguration()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    sensors = {'camera': [], 'can': [], 'lidar': []}
+    streams = {}
+    for name in CAMERA_NAMES[:config.cameras]:
+        sensors['camera'].append(name)
+        streams[name] = (_write_camera(directory, name, config), config.camera_rate)
+    if config.lidar:
+        sensors['lidar'].append(LIDAR_NAME)
+        streams[LIDAR_NAME] = (_write_lidar(directory, config), config.lidar_rate)
+    for name in CAN_NAMES[:config.can]:
+        sensors['can'].append(name)
+        streams[name] = (_write_can(directory, name, config), config.can_rate)
+
+    rec_file = directory / f'{REC_NAME}.rec'
+    with open(rec_file, 'w', encoding='utf-8') as file:
+        file.write('[Header]\nVersion=2.0\n\n[Data]\n')
+        for name, ((_, frame_size), _) in streams.items():
+            file.write(
+                f'{_format_timestamp(0)} @ Record {name}'
+                f'(output[MAPS::Stream8,1,{frame_size}])\n'
+            )
+
+        samples = heapq.merge(*(
+            _sample_times(name, num_frames, rate)
+            for name, ((num_frames, _), rate) in streams.items()
+        ))
+        for ts, name in samples:
+            file.write(f'{_format_timestamp(ts)} / {name}#0 {name}.output\n')
+
+    return rec_file, sensors
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """ Add an option for every field of DatasetConfiguration. """
+    defaults = DatasetConfiguration()
+    for field in dataclasses.fields(DatasetConfiguration):
+        if field.type is bool:
+            kwargs = {'action': argparse.BooleanOptionalAction}
+        else:
+            kwargs = {'type': field.type}
+        parser.add_argument(
+            f'--{field.name.replace("_", "-")}',
+            default=getattr(defaults, field.name),
+            **kwargs,
+        )
+
+
+def configuration_from_arguments(args: argparse.Namespace):
+    return DatasetConfiguration(**{
+        field.name: getattr(args, field.name)
+        for field in dataclasses.fields(DatasetConfiguration)
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('directory', type=Path)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    rec_file, sensors = generate_dataset(
+        args.directory,
+        configuration_from_arguments(args),
+    )
+    json.dump({'rec': str(rec_file), 'sensors': sensors}, sys.stdout)
+    print()
+
+
+if __name__ == '__main__':
+    main()
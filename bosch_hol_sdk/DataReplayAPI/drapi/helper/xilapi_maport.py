@@ -1,10 +1,14 @@
 from ASAM.XIL.Implementation.TestbenchFactory.Testbench import TestbenchFactory
 from ASAM.XIL.Interfaces.Testbench.MAPort.Enum import MAPortState
+from System import Array, String
 
 import xml.etree.cElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 import json
+import threading
+import time
 
 class XILAPIMAPort:
     """
@@ -12,8 +16,11 @@ class XILAPIMAPort:
     automatically.
     """
     default_filename = "MAPortConfigDRAPI.xml"
+    # Number of concurrent MAPort.Read calls of a batch read, for the variables
+    # not provided by the batch reader. 1 reads them one after the other.
+    default_read_workers = 4
 
-    def __init__(self, platform, sdf_file, directory=".", logger=None) -> None:
+    def __init__(self, platform, sdf_file, directory=".", logger=None, read_workers=None) -> None:
         """
         Creates a XILAPIMAPort object
 
@@ -21,11 +28,22 @@ class XILAPIMAPort:
         sdf_file - path to the sdf which is currently loaded to the dSPACE platform
         directory (optional) - the path where the MAPort Config is written. Default is '.'.
         logger (optional) - a logger instance. If none provided, one will be created automatically.
+        read_workers (optional) - the number of concurrent reads of read_variables. Default is 4.
         """
         self._sdf_file = sdf_file
         self._platform = platform
         self._temp_directory = directory
         self._maport = None
+        self._read_workers = read_workers or XILAPIMAPort.default_read_workers
+        self._read_executor = None
+        # Serializes the calls into the MAPort and the objects created by it,
+        # which are not documented to be thread-safe.
+        self.lock = threading.RLock()
+        # Reads all the given variables at once, replacing the pooled reads
+        # (e.g. from a running capture). Returns None for unavailable ones.
+        self.batch_reader = None
+        # Duration in seconds of the last read_variables call.
+        self.last_batch_latency = None
         if logger is None:
             self._logger = logging.getLogger("XILAPIMAPort")
         else:
@@ -40,11 +58,18 @@ class XILAPIMAPort:
         """
         Frees any open ressources, e.g. connection to the XIL API. Needs to be called before the application can
         be unloaded. Also deletes the temporary created config file
-        """
-        # Disconnect from XIL API
-        if self._maport is not None:
-            self._maport.Dispose()
-            self._maport = None
+
+        Waits for the MAPort calls of other threads, e.g. of a sampler lane that
+        didn't stop in time.
+        """
+        with self.lock:
+            if self._read_executor is not None:
+                self._read_executor.shutdown()
+                self._read_executor = None
+            # Disconnect from XIL API
+            if self._maport is not None:
+                self._maport.Dispose()
+                self._maport = None
         # Delete the temporary created config file
         if self._maport_config_file.exists():
             self._maport_config_file.unlink()
@@ -67,11 +92,19 @@ class XILAPIMAPort:
             self._maport.StartSimulation()
             self._logger.debug("Started simulation")
 
+    @property
+    def sdf_file(self):
+        """
+        The path of the sdf which is currently loaded to the dSPACE platform
+        """
+        return self._sdf_file
+
     def get_variables(self):
         """
         Returns a list of all available variables.        
         """
-        return self._maport.VariableNames
+        with self.lock:
+            return self._maport.VariableNames
 
     def read_variable(self, variable):
         """
@@ -79,8 +112,65 @@ class XILAPIMAPort:
 
         variable - the variable to be read, e.g. 'DS6001()://Model Root/Enable/Value'
         """
+        with self.lock:
+            return self._maport.Read(variable).Value
+
+    def read_variables(self, variables):
+        """
+        Reads and returns the values of several variables, in the same order
+
+        The variables are read with the batch reader if one is set, the ones it
+        can't provide with MAPort.Read calls. Other users of the MAPort wait
+        until all of them are read.
+
+        variables - the variables to be read, e.g. ['DS6001()://Model Root/Enable/Value']
+        """
+        start = time.perf_counter()
+        unique_variables = list(dict.fromkeys(variables))
+        values = {}
+        if self.batch_reader is not None:
+            for variable, value in zip(unique_variables, self.batch_reader(unique_variables)):
+                if value is not None:
+                    values[variable] = value
+
+        missing = [variable for variable in unique_variables if variable not in values]
+        with self.lock:
+            if len(missing) > 1 and self._read_workers > 1:
+                if self._read_executor is None:
+                    self._read_executor = ThreadPoolExecutor(
+                        max_workers=self._read_workers,
+                        thread_name_prefix="XILAPIMAPortRead",
+                    )
+                # The workers don't take the lock, this thread holds it.
+                values.update(zip(missing, self._read_executor.map(self._read, missing)))
+            else:
+                values.update((variable, self._read(variable)) for variable in missing)
+
+        self.last_batch_latency = time.perf_counter() - start
+        self._logger.debug(
+            f"Read {len(unique_variables)} variables ({len(missing)} by MAPort.Read) "
+            f"in {self.last_batch_latency * 1000:.1f} ms"
+        )
+        return [values[variable] for variable in variables]
+
+    def _read(self, variable):
         return self._maport.Read(variable).Value
 
+    def create_capture(self, variables, task, downsampling=1):
+        """
+        Creates and returns a capture of several variables, which is started with Start()
+        and whose samples are fetched with Fetch(False)
+
+        variables - the variables to be captured
+        task - the task on which the variables are sampled, e.g. 'Periodic Task 1'
+        downsampling (optional) - the variables are sampled every downsampling-th task execution. Default is 1.
+        """
+        with self.lock:
+            capture = self._maport.CreateCapture(task)
+            capture.Variables = Array[String](list(variables))
+            capture.Downsampling = downsampling
+        return capture
+
     def is_one_dimensional(self, lst):
         """
         if the given list is one dimension
@@ -118,7 +208,8 @@ class XILAPIMAPort:
         else:
             raise TypeError(f"{type(value)} is not supported for writing")
         
-        self._maport.Write(variable, maport_value)
+        with self.lock:
+            self._maport.Write(variable, maport_value)
 
     @classmethod
     def create_maport_config(cls, directory, sdf_path, platform):
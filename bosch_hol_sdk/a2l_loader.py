@@ -0,0 +1,220 @@
+"""
+Loads the XCP variables of a device from its A2L file at runtime.
+
+Parsing an A2L file takes a while, so the result is cached on disk, keyed by
+the hash of the A2L file.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import dataclasses
+import hashlib
+import itertools
+import json
+import logging
+import pathlib
+import re
+
+from dspace.bosch_hol_sdk import defaults
+from dspace.bosch_hol_sdk.esi_xcp_variables import EsiInfo
+from dspace.bosch_hol_sdk.xcp_variable_table import XCPVariableTable
+from dspace.bosch_hol_sdk.xcpinterface import DataType
+
+CACHE_VERSION = 2
+
+# Strings, comments and any other whitespace separated token.
+_TOKEN_REGEX = re.compile(
+    rb'"(?:[^"\\]|\\.)*"|/\*.*?\*/|//[^\n]*|[^\s"]+',
+    re.DOTALL,
+)
+
+# The A2L data types of measurements that can be read over XCP.
+A2L_DATA_TYPES = {
+    'UBYTE': DataType.UBYTE,
+    'SBYTE': DataType.SBYTE,
+    'UWORD': DataType.UWORD,
+    'SWORD': DataType.SWORD,
+    'ULONG': DataType.ULONG,
+    'SLONG': DataType.SLONG,
+    'A_UINT64': DataType.A_UINT64,
+    'A_INT64': DataType.A_SINT64,
+    'FLOAT32_IEEE': DataType.FLOAT32_IEEE,
+    'FLOAT64_IEEE': DataType.FLOAT64_IEEE,
+}
+
+
+@dataclasses.dataclass
+class A2LContent:
+    # The EPK (software version string) and its address.
+    epk: str
+    epk_address: int
+    variables: XCPVariableTable
+
+    def to_json(self):
+        return {
+            'version': CACHE_VERSION,
+            'epk': self.epk,
+            'epk_address': self.epk_address,
+            'names': self.variables.names,
+            'addresses': self.variables.addresses.tolist(),
+            'type_codes': self.variables.type_codes.tobytes().decode('ascii'),
+        }
+
+    @classmethod
+    def from_json(cls, content):
+        if content['version'] != CACHE_VERSION:
+            raise ValueError(content['version'])
+        return cls(
+            epk=content['epk'],
+            epk_address=content['epk_address'],
+            variables=XCPVariableTable(
+                content['names'],
+                content['addresses'],
+                content['type_codes'].encode('ascii'),
+            ),
+        )
+
+
+def _iter_tokens(data):
+    for match in _TOKEN_REGEX.finditer(data):
+        token = match.group()
+        if not token.startswith((b'/*', b'//')):
+            yield token
+
+
+def _unquote(token):
+    if len(token) >= 2 and token.startswith(b'"') and token.endswith(b'"'):
+        token = token[1:-1]
+    return token.decode('latin-1')
+
+
+def _parse_measurement(tokens):
+    """
+    Returns (name, address, datatype, dimensions) of the measurement whose
+    tokens follow, address and datatype being None if not available over XCP
+    and dimensions empty for a scalar.
+    """
+    name = next(tokens).decode('latin-1')
+    next(tokens)  # The long identifier.
+    datatype = A2L_DATA_TYPES.get(next(tokens).decode('latin-1'))
+    address = None
+    dimensions = []
+    depth = 0
+    token = next(tokens)
+    while True:
+        # The token after the dimensions of MATRIX_DIM, read to find their end.
+        following = None
+        if token == b'/begin':
+            next(tokens)
+            depth += 1
+        elif token == b'/end':
+            next(tokens)
+            if depth == 0:
+                break
+            depth -= 1
+        elif depth == 0 and token == b'ECU_ADDRESS':
+            address = int(next(tokens), 0)
+        elif depth == 0 and token == b'ARRAY_SIZE':
+            dimensions = [int(next(tokens), 0)]
+        elif depth == 0 and token == b'MATRIX_DIM':
+            # One to three dimensions, older A2L versions always give three
+            # and pad them with 1.
+            dimensions = []
+            following = next(tokens)
+            while following.isdigit():
+                dimensions.append(int(following))
+                following = next(tokens)
+        token = next(tokens) if following is None else following
+    return name, address, datatype, [size for size in dimensions if size > 1]
+
+
+def _expand_array(name, address, datatype, dimensions):
+    """
+    Yields the (name, address, datatype) of the elements of an array
+    measurement, named like name[i][j] in row-major order.
+    """
+    if not dimensions:
+        yield name, address, datatype
+        return
+    for offset, indices in enumerate(
+            itertools.product(*(range(size) for size in dimensions))):
+        element = name + ''.join(f'[{index}]' for index in indices)
+        yield element, address + offset * len(datatype.value), datatype
+
+
+def parse_a2l(data):
+    """ Parses the measurements and the EPK from the A2L file content. """
+    variables = {}
+    epk = None
+    epk_address = None
+
+    tokens = _iter_tokens(data)
+    for token in tokens:
+        if token == b'/begin':
+            if next(tokens) == b'MEASUREMENT':
+                name, address, datatype, dimensions = _parse_measurement(
+                    tokens,
+                )
+                if address is not None and datatype is not None:
+                    for variable in _expand_array(
+                            name, address, datatype, dimensions):
+                        variables[variable[0]] = variable
+        elif token == b'EPK':
+            epk = _unquote(next(tokens))
+        elif token == b'ADDR_EPK':
+            epk_address = int(next(tokens), 0)
+
+    return A2LContent(
+        epk=epk,
+        epk_address=epk_address,
+        variables=XCPVariableTable.from_variables(list(variables.values())),
+    )
+
+
+def load_a2l(a2l_file, cache_directory=None, logger=None):
+    """
+    Returns the content of the A2L file, from the cache if it was parsed
+    before.
+    """
+    if cache_directory is None:
+        cache_directory = defaults.A2L_CACHE_DIRECTORY
+    if logger is None:
+        logger = logging.getLogger()
+    logger = logger.getChild('A2LLoader')
+
+    data = pathlib.Path(a2l_file).read_bytes()
+    cache_file = pathlib.Path(
+        cache_directory,
+        f'{hashlib.sha256(data).hexdigest()}.json',
+    )
+    try:
+        content = A2LContent.from_json(json.loads(cache_file.read_text()))
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.info(f'Parsing {a2l_file}.')
+    else:
+        logger.debug(f'Loaded {a2l_file} from {cache_file}.')
+        return content
+
+    content = parse_a2l(data)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(content.to_json()))
+        tmp_file.replace(cache_file)
+    except OSError:
+        logger.warning(f'Failed to cache {a2l_file}.', exc_info=True)
+    return content
+
+
+def get_esi_info(esi_name, a2l_file, cache_directory=None, logger=None):
+    """ Returns the XCP infos of an ESI unit from its A2L file. """
+    content = load_a2l(a2l_file, cache_directory, logger)
+    if content.epk is None or content.epk_address is None:
+        raise ValueError(f'{a2l_file} does not define the EPK.')
+    return EsiInfo(
+        name=esi_name,
+        version=content.epk,
+        version_address=content.epk_address,
+        variables=content.variables,
+    )
@@ -1,3 +1,11 @@
+__all__ = [
+    'CanManipulator', 'LidarManipulator', 'SomeIpManipulator',
+    'CameraManipulator',
+    'XilManipulationBase', 'XilWriteBatch',
+    'DataManipulation', 'reload_xil_paths',
+]
+
+
 from .bus_manipulator import CanManipulator
 from .lidar_manipulator import LidarManipulator
 from .someip_manipulator import SomeIpManipulator
@@ -8,7 +16,7 @@ from ..configuration import (
     CameraManipulationUnit,
 )
 
-from .manipulationbase import XilManipulationBase
+from .manipulationbase import XilManipulationBase, XilWriteBatch
 
 
 def DataManipulation(*, configuration, **kwargs):
@@ -6,6 +6,7 @@ from dspace.bosch_hol_sdk.port_connection_config import PortConnectionManager
 from dspace.bosch_hol_sdk.replay_plugin_exceptions import (
     BadXilPathError, XilWriteVerificationError,
 )
+from dspace.bosch_hol_sdk.xil_catalogue import load_xil_catalogue
 
 
 class ManipulationBase(abc.ABC):
@@ -36,16 +37,115 @@ class RTMapsManipulationBase(ManipulationBase):
         self._rtmaps = access_objects['rtmaps'][conn.player.location]
 
 
+class XilWriteBatch:
+    """
+    Writes the manipulation data of several units, and verifies all of it
+    with one batch read at the end (see verify).
+    """
+    # Paths whose vectors can't be written at once, e.g. because the vector in
+    # the model is longer than the written one. They are written element-wise.
+    # Only valid for the application they were found in.
+    _elementwise_paths = set()
+
+    @staticmethod
+    def reset_elementwise_paths():
+        XilWriteBatch._elementwise_paths = set()
+
+    def __init__(self, maport, read_before=False, logger=None):
+        parent_logger = logger or logging.getLogger('DRAPI.data_manipulation')
+        self._logger = parent_logger.getChild(self.__class__.__name__)
+        self._maport = maport
+        # Reads and logs the values before writing them, for debugging.
+        self._read_before = read_before
+        # Path -> (value, configuration, name) of the written variables.
+        self._pending = {}
+
+    def write(self, path, value, configuration, name=None):
+        """ Write a value in a XIL path (Can raise XIL-Exceptions) """
+        name = name or path  # Use the path if no name is provided.
+        if self._read_before:
+            value_before = self._maport.read_variable(path)
+            self._logger.debug(f'{name} before write: {value_before}')
+
+        if isinstance(value, Iterable):
+            value = list(value)
+            self._write_vector(path, value)
+        else:
+            self._maport.write_variable(path, value)
+        self._pending[path] = (value, configuration, name)
+
+    def _write_vector(self, path, value):
+        # The MAPort value of a whole vector gets the type of its first
+        # element, so only vectors of one element type are written at once.
+        uniform = len({type(subvalue) for subvalue in value}) == 1
+        if uniform and path not in XilWriteBatch._elementwise_paths:
+            try:
+                self._maport.write_variable(path, value)
+                return
+            except Exception:
+                self._logger.debug(
+                    f'Failed to write {path} at once, writing it element-wise.',
+                    exc_info=True,
+                )
+                XilWriteBatch._elementwise_paths.add(path)
+
+        for idx, subvalue in enumerate(value):
+            self._maport.write_variable(f'{path}[{idx}]', subvalue)
+
+    def verify(self):
+        """ Read back all the written values at once and check them. """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        values_after = self._maport.read_variables(list(pending))
+        for (path, (value, configuration, name)), value_after in zip(
+            pending.items(),
+            values_after,
+        ):
+            self._logger.debug(f'{name} after write: {value_after}')
+
+            # Throw away the irrelevant values.
+            if isinstance(value, list):
+                if not isinstance(value_after, Iterable) or \
+                        len(value_after) < len(value):
+                    raise XilWriteVerificationError(
+                        path,
+                        configuration,
+                        value,
+                        value_after,
+                    )
+                value_after = list(value_after)[:len(value)]
+
+            # Check the read-back value.
+            if value_after != value:
+                raise XilWriteVerificationError(
+                    path,
+                    configuration,
+                    value,
+                    value_after,
+                )
+
+
 class XilManipulationBase(ManipulationBase):
     _known_paths = None
 
     def __init__(self, *args, access_objects, **kwargs):
         super().__init__(*args, **kwargs)
         self._maport = access_objects['maport']
+        # Shared by the units applied together, which are verified at once.
+        self._write_batch = access_objects.get('xil_write_batch')
 
     @staticmethod
     def reload_known_paths(maport):
-        XilManipulationBase._known_paths = maport.get_variables()
+        # Only changes if another application was loaded.
+        current = XilManipulationBase._known_paths
+        XilManipulationBase._known_paths = load_xil_catalogue(
+            maport,
+            current=current,
+        )
+        if XilManipulationBase._known_paths is not current:
+            XilWriteBatch.reset_elementwise_paths()
 
     @staticmethod
     def get_known_paths():
@@ -64,36 +164,15 @@ class XilManipulationBase(ManipulationBase):
 
     def _write_variable(self, path, value, name=None):
         """ Write a value in a XIL path (Can raise XIL-Exceptions """
-        name = name or path  # Use the path if no name is provided.
-        value_before = self._maport.read_variable(path)
-        self._logger.debug(f'{name} before write: {value_before}')
-
-        if isinstance(value, Iterable):
-            for idx, subvalue in enumerate(value):
-                self._maport.write_variable(f'{path}[{idx}]', subvalue)
-        else:
-            self._maport.write_variable(path, value)
-
-        value_after = self._maport.read_variable(path)
-        self._logger.debug(f'{name} after write: {value_after}')
-
-        # Throw away the irrelevant values.
-        if isinstance(value, Iterable):
-            if not isinstance(value_after, Iterable) or \
-                    len(value_after) < len(value):
-                raise XilWriteVerificationError(
-                    path,
-                    self.configuration,
-                    value,
-                    value_after,
-                )
-            del value_after[len(value):]
-
-        # Check the read-back value.
-        if value_after != value:
-            raise XilWriteVerificationError(
-                path,
-                self.configuration,
-                value,
-                value_after,
-            )
+        if self._write_batch is not None:
+            self._write_batch.write(path, value, self.configuration, name)
+            return
+
+        # Applied on its own, so verify right away.
+        write_batch = XilWriteBatch(
+            self._maport,
+            read_before=self._logger.isEnabledFor(logging.DEBUG),
+            logger=self._logger,
+        )
+        write_batch.write(path, value, self.configuration, name)
+        write_batch.verify()
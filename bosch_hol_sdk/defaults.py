@@ -16,3 +16,11 @@ PLATFORM = 'SCALEXIO_2'
 
 TEST_RTAPP_PATH = pathlib.Path(__file__).parent / 'system_reset' / 'reset_test_app'
 TEST_RTAPP_SDF = TEST_RTAPP_PATH / 'DummyApp_XILAPI_ESI_Testing.sdf'
+
+# A2L files of the ESI units, named after the unit (e.g. ESI1.a2l). Units
+# without one use the variables generated into esi_xcp_variables.
+ESI_A2L_DIRECTORY = pathlib.Path('/home/dspace/workspace/esi_a2l')
+# Parsed A2L files, keyed by the hash of the file.
+A2L_CACHE_DIRECTORY = pathlib.Path('/var/log/dspace/a2l_cache')
+# XIL variable catalogues, keyed by the hash of the real-time application.
+XIL_CATALOGUE_DIRECTORY = pathlib.Path('/var/log/dspace/xil_catalogue')
@@ -15,9 +15,7 @@ from dspace.bosch_hol_sdk.DataReplayAPI.drapi.helper.scalexio_control import (
 )
 from dspace.bosch_hol_sdk.netio_api_json_via_http import NetioSocket
 from dspace.bosch_hol_sdk.netio_api_json_via_http import NetioState  # noqa:F401
-from dspace.bosch_hol_sdk.xcpinterface import (
-    XCPInterface, XCPCommand, XCPResponseType,
-)
+from dspace.bosch_hol_sdk.xcpinterface import XCPSession
 from dspace.bosch_hol_sdk.utils import ping
 
 
@@ -147,7 +145,7 @@ class EsiDeviceControl(NetioDeviceControl):
 
     def __post_init__(self):
         super().__post_init__()
-        self._xcp_if = XCPInterface(
+        self.xcp_session = XCPSession(
             ip=self.ip,
             port=self.port,
             logger=self._logger,
@@ -173,11 +171,7 @@ class EsiDeviceControl(NetioDeviceControl):
 
     def test_xcp_connection(self):
         try:
-            with self._xcp_if as xcp_comm:
-                resp = xcp_comm.send(XCPCommand.CONNECT)
-                if(resp.type != XCPResponseType.RESPONSE):
-                    return False
-                xcp_comm.send(XCPCommand.DISCONNECT)
+            self.xcp_session.probe()
         except Exception:
             self._logger.exception('Failed to connect to the ESI over XCP')
             return False
@@ -205,14 +199,20 @@ class AggregateEsiDeviceControls(DeviceControlInterface):
     def turn_off(self):
         # The ESI units share one power control socket so we can turn only one
         # of them off.
+        self.close_xcp_sessions()
         self.devices[0].turn_off()
 
     def reboot(self, delay: float = 3):
         # The ESI units share one power control socket so we can reboot only
         # one of them.
         self._logger.info(f'Rebooting devices {self.devices}')
+        self.close_xcp_sessions()
         self.devices[0].reboot(delay)
 
+    def close_xcp_sessions(self):
+        for device in self.devices:
+            device.xcp_session.close()
+
     def wait_till_online(self, timeout: float = 300):
         start_time = time.perf_counter()
         try:
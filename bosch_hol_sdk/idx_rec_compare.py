@@ -3,28 +3,420 @@
 Author: xiaofei zhang
 Date: 2023.12.14
 '''
+import array
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import enum
+import hashlib
 import itertools
 import json
+import mmap
+import multiprocessing
+import operator
+import os
 from pathlib import Path
 import re
+import shutil
 import logging
+import sqlite3
 import struct
+import sys
+import time
 
-import dpkt
+# Size of a single entry (little-endian int64 end address) in the idx-file.
+IDX_ENTRY_SIZE = 8
+# Size of a single sample line offset (little-endian int64) in the files of
+# a resumable check and the number of samples per stored offset.
+LINE_ENTRY_SIZE = 8
+LINE_OFFSET_STRIDE = 64
+# Start method of the worker processes. The plugin process is multi-threaded
+# and forking it could deadlock the workers on locks held by other threads.
+WORKER_START_METHOD = 'forkserver'
+# Entries before and after the binary search result of _get_last_frame_info
+# which are checked to be monotonic.
+MONOTONIC_CHECK_WINDOW = 16
+# Results of the data check cache that aren't used for that long are removed,
+# as well as the least recently used ones beyond the maximum number.
+RESULT_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds.
+RESULT_CACHE_MAX_ENTRIES = 1000
+
+
+@contextlib.contextmanager
+def open_index_offsets(index_file: Path):
+    """
+    Map an idx-file (or any other file of little-endian int64 values) into
+    memory and provide its entries as a sequence of integers without
+    reading or unpacking them one by one.
+
+    The yielded object is only valid inside the with-block.
+    """
+    num_entries = index_file.stat().st_size // IDX_ENTRY_SIZE
+    if num_entries == 0:
+        # Empty files can't be mapped.
+        yield ()
+        return
+
+    with open(index_file, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if sys.byteorder != 'little':
+            offsets = array.array('q')
+            offsets.frombytes(buffer[:num_entries * IDX_ENTRY_SIZE])
+            offsets.byteswap()
+            yield offsets
+            return
+
+        with memoryview(buffer) as view, \
+                view[:num_entries * IDX_ENTRY_SIZE] as entries, \
+                entries.cast('q') as offsets:
+            yield offsets
+
+
+def find_invalid_frames(offsets, num_frames: int, file_size: int, max_frame_size=None, first_frame=1):
+    """
+    Return the numbers (starting at 1) of all frames from `first_frame` up to
+    `num_frames` that can't be replayed: frames ending beyond the data file,
+    zero-length frames, frames with non-monotonic offsets and, if given,
+    frames larger than `max_frame_size`.
+
+    Frame n spans from offsets[n - 1] to offsets[n]. The comparisons run in
+    C through itertools, only the invalid frame numbers are materialized.
+    The frame sizes are computed lazily for each check.
+    """
+    starts = offsets[first_frame - 1:num_frames]
+    ends = offsets[first_frame:num_frames + 1]
+
+    def sizes():
+        return map(operator.sub, ends, starts)
+
+    invalid = set(itertools.compress(
+        itertools.count(first_frame),
+        map(operator.gt, ends, itertools.repeat(file_size)),
+    ))
+    invalid.update(itertools.compress(
+        itertools.count(first_frame),
+        map(operator.le, sizes(), itertools.repeat(0)),
+    ))
+    if max_frame_size:
+        invalid.update(itertools.compress(
+            itertools.count(first_frame),
+            map(operator.gt, sizes(), itertools.repeat(max_frame_size)),
+        ))
+    return sorted(invalid)
+
+
+def get_last_complete_frame(offsets, num_frames: int, file_size: int, first_frame=1):
+    """
+    Return the last frame up to which all frames, starting at `first_frame`,
+    end within the data file.
+    """
+    beyond = itertools.compress(
+        itertools.count(first_frame),
+        map(operator.gt, offsets[first_frame:num_frames + 1], itertools.repeat(file_size)),
+    )
+    return next(beyond, num_frames + 1) - 1
+
+
+def get_valid_frame_ranges(invalid_frames, num_frames: int):
+    """
+    Return the inclusive ranges of consecutive valid frames as a list of
+    tuples (first, last), given the sorted invalid frame numbers.
+    """
+    ranges = []
+    first = 1
+    for frame in itertools.chain(invalid_frames, (num_frames + 1,)):
+        if frame > first:
+            ranges.append((first, frame - 1))
+        first = frame + 1
+    return ranges
+
+
+# Magic numbers of pcap-files and the resolution of their timestamps.
+PCAP_MAGICS = {
+    0xa1b2c3d4: 1000 * 1000,         # microseconds
+    0xa1b23c4d: 1000 * 1000 * 1000,  # nanoseconds
+}
+PCAP_GLOBAL_HEADER_SIZE = 24
+
+
+def get_pcap_max_timestamp(pcap_file: Path, start_address: int, end_address: int) -> float:
+    """
+    Return the highest timestamp (in seconds) of the packets stored between
+    the two addresses of a pcap-file.
+
+    Only the 16 byte record headers are read from a memory map, the packet
+    data is skipped.
+    """
+    with open(pcap_file, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if len(buffer) < PCAP_GLOBAL_HEADER_SIZE:
+            raise ValueError(f"'{pcap_file}' is not a pcap-file.")
+
+        for byte_order in ('<', '>'):
+            magic, = struct.unpack_from(f'{byte_order}I', buffer)
+            if magic in PCAP_MAGICS:
+                break
+        else:
+            raise ValueError(f"Invalid magic number in '{pcap_file}'.")
+        divisor = PCAP_MAGICS[magic]
+        record_header = struct.Struct(f'{byte_order}IIII')
+
+        timestamp = 0
+        end_address = min(end_address, len(buffer))
+        position = start_address
+        while position < end_address:
+            if position + record_header.size > len(buffer):
+                # Truncated record header.
+                break
+            ts_sec, ts_frac, incl_len, _ = record_header.unpack_from(buffer, position)
+            timestamp = max(ts_sec + ts_frac / divisor, timestamp)
+            position += record_header.size + incl_len
+
+    return timestamp
+
+
+# The CAN frames in the asc-files start after this line.
+ASC_DATA_MARKER = b'// version 8.1.0'
+# Size of the blocks in which the lines of the asc-files are counted.
+ASC_BLOCK_SIZE = 1024 * 1024
+
+
+RECORD_REGEX = re.compile(r"(?P<ts>[:\.\d]+)\s+@ Record\s+(?P<sensor>[^\(\s]+)\((?P<output>\S+)\[(?P<output_info>[^\]]+)\]\).*")
+DATA_REGEX = re.compile(r"(?P<ts>[:\.\d]+)\s+\/\s+(?P<sensor>[^#\s]+)#\d+.*")
+
+
+class RecLineType(enum.Enum):
+    RECORD = enum.auto()
+    DATA = enum.auto()
+
+
+class RecSensorInfo():
+    """ Summary of the samples of a single sensor in the rec-file. """
+    __slots__ = ('count', 'frame_size', 'first_timestamp', '_last_timestamps')
+
+    def __init__(self):
+        self.count = 0
+        self.frame_size = None
+        self.first_timestamp = None
+        self._last_timestamps = collections.deque(maxlen=2)
+
+    def add_sample(self, timestamp: str):
+        if not self.count:
+            self.first_timestamp = timestamp
+        self.count += 1
+        self._last_timestamps.append(timestamp)
+
+    def get_timestamp(self, index: int) -> str:
+        """
+        Raises IndexError if the sample is neither the first nor one of the
+        last two.
+        """
+        if index == 0 and self.count:
+            return self.first_timestamp
+        offset = index - self.count
+        if not -len(self._last_timestamps) <= offset < 0:
+            raise IndexError(index)
+        return self._last_timestamps[offset]
+
+    def to_state(self) -> dict:
+        return {
+            'count': self.count,
+            'frame_size': self.frame_size,
+            'first_timestamp': self.first_timestamp,
+            'last_timestamps': list(self._last_timestamps),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict):
+        info = cls()
+        info.count = state['count']
+        info.frame_size = state['frame_size']
+        info.first_timestamp = state['first_timestamp']
+        info._last_timestamps.extend(state['last_timestamps'])
+        return info
+
+
+class ValidationState():
+    """
+    Parser state of a resumable check, persisted in a directory so that a
+    later check continues where the previous one stopped while the files of
+    the recording are still growing.
+
+    The directory holds a json-file with the offsets and counters and one
+    file per sensor with the offsets (int64) of every `LINE_OFFSET_STRIDE`th
+    of its sample lines in the rec-file, from which any sample is found
+    without searching the whole rec-file.
+    """
+    VERSION = 2
+    FILE_NAME = 'state.json'
+    TMP_FILE_NAME = 'state.tmp'
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        # State of the rec-file, empty if it has to be parsed from the start.
+        self.rec = {}
+        # State of the idx- or asc-file of each sensor.
+        self.sensors = {}
+
+    def load(self, rec_file: Path):
+        """
+        Load the state, discarding it if the rec-file was replaced.
+
+        Raises OSError if the directory can't be created or cleared.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            state = json.loads((self.directory / self.FILE_NAME).read_text())
+            rec_stat = rec_file.stat()
+            valid = (
+                state['version'] == self.VERSION
+                and state['rec']['inode'] == rec_stat.st_ino
+                and state['rec']['offset'] <= rec_stat.st_size
+            )
+            if valid:
+                # Drop offsets written after the state was saved.
+                for name, info in state['rec']['sensors'].items():
+                    num_offsets = -(-info['count'] // LINE_OFFSET_STRIDE)
+                    os.truncate(
+                        self.get_lines_file(name),
+                        num_offsets * LINE_ENTRY_SIZE,
+                    )
+        except (OSError, ValueError, KeyError, TypeError):
+            valid = False
+
+        if valid:
+            self.rec = state['rec']
+            self.sensors = state['sensors']
+        else:
+            self.reset()
+
+    @classmethod
+    def is_state_directory(cls, directory: Path) -> bool:
+        """ Whether the directory only holds the files of a saved state. """
+        names = [path.name for path in directory.iterdir()]
+        return cls.FILE_NAME in names and all(
+            name in (cls.FILE_NAME, cls.TMP_FILE_NAME) or name.endswith('.lines')
+            for name in names
+        )
+
+    def reset(self):
+        self.rec = {}
+        self.sensors = {}
+        for lines_file in self.directory.glob('*.lines'):
+            lines_file.unlink()
+
+    def save(self):
+        state_file = self.directory / self.FILE_NAME
+        tmp_file = self.directory / self.TMP_FILE_NAME
+        tmp_file.write_text(json.dumps({
+            'version': self.VERSION,
+            'rec': self.rec,
+            'sensors': self.sensors,
+        }))
+        tmp_file.replace(state_file)
+
+    def get_lines_file(self, sensor_name: str) -> Path:
+        return self.directory / f'{sensor_name}.lines'
+
+    def get_file_state(self, sensor_name: str, files, **initial) -> dict:
+        """
+        Return the state of a sensor belonging to the given files. It's reset
+        to `initial` if any of them was replaced or shrunk since.
+        """
+        identities = []
+        for file in files:
+            file_stat = file.stat()
+            identities.append([file.name, file_stat.st_ino, file_stat.st_size])
+
+        state = self.sensors.get(sensor_name)
+        unchanged = state is not None and len(state['files']) == len(identities) and all(
+            old[:2] == new[:2] and old[2] <= new[2]
+            for old, new in zip(state['files'], identities)
+        )
+        if not unchanged:
+            state = dict(initial)
+        state['files'] = identities
+        self.sensors[sensor_name] = state
+        return state
+
+
+def remove_stale_states(root: Path, max_age: float, logger=None):
+    """
+    Remove the state directories (see `ValidationState`) under `root` that
+    weren't saved for `max_age` seconds. Directories holding anything but a
+    state weren't created by a check and are left alone.
+    """
+    logger = logger or logging.getLogger()
+    limit = time.time() - max_age
+    try:
+        directories = [path for path in Path(root).iterdir() if path.is_dir()]
+    except OSError:
+        return
+
+    for directory in directories:
+        state_file = directory / ValidationState.FILE_NAME
+        try:
+            if not ValidationState.is_state_directory(directory):
+                continue
+            if state_file.stat().st_mtime < limit:
+                shutil.rmtree(directory)
+                logger.debug(f"Removed the stale check state '{directory}'.")
+        except OSError as exc:
+            logger.warning(f"Failed to remove the check state '{directory}': {exc}")
+
+
+class _LinesWriter():
+    """ Buffered appending of sample line offsets to the files of a state. """
+    BUFFER_ENTRIES = 64 * 1024
+
+    def __init__(self, state: ValidationState):
+        self._state = state
+        self._buffers = {}
+
+    def append(self, sensor_name: str, line_offset: int):
+        try:
+            buffer = self._buffers[sensor_name]
+        except KeyError:
+            buffer = self._buffers[sensor_name] = array.array('q')
+        buffer.append(line_offset)
+        if len(buffer) >= self.BUFFER_ENTRIES:
+            self._flush(sensor_name, buffer)
+
+    def close(self):
+        for sensor_name, buffer in self._buffers.items():
+            self._flush(sensor_name, buffer)
+
+    def _flush(self, sensor_name, buffer):
+        if sys.byteorder != 'little':
+            buffer.byteswap()
+        with open(self._state.get_lines_file(sensor_name), 'ab') as file:
+            buffer.tofile(file)
+        del buffer[:]
 
 
 class IdxRecCompare():
     """Compare the file size in s8(pcap) and idx for the same sensor, output result."""
 
-    def __init__(self, data, sensors, logger) -> None:
+    def __init__(self, data, sensors, logger, workers=1, cache_path=None, state_dir=None) -> None:
         """_summary_
 
         Args:
             data (PathLike): Path of the Record data.
             sensors (_dict_): The sensor names of the current replay job passed in as a dictionary.
             logger (Logger): instance of logger object for reporting log messages.
+            workers (int): number of processes used to check the sensors in
+                           parallel. A value of 1 checks them sequentially.
+            cache_path (PathLike): database storing the results of previous
+                                   checks. No cache is used if None.
+            state_dir (PathLike): directory for the parser state of a
+                                  resumable check of a growing recording.
+                                  The data is checked from scratch if None.
         """
         self.logger = logger
+        self.workers = workers
+        self.cache_path = cache_path
+        self.state = None if state_dir is None else ValidationState(state_dir)
         self.sensors = sensors
         self.data_path = Path(data)
         self.ts_sensor = {
@@ -32,6 +424,10 @@ class IdxRecCompare():
             for sensor in itertools.chain.from_iterable(sensors.values())
         }
         self.sensor_data = {}
+        # Time ranges (in microseconds) of consecutive replayable frames.
+        self.valid_ranges = {}
+        # The same as frame numbers, before they are converted.
+        self._frame_ranges = {}
 
     def data_check(self):
         """
@@ -40,7 +436,6 @@ class IdxRecCompare():
                                    corresponding end time and the shortest
                                    end time among them
         """
-        self.read_rec()
         regex = re.compile(r'@(.+)')
         self._directory = self.data_path.parent
         ts_match = regex.search(self.data_path.stem)
@@ -48,13 +443,48 @@ class IdxRecCompare():
             raise ValueError(f'Failed to extract the timestamp from filename {self.data_path}.')
         self._timestamp = ts_match.group(1)
 
-        for key, value in self.sensors.items():
-            if key in ['camera', 'lidar']:
-                self.read_data_file(value)  # Lidar/Camera
-            elif key == 'can':
-                self.check_can_sensors(value)  # CAN
-            else:
-                self.logger.error(f"Unexpected key '{key}'. Ignoring.")
+        if self.cache_path is None:
+            return self._data_check()
+
+        cache = ResultCache(self.cache_path, self.logger)
+        cache_key = cache.make_key(self.sensors, self._input_files())
+        cached = cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Using the cached analysis of '{self.data_path}'.")
+            self.ts_sensor, end_time, self.valid_ranges = cached
+            return self.ts_sensor, end_time
+
+        result = self._data_check()
+        cache.put(cache_key, (*result, self.valid_ranges))
+        return result
+
+    def _data_check(self):
+        if self.state is not None:
+            try:
+                self.state.load(self.data_path)
+            except OSError as exc:
+                self.logger.warning(
+                    f"Failed to load the check state '{self.state.directory}',"
+                    f" checking from scratch: {exc}"
+                )
+                self.state = None
+
+        self.read_rec()
+
+        if self.workers > 1:
+            self._check_sensors_parallel()
+        else:
+            for key, value in self.sensors.items():
+                self._check_sensors(key, value)
+        self._resolve_sample_times()
+
+        if self.state is not None:
+            try:
+                self.state.save()
+            except OSError as exc:
+                self.logger.warning(
+                    f"Failed to save the check state '{self.state.directory}': {exc}"
+                )
 
         if not self.ts_sensor:
             # No data available.
@@ -64,6 +494,51 @@ class IdxRecCompare():
         end_time = min(ts_all)
         return (self.ts_sensor, end_time)
 
+    def _check_sensors(self, key, sensor_names):
+        if key in ['camera', 'lidar']:
+            self.read_data_file(sensor_names)  # Lidar/Camera
+        elif key == 'can':
+            self.check_can_sensors(sensor_names)  # CAN
+        else:
+            self.logger.error(f"Unexpected key '{key}'. Ignoring.")
+
+    def _check_sensors_parallel(self):
+        """
+        Check every sensor in its own task of a process pool.
+
+        The results and the log messages of the workers are merged in the
+        order of the sensors, independent of the order of completion.
+        """
+        tasks = []
+        for key, value in self.sensors.items():
+            if key not in ('camera', 'lidar', 'can'):
+                self.logger.error(f"Unexpected key '{key}'. Ignoring.")
+                continue
+            tasks.extend((key, sensor_name) for sensor_name in value)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            self.workers,
+            mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+        ) as executor:
+            futures = [
+                executor.submit(_check_sensor_worker, self, key, sensor_name)
+                for key, sensor_name in tasks
+            ]
+            for future in futures:
+                ts_sensor, frame_ranges, sensor_states, records = future.result()
+                for level, msg in records:
+                    self.logger.log(level, msg)
+                self.ts_sensor.update(ts_sensor)
+                self._frame_ranges.update(frame_ranges)
+                if self.state is not None:
+                    self.state.sensors.update(sensor_states)
+
+    def __getstate__(self):
+        # Loggers can't be relied on in the worker processes.
+        state = self.__dict__.copy()
+        state['logger'] = None
+        return state
+
     def read_data_file(self, sensor_names: list):
         """Read all record data for comparison"""
 
@@ -72,7 +547,7 @@ class IdxRecCompare():
             index_file = self._directory.joinpath(f"{sensor_name}@{self._timestamp}.idx")
 
             try:
-                sensor_name_data, _, rec_sensor_num = self.sensor_data[sensor_name]
+                rec_sensor_num = self.sensor_data[sensor_name].count
             except KeyError:
                 self.logger.warning(f"Sensor '{sensor_name}' doesn't exist in the rec-file.")
                 continue
@@ -85,12 +560,7 @@ class IdxRecCompare():
                 self.logger.error(f"The valid frames of rec file '{self.data_path}' is less than 2, it can't be repaly, please check the file!")
                 continue
 
-            if sensor_name == 'FrontLidar01':
-                filetype = 'pcap'
-            else:
-                filetype = 's8'
-
-            data_file = self._directory.joinpath(f"{sensor_name}@{self._timestamp}.{filetype}")
+            data_file = self._get_data_file(sensor_name)
             if not data_file.exists():
                 self.logger.warning(f"The file '{data_file}' does not exist!")
                 continue
@@ -98,9 +568,116 @@ class IdxRecCompare():
             data_offset, ts_end = self.idx_calculate(data_file, index_file, rec_sensor_num)
 
             if data_offset > 0:
-                if ts_end is None:
-                    ts_end = self._convert_timestamp(sensor_name_data[data_offset - 2])
+                # A missing end time is looked up in `_resolve_sample_times`.
                 self.ts_sensor[sensor_name] = ts_end, data_offset - 1
+                self._frame_ranges[sensor_name] = self._get_valid_frame_ranges(
+                    sensor_name, data_file, index_file, rec_sensor_num,
+                )
+
+    def _resolve_sample_times(self):
+        """
+        Convert the frames of the end of the streams and of the valid frame
+        ranges to times, searching the rec-file at most once for all sensors.
+        Without invalid frames in the middle of a stream, all of them are
+        known from `read_rec`.
+        """
+        requests = collections.defaultdict(set)
+        for sensor_name, (ts_end, num_frames) in self.ts_sensor.items():
+            if ts_end is None:
+                requests[sensor_name].add(self._normalize_index(sensor_name, num_frames - 1))
+        for sensor_name, frame_ranges in self._frame_ranges.items():
+            # Frame n corresponds to the sample n - 1 in the rec-file.
+            requests[sensor_name].update(
+                frame - 1 for frame_range in frame_ranges for frame in frame_range
+            )
+
+        times = self.get_sample_times(requests)
+
+        for sensor_name, (ts_end, num_frames) in self.ts_sensor.items():
+            if ts_end is None:
+                index = self._normalize_index(sensor_name, num_frames - 1)
+                self.ts_sensor[sensor_name] = times[sensor_name][index], num_frames
+        for sensor_name, frame_ranges in self._frame_ranges.items():
+            self.valid_ranges[sensor_name] = [
+                (times[sensor_name][first - 1], times[sensor_name][last - 1])
+                for first, last in frame_ranges
+            ]
+
+    def _get_valid_frame_ranges(self, sensor_name, data_file: Path, index_file: Path, rec_sensor_num: int):
+        """
+        Check every frame of a sensor and return the ranges of the sequences
+        of valid frames.
+        """
+        if data_file.suffix == '.s8':
+            max_frame_size = self.sensor_data[sensor_name].frame_size
+        else:
+            # Frames in pcap-files contain the headers of the packets too.
+            max_frame_size = None
+
+        # In a resumable check the frames validated before are skipped.
+        frame_state = {'validated': 0, 'invalid': []}
+        if self.state is not None:
+            frame_state = self.state.get_file_state(
+                sensor_name, (index_file, data_file), **frame_state,
+            )
+
+        file_size = data_file.stat().st_size
+        with open_index_offsets(index_file) as offsets:
+            num_frames = min(len(offsets) - 1, rec_sensor_num)
+            first_frame = min(frame_state['validated'], num_frames) + 1
+            invalid_frames = [
+                frame for frame in frame_state['invalid'] if frame < first_frame
+            ]
+            invalid_frames.extend(find_invalid_frames(
+                offsets,
+                num_frames,
+                file_size,
+                max_frame_size,
+                first_frame,
+            ))
+            # Frames after the first one beyond the end of the file can
+            # still change while the files are growing.
+            validated = get_last_complete_frame(
+                offsets, num_frames, file_size, first_frame,
+            )
+        frame_state['validated'] = validated
+        frame_state['invalid'] = [
+            frame for frame in invalid_frames if frame <= validated
+        ]
+
+        frame_ranges = get_valid_frame_ranges(invalid_frames, num_frames)
+
+        # Ignore the truncated end, it's already reported.
+        holes = [
+            frame for frame in invalid_frames
+            if frame_ranges and frame < frame_ranges[-1][1]
+        ]
+        if holes:
+            self.logger.warning(
+                f"'{data_file}' contains {len(holes)} invalid frames before"
+                f" its last valid frame, first at frame {holes[0]}!"
+            )
+
+        return frame_ranges
+
+    def _get_data_file(self, sensor_name):
+        if sensor_name == 'FrontLidar01':
+            filetype = 'pcap'
+        else:
+            filetype = 's8'
+        return self._directory.joinpath(f"{sensor_name}@{self._timestamp}.{filetype}")
+
+    def _input_files(self):
+        """ Return all the files the result of the check depends on. """
+        files = [self.data_path]
+        for key, value in self.sensors.items():
+            for sensor_name in value:
+                if key == 'can':
+                    files.append(self._directory.joinpath(f"{sensor_name}@{self._timestamp}.asc"))
+                else:
+                    files.append(self._directory.joinpath(f"{sensor_name}@{self._timestamp}.idx"))
+                    files.append(self._get_data_file(sensor_name))
+        return files
 
     def _convert_timestamp(self, timestamp):
         ts = timestamp.split(':')
@@ -111,49 +688,227 @@ class IdxRecCompare():
         return round(us)
 
     def read_rec(self):
-        """ Parse the rec-file """
-        record_regex = re.compile(r"(?P<ts>[:\.\d]+)\s+@ Record\s+(?P<sensor>[^\(\s]+)\((?P<output>\S+)\[(?P<output_info>[^\]]+)\]\).*")
-        data_regex = re.compile(r"(?P<ts>[:\.\d]+)\s+\/\s+(?P<sensor>[^#\s]+)#\d+.*")
+        """
+        Parse the rec-file.
+
+        Only the number of samples, the timestamps of the first and the last
+        two samples and the frame size are kept per sensor. Timestamps of
+        other samples are looked up on demand using `get_rec_timestamps`.
 
-        with open(self.data_path, 'r', encoding='utf-8') as temp_f:
+        In a resumable check parsing continues at the offset of the previous
+        check and the offsets of the sample lines are appended to the state.
+        """
+        frame_dict = {}
+        offset = 0
+        lines_writer = None
+        if self.state is not None:
+            lines_writer = _LinesWriter(self.state)
+            if self.state.rec:
+                offset = self.state.rec['offset']
+                frame_dict = self.state.rec['frame_sizes']
+                self.sensor_data = {
+                    name: RecSensorInfo.from_state(info)
+                    for name, info in self.state.rec['sensors'].items()
+                }
+
+        rec_lines = self._iter_rec_data(
+            offset,
+            complete_lines_only=self.state is not None,
+        )
+        for line_type, m, line_offset in rec_lines:
+            sensor_name = m.group('sensor')
+            if line_type is RecLineType.RECORD:
+                output_info = m.group('output_info')
+                frame_dict[sensor_name] = int(output_info.split(',')[-1])
+                continue
+
+            try:
+                info = self.sensor_data[sensor_name]
+            except KeyError:
+                info = self.sensor_data[sensor_name] = RecSensorInfo()
+            if lines_writer is not None and info.count % LINE_OFFSET_STRIDE == 0:
+                lines_writer.append(sensor_name, line_offset)
+            info.add_sample(m.group('ts'))
+
+        # post process the extracted data.
+        for type_sensor, info in self.sensor_data.items():
+            if self.state is None:
+                info.frame_size = frame_dict[type_sensor]
+            else:
+                # Might still be missing in a recording in progress.
+                info.frame_size = frame_dict.get(type_sensor)
+
+        if self.state is not None:
+            lines_writer.close()
+            self.state.rec = {
+                'inode': self.data_path.stat().st_ino,
+                'offset': self._rec_offset,
+                'frame_sizes': frame_dict,
+                'sensors': {
+                    name: info.to_state()
+                    for name, info in self.sensor_data.items()
+                },
+            }
+
+    def _normalize_index(self, sensor_name: str, index: int) -> int:
+        if index < 0:
+            # Same semantics as indexing a list of all the samples.
+            index += self.sensor_data[sensor_name].count
+        return index
+
+    def get_sample_time(self, sensor_name: str, index: int) -> int:
+        """
+        Return the time (in microseconds) of the sample with the given index
+        of a sensor in the rec-file.
+        """
+        index = self._normalize_index(sensor_name, index)
+        try:
+            return self.get_sample_times({sensor_name: (index,)})[sensor_name][index]
+        except KeyError:
+            raise IndexError(index) from None
+
+    def get_rec_timestamps(self, requests: dict) -> dict:
+        """
+        Return the timestamps of samples in the rec-file, reading it at most
+        once for all of them.
+
+        Args:
+            requests (dict): the sample indices per sensor name.
+
+        Return:
+            dict: the timestamps per sample index per sensor name.
+
+        The first and the last two samples are answered from memory, anything
+        else requires streaming through the rec-file again.
+        """
+        timestamps = {}
+        missing = {}
+        for sensor_name, indices in requests.items():
+            info = self.sensor_data[sensor_name]
+            found = timestamps[sensor_name] = {}
+            for index in indices:
+                try:
+                    found[index] = info.get_timestamp(index)
+                except IndexError:
+                    if 0 <= index < info.count:
+                        missing.setdefault(sensor_name, set()).add(index)
+
+        if not missing:
+            return timestamps
+
+        self.logger.debug(
+            f"Searching the rec-file for samples of {sorted(missing)}."
+        )
+        remaining = sum(map(len, missing.values()))
+        counts = dict.fromkeys(missing, 0)
+        for line_type, m, _ in self._iter_rec_data():
+            if line_type is not RecLineType.DATA:
+                continue
+            sensor_name = m.group('sensor')
+            try:
+                count = counts[sensor_name]
+            except KeyError:
+                continue
+            counts[sensor_name] = count + 1
+            if count in missing[sensor_name]:
+                timestamps[sensor_name][count] = m.group('ts')
+                remaining -= 1
+                if not remaining:
+                    break
+        return timestamps
+
+    def get_sample_times(self, requests: dict) -> dict:
+        """
+        Return the times (in microseconds) of samples in the rec-file, see
+        `get_rec_timestamps`.
+        """
+        if self.state is None:
+            return {
+                sensor_name: {
+                    index: self._convert_timestamp(timestamp)
+                    for index, timestamp in timestamps.items()
+                }
+                for sensor_name, timestamps in self.get_rec_timestamps(requests).items()
+            }
+
+        # Start searching at the closest sample known by the state.
+        times = {}
+        for sensor_name, indices in requests.items():
+            info = self.sensor_data[sensor_name]
+            found = times[sensor_name] = {}
+            missing = []
+            for index in sorted(indices):
+                try:
+                    found[index] = self._convert_timestamp(info.get_timestamp(index))
+                except IndexError:
+                    if 0 <= index < info.count:
+                        missing.append(index)
+            if not missing:
+                continue
+
+            lines_file = self.state.get_lines_file(sensor_name)
+            with open_index_offsets(lines_file) as line_offsets:
+                for index in missing:
+                    checkpoint = index // LINE_OFFSET_STRIDE
+                    sample = checkpoint * LINE_OFFSET_STRIDE
+                    for line_type, m, _ in self._iter_rec_data(line_offsets[checkpoint]):
+                        if line_type is RecLineType.DATA and m.group('sensor') == sensor_name:
+                            if sample == index:
+                                found[index] = self._convert_timestamp(m.group('ts'))
+                                break
+                            sample += 1
+        return times
+
+    def _iter_rec_data(self, offset=0, complete_lines_only=False):
+        """
+        Yield the matched record and sample lines of the data section,
+        starting at the given byte offset within the data section, together
+        with the offset of the line.
+
+        After the iteration finished, `_rec_offset` holds the offset behind
+        the last parsed line of the data section.
+        """
+        # Bind the methods locally, this loop runs once per sample.
+        record_match = RECORD_REGEX.match
+        data_match = DATA_REGEX.match
+
+        self._rec_offset = offset
+        with open(self.data_path, 'rb') as temp_f:
             # Create an iterator for lines in the rec file.
             data_file_iter = iter(temp_f)
 
-            # Go to the data section.
-            for line in data_file_iter:
-                if line.strip() == "[Data]":
+            if offset:
+                temp_f.seek(offset)
+            else:
+                # Go to the data section.
+                for line in data_file_iter:
+                    offset += len(line)
+                    if line.strip() == b"[Data]":
+                        break
+                else:
+                    return
+
+            for raw_line in data_file_iter:
+                if complete_lines_only and not raw_line.endswith(b'\n'):
+                    # Still being written.
                     break
+                line_offset = offset
+                offset += len(raw_line)
+                line = raw_line.decode('utf-8')
+
+                # Cheap substring checks first, the regexes only confirm.
+                if '@ Record' in line:
+                    m = record_match(line)
+                    if m:
+                        yield RecLineType.RECORD, m, line_offset
+                        continue
 
-            # Initialize the data structures.
-            sensor_data_dict = {}
-            frame_dict = {}
-
-            # Extract the frame sizes from the record lines.
-            for line in data_file_iter:
-                # Check if it's a record line.
-                m = record_regex.match(line)
-                if m:
-                    output_info = m.group('output_info')
-                    frame_size = int(output_info.split(',')[-1])
-                    sensor_name = m.group('sensor')
-                    frame_dict[sensor_name] = frame_size
-                    continue
-
-                # Check if it's a sample line.
-                m = data_regex.match(line)
-                if m:
-                    ts = m.group('ts')
-                    sensor_name = m.group('sensor')
-                    try:
-                        sensor_data_dict[sensor_name].append(ts)
-                    except KeyError:
-                        sensor_data_dict[sensor_name] = [ts]
-
-            # post process the extracted data and save them in a dictionary.
-            for type_sensor, data in sensor_data_dict.items():
-                # sensor frame data in rec
-                rec_sensor_num = len(data)
-                self.sensor_data[type_sensor] = (data, frame_dict[type_sensor], rec_sensor_num)
+                if '/' in line:
+                    m = data_match(line)
+                    if m:
+                        yield RecLineType.DATA, m, line_offset
+
+            self._rec_offset = offset
 
     def check_can_sensors(self, sensor_name: list):
         """ Analyze and compare the asc and rec files of CAN """
@@ -165,10 +920,15 @@ class IdxRecCompare():
                 self.logger.warning(f"The asc file '{asc_file}' does not exist!")
                 continue
 
-            asc_frame_count = self.get_asc_frame_count(asc_file)
+            asc_state = None
+            if self.state is not None:
+                asc_state = self.state.get_file_state(
+                    sensor_can_name, (asc_file,), offset=None, count=0,
+                )
+            asc_frame_count = self.get_asc_frame_count(asc_file, asc_state)
 
             try:
-                sensor_name_data, _, rec_sensor_num = self.sensor_data[sensor_can_name]
+                rec_sensor_num = self.sensor_data[sensor_can_name].count
             except KeyError:
                 self.logger.warning(f"Sensor '{sensor_can_name}' doesn't exist in the rec-file.")
                 continue
@@ -184,26 +944,70 @@ class IdxRecCompare():
             # num_frames = min(rec_sensor_num, asc_frame_count)
             num_frames = rec_sensor_num
 
-            ts_end = self._convert_timestamp(sensor_name_data[num_frames - 2])
+            ts_end = self.get_sample_time(sensor_can_name, num_frames - 2)
             self.ts_sensor[sensor_can_name] = ts_end, num_frames - 1
 
-    def get_asc_frame_count(self, asc_file: Path):
-        """ Get the number of CAN frames in an ASC file """
-        with open(asc_file, 'r', encoding='utf-8') as temp_f:
-            file_iterator = iter(temp_f)
+    def get_asc_frame_count(self, asc_file: Path, asc_state=None):
+        """
+        Get the number of CAN frames in an ASC file.
 
-            # Find the the beginning of the data.
-            for line in file_iterator:
-                if line == "// version 8.1.0\n":
-                    break
+        The file is counted as raw bytes through a memory map, block by
+        block, instead of being decoded and iterated line by line.
+
+        A resumable check passes the dictionary `asc_state`, in which the
+        offset and count of the complete lines are kept for continuing the
+        count next time.
+        """
+        if asc_state is None:
+            asc_state = {}
+
+        file_size = asc_file.stat().st_size
+        if file_size == 0:
+            return 0
+
+        with open(asc_file, 'rb') as temp_f, \
+                mmap.mmap(temp_f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if asc_state.get('offset') is not None:
+                data_start = asc_state['offset']
+                asc_frame_count = asc_state['count']
+            else:
+                # Find the the beginning of the data.
+                data_start = self._find_asc_data_start(buffer)
+                if data_start < 0:
+                    return 0
+                asc_frame_count = 0
 
             # Count the lines afterwards.
-            asc_frame_count = 0
-            for line in file_iterator:
+            for block_start in range(data_start, file_size, ASC_BLOCK_SIZE):
+                block = buffer[block_start:block_start + ASC_BLOCK_SIZE]
+                asc_frame_count += block.count(b'\n')
+
+            asc_state['offset'] = buffer.rfind(b'\n', data_start) + 1 or data_start
+            asc_state['count'] = asc_frame_count
+
+            # The last line might not be terminated.
+            if file_size > data_start and buffer[file_size - 1] != ord('\n'):
                 asc_frame_count += 1
 
         return asc_frame_count
 
+    @staticmethod
+    def _find_asc_data_start(buffer):
+        """ Return the offset after the version line or -1 if it's missing. """
+        position = 0
+        while True:
+            position = buffer.find(ASC_DATA_MARKER, position)
+            if position < 0:
+                return -1
+
+            line_end = position + len(ASC_DATA_MARKER)
+            at_line_start = position == 0 or buffer[position - 1] == ord('\n')
+            if at_line_start:
+                for newline in (b'\n', b'\r\n'):
+                    if buffer[line_end:line_end + len(newline)] == newline:
+                        return line_end + len(newline)
+            position = line_end
+
     def idx_calculate(self, sensor_file: Path, index_file: Path, rec_sensor_num: int):
         """ Calculate the number of valid frames in the idx file for comparison """
         sensor_file_size = sensor_file.stat().st_size
@@ -233,14 +1037,7 @@ class IdxRecCompare():
         """
         Find the highest timestamp in that packet-group in the pcap file.
         """
-        with open(pcap_file, 'rb') as f:
-            pcap = dpkt.pcap.Reader(f)
-            timestamp = 0
-            pcap_i = iter(pcap)
-            f.seek(start_address)
-            while f.tell() < end_address:
-                this_timestamp, _ = next(pcap_i)
-                timestamp = max(this_timestamp, timestamp)
+        timestamp = get_pcap_max_timestamp(pcap_file, start_address, end_address)
 
         # Convert form seconds to microseconds.
         timestamp *= 1000 * 1000
@@ -251,26 +1048,190 @@ class IdxRecCompare():
         Return the frame information from the index file that corresponds to
         the last valid frame in the sensor data file (based on its size).
 
+        The end addresses in the index file are written sequentially by the
+        recorder and are therefore expected to be monotonic, which allows a
+        binary search instead of walking the file backwards. The offsets
+        around the result are checked to be monotonic, otherwise the file is
+        walked backwards as the result of the binary search could differ.
+        Non-monotonic offsets further away are reported as invalid frames by
+        find_invalid_frames.
+
         Return:
             tuple(int, int, int): the frame index, its start address, its end address.
         """
-        with open(index_file, 'rb') as file:
-            rounded_size = index_file.stat().st_size // 8
-            start_index = min(rounded_size - 1, maximum_index)
-            for idx in range(start_index, 0, -1):
-                file.seek(idx * 8)
-                bytes_data = file.read(8)
-                end_address = struct.unpack('q', bytes_data)[0]
-                if end_address <= file_size:
-                    break
+        with open_index_offsets(index_file) as offsets:
+            start_index = min(len(offsets) - 1, maximum_index)
+            if start_index < 1:
+                self.logger.error('No valid frame found')
+                return -1, 0, 0
+
+            if offsets[start_index] <= file_size:
+                # Complete file, the walk would stop at the first entry.
+                idx = start_index
             else:
+                idx = bisect.bisect_right(offsets, file_size, 1, start_index + 1) - 1
+                if not self._is_monotonic(
+                        offsets,
+                        max(1, idx - MONOTONIC_CHECK_WINDOW),
+                        min(start_index, idx + MONOTONIC_CHECK_WINDOW) + 1):
+                    self.logger.debug(f'Non-monotonic index file "{index_file}".')
+                    idx = self._scan_last_frame(offsets, file_size, start_index)
+
+            if idx < 1:
                 self.logger.error('No valid frame found')
                 return -1, 0, 0
 
-            file.seek((idx - 1)*8)
-            bytes_data = file.read(8)
-            start_address = struct.unpack('q', bytes_data)[0]
-        return idx, start_address, end_address
+            return idx, offsets[idx - 1], offsets[idx]
+
+    @staticmethod
+    def _is_monotonic(offsets, start, end):
+        """ Return whether offsets[start:end] never decrease. """
+        return all(map(operator.le, offsets[start:end - 1], offsets[start + 1:end]))
+
+    @staticmethod
+    def _scan_last_frame(offsets, file_size, start_index):
+        """ Walk the index backwards to the last frame fitting in the file. """
+        for idx in range(start_index, 0, -1):
+            if offsets[idx] <= file_size:
+                return idx
+        return -1
+
+
+class ResultCache():
+    """
+    Persistent storage of the results of `IdxRecCompare.data_check`.
+
+    Results are keyed by the identity (path, size, modification time and
+    inode) of every input file, so any change to the data invalidates them.
+    Failing to access the database is never fatal, it only disables caching.
+    Results not used for `RESULT_CACHE_MAX_AGE` are evicted, as well as the
+    least recently used ones beyond `RESULT_CACHE_MAX_ENTRIES`.
+    """
+    VERSION = 3
+
+    def __init__(self, path, logger):
+        self.path = Path(path)
+        self.logger = logger
+
+    @classmethod
+    def make_key(cls, sensors, files):
+        identities = []
+        for file in files:
+            try:
+                stat = os.stat(file)
+            except OSError:
+                identity = None
+            else:
+                identity = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            identities.append((str(file), identity))
+
+        serialized = json.dumps([cls.VERSION, sensors, identities])
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        columns = [
+            row[1] for row in connection.execute('PRAGMA table_info(results)')
+        ]
+        if columns and 'used' not in columns:
+            # Written by a version without eviction, the results are outdated
+            # anyway.
+            with connection:
+                connection.execute('DROP TABLE results')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(key TEXT PRIMARY KEY, result TEXT, used REAL)'
+        )
+        return connection
+
+    def get(self, key):
+        try:
+            with contextlib.closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    'SELECT result FROM results WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        'UPDATE results SET used = ? WHERE key = ?',
+                        (time.time(), key),
+                    )
+        except (OSError, sqlite3.Error) as exc:
+            self.logger.warning(f"Failed to read the cache '{self.path}': {exc}")
+            return None
+
+        if row is None:
+            return None
+
+        ts_sensor, end_time, valid_ranges = json.loads(row[0])
+        return (
+            {name: tuple(value) for name, value in ts_sensor.items()},
+            end_time,
+            {
+                name: [tuple(time_range) for time_range in time_ranges]
+                for name, time_ranges in valid_ranges.items()
+            },
+        )
+
+    def put(self, key, result):
+        try:
+            with contextlib.closing(self._connect()) as connection, connection:
+                now = time.time()
+                connection.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?)',
+                    (key, json.dumps(result), now),
+                )
+                connection.execute(
+                    'DELETE FROM results WHERE used < ?',
+                    (now - RESULT_CACHE_MAX_AGE,),
+                )
+                connection.execute(
+                    'DELETE FROM results WHERE key NOT IN '
+                    '(SELECT key FROM results ORDER BY used DESC LIMIT ?)',
+                    (RESULT_CACHE_MAX_ENTRIES,),
+                )
+        except (OSError, sqlite3.Error) as exc:
+            self.logger.warning(f"Failed to write the cache '{self.path}': {exc}")
+
+
+class _BufferedLogger():
+    """ Collects log messages of a worker process for the parent process. """
+
+    def __init__(self):
+        self.records = []
+
+    def log(self, level, msg):
+        self.records.append((level, msg))
+
+    def debug(self, msg):
+        self.log(logging.DEBUG, msg)
+
+    def info(self, msg):
+        self.log(logging.INFO, msg)
+
+    def warning(self, msg):
+        self.log(logging.WARNING, msg)
+
+    def error(self, msg):
+        self.log(logging.ERROR, msg)
+
+
+def _check_sensor_worker(compare_obj, key, sensor_name):
+    """ Process pool task: check a single sensor of the given instance. """
+    compare_obj.logger = _BufferedLogger()
+    compare_obj.ts_sensor = {}
+    compare_obj._frame_ranges = {}
+    compare_obj._check_sensors(key, [sensor_name])
+
+    sensor_states = {}
+    if compare_obj.state is not None and sensor_name in compare_obj.state.sensors:
+        sensor_states[sensor_name] = compare_obj.state.sensors[sensor_name]
+    return (
+        compare_obj.ts_sensor,
+        compare_obj._frame_ranges,
+        sensor_states,
+        compare_obj.logger.records,
+    )
 
 
 if __name__ == "__main__":
@@ -300,6 +1261,48 @@ if __name__ == "__main__":
         help='camera sensor name',
         default=[],
     )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='number of processes checking the sensors in parallel',
+        default=1,
+    )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        help='database for caching the results of unchanged data',
+        default=None,
+    )
+    parser.add_argument(
+        '--state',
+        type=Path,
+        help='directory for resuming the check of a growing recording',
+        default=None,
+    )
+    parser.add_argument(
+        '--state-max-age',
+        type=float,
+        metavar='SECONDS',
+        help='remove the other states next to --state not saved for that long',
+        default=None,
+    )
+    parser.add_argument(
+        '--follow',
+        type=float,
+        metavar='INTERVAL',
+        help='repeat the resumable check every INTERVAL seconds until the '
+             'files stop growing',
+        default=None,
+    )
+    parser.add_argument(
+        '--max-idle',
+        type=int,
+        metavar='ROUNDS',
+        help='with --follow, give up on an invalid recording after that many '
+             'rounds without changes',
+        default=3,
+    )
     parser.add_argument(
         '-v',
         '--verbose',
@@ -323,12 +1326,59 @@ if __name__ == "__main__":
     }
     logger = logging.getLogger('IdxRecCompare')
 
-    my_instance = IdxRecCompare(args.path, sensors, logger)
-    sensor_times, ts_end = my_instance.data_check()
+    if args.follow is not None and args.state is None:
+        parser.error('--follow requires --state')
+
+    if args.state is not None and args.state_max_age is not None:
+        remove_stale_states(args.state.parent, args.state_max_age, logger)
+
+    idle_rounds = 0
+    while True:
+        # Identity of all files of the recording before checking them.
+        files_key = ResultCache.make_key(sensors, sorted(args.path.parent.iterdir()))
+        my_instance = IdxRecCompare(
+            args.path,
+            sensors,
+            logger,
+            workers=args.jobs,
+            cache_path=args.cache,
+            state_dir=args.state,
+        )
+        try:
+            sensor_times, ts_end = my_instance.data_check()
+        except ValueError:
+            if args.follow is None:
+                raise
+            # No valid frames yet.
+            logger.info('The recording is incomplete.', exc_info=True)
+            complete = False
+        else:
+            complete = True
+
+        if args.follow is None:
+            break
+
+        time.sleep(args.follow)
+        new_key = ResultCache.make_key(sensors, sorted(args.path.parent.iterdir()))
+        if new_key != files_key:
+            idle_rounds = 0
+            continue
+        if complete:
+            break
+
+        # The recording stopped growing but is still invalid.
+        idle_rounds += 1
+        if idle_rounds >= args.max_idle:
+            logger.error(
+                f'The recording is still invalid after {idle_rounds} rounds '
+                'without changes.'
+            )
+            sys.exit(1)
 
     output = {
         'ts_end': ts_end,
         'sensors': sensor_times,
+        'valid_ranges': my_instance.valid_ranges,
     }
 
     serialized_output = json.dumps(output)
@@ -30,8 +30,11 @@ v2.0:
     get_timestamp 1.0
     pcap_filter 2.0.0
 """
+import collections
+from concurrent import futures
 import dataclasses
 import enum
+import functools
 from pathlib import Path
 import time
 from datetime import datetime
@@ -51,7 +54,7 @@ import Pyro5.api
 from dspace.bosch_hol_sdk import get_version_tuple
 from dspace.bosch_hol_sdk import __version__ as full_version_str
 from dspace.bosch_hol_sdk.bus_manipulation import (
-    DataManipulation, reload_xil_paths, XilManipulationBase,
+    DataManipulation, reload_xil_paths, XilManipulationBase, XilWriteBatch,
 )
 from dspace.bosch_hol_sdk.configuration import (
     deserialize_data_manipulation, check_data_manipulation_objects,
@@ -82,11 +85,17 @@ from dspace.bosch_hol_sdk.replaydevicecontrol import (
 )
 from dspace.bosch_hol_sdk.shmem import ReplayJobSharedMemory
 from dspace.bosch_hol_sdk.system_reset import kill_runtime
+from dspace.bosch_hol_sdk.telemetry_sampler import TelemetrySampler
 from dspace.bosch_hol_sdk.utils import (
     run_file_remotely, download_sclx_app, unload_sclx_app,
 )
 from dspace.bosch_hol_sdk.xcpinterface import (
-    XCPInterface, XCPCommand, XCPResponseType, DataType,
+    XCPReadPlan, XCPDaqStream, XCPCommand, DataType, run_concurrently,
+    XCPSessionBusyError, XCPSessionTimeoutError,
+)
+from dspace.bosch_hol_sdk import xcp_recorder
+from dspace.bosch_hol_sdk.xil_capture_monitor import (
+    XILCaptureMonitor, XIL_CAPTURE_TASK,
 )
 from dspace.bosch_hol_sdk import xil_variables
 
@@ -100,10 +109,28 @@ RTMAPS_PORT = 11118  # rtmaps should be standalone, port can not be the same por
 
 ESI_CHECK_INTERVAL = 5  # seconds.
 PROGRESS_PRINT_INTERVAL = 1  # seconds.
+# Interval between two reads of the replay state and of the remote logs.
+REPLAY_STATE_SAMPLE_INTERVAL = 0.5  # seconds.
+# The replay state is reported as stale if not sampled for that long.
+REPLAY_STATE_STALE_TIMEOUT = 10  # seconds.
+# Time given to the data transmission after the replay reached 100%.
+REPLAY_FINISH_DELAY = 2  # seconds.
 
 cwd = Path(__file__).resolve().parent
 
 DEFAULT_REPLAY_DATA_TIMEOUT = 20  # seconds
+DATA_CHECK_WORKERS = 4  # Processes per PC checking the replay data files.
+# Results of the replay data check, on both PCs, for reusing them for
+# unchanged data.
+DATA_CHECK_CACHE = '/var/log/dspace/idx_rec_compare_cache.sqlite'
+# Progress of the replay data check per recording, for resuming the check of
+# recordings that are still being copied. The check only runs during the
+# configuration here. A download running
+#   idx_rec_compare.py <rec-file> --state <root>/<rec-file stem> --follow ...
+# while copying leaves only the last appended data to check then.
+DATA_CHECK_STATE_ROOT = '/var/log/dspace/idx_rec_compare_state'
+# States of the replay data check not saved for that long are removed.
+DATA_CHECK_STATE_MAX_AGE = 7 * 24 * 3600  # seconds.
 COUNTER_SUM_PROP_NAME = "Sum_Count"
 PLAYER_PROP_NAME = ["percentage", "time"]
 
@@ -170,6 +197,49 @@ ESI_XCP_ALLOW_LIST = [
     '_operationMode',
     '_frameFrequency',
 ]
+# Allow-listed ESI variables streamed with an XCP DAQ list while replaying,
+# so short changes between two progress prints are not missed.
+ESI_XCP_DAQ_LIST = [
+    '_current_offset_time',
+    '_ram_buffer_fill_percent',
+    '_debug_eth_image_frame_count',
+    '_debug_eth_dropped_pkt_count',
+]
+ESI_XCP_DAQ_EVENT_CHANNEL = 0
+# Checks without any DAQ sample after which a stream is stopped for good and
+# its variables polled, e.g. if the event channel is never triggered. They are
+# polled during those checks too.
+ESI_XCP_DAQ_MAX_EMPTY_CHECKS = 3
+ESI_XCP_TIMEOUT = 1  # seconds, for reading the variables of one ESI.
+# Seconds for connecting to one ESI and reading its version while configuring.
+# That's up to four socket operations of XCP_TIMEOUT each.
+ESI_XCP_VERSION_CHECK_TIMEOUT = 10
+
+# The XIL variables streamed with a capture while replaying, if enabled. The
+# replay length is static and the overrun counters of RTPC2 belong to another
+# application.
+XIL_CAPTURE_VARIABLES = [
+    *(
+        (name, path)
+        for name, path in xil_variables.ReplayStateMonitor.items()
+        if name != 'replayLength'
+    ),
+    *xil_variables.ReplayDisgnostic_ESI1.items(),
+    *xil_variables.ReplayDisgnostic_ESI2.items(),
+    *xil_variables.ReplayDisgnostic_RTPC1.items(),
+    (
+        'Overrun Count RTPC1',
+        xil_variables.OverrunCounters['Overrun Count RTPC1'],
+    ),
+    (
+        'Task Turnaround RTPC1',
+        xil_variables.OverrunCounters['Task Turnaround RTPC1'],
+    ),
+]
+
+# (ESI IP, firmware version, XCP connection id) of the verified ESI firmwares,
+# kept across jobs.
+_verified_esi_firmwares = set()
 
 
 def get_instance(*args, **kwargs):
@@ -266,6 +336,10 @@ class RTMapsErrorHandlersList(list):
 
 class DemoReplayPlugin():
     PYRO_ADDRESS = (REMOTE_IP, PYRO_PORT)
+    # A plugin is created per job, the SOME/IP monitor list is only built
+    # again for another application (see the key of the XIL catalogue).
+    _someip_monitor_list = []
+    _someip_monitor_list_key = None
 
     def __init__(self, rtmaps, logger):
         self._rtmaps = rtmaps
@@ -279,10 +353,8 @@ class DemoReplayPlugin():
         self._remote_rtmaps = None
         self._rt_app_download = False
         self._restart_service_pending = False
-        self._last_esi_check = 0
         self._last_progress_print = 0
         self._esi_restart_count = 0
-        self._someip_monitor_list = []
         self._ecu = None
         self._esi = None
         self._sclx = None
@@ -290,6 +362,22 @@ class DemoReplayPlugin():
         self._sclx2_reader = None
         self._sclx_reader = None
         self._esi_xcp_vars = []
+        self._esi_xcp_plans = {}
+        # ESI name -> (DAQ stream, read plan of the remaining variables).
+        self._esi_daq_streams = {}
+        # ESI name -> consecutive checks without any DAQ sample.
+        self._esi_daq_empty_checks = collections.Counter()
+        # Records the ESI variables of the job if enabled.
+        self._record_esi_xcp = False
+        # (ESI name, 'daq' or 'poll', variable names) -> XCPRecorder.
+        self._esi_xcp_recorders = {}
+        # The task of the XIL capture, None if disabled.
+        self._xil_capture_task = None
+        self._xil_capture_monitor = None
+        # Runs the monitoring of the started replay, see get_progress.
+        self._telemetry_sampler = None
+        # When the replay reached 100%, None before.
+        self._finish_time = None
         self.replayState = None
         self._rtmaps_error_handlers = RTMapsErrorHandlersList([
             # The order implies precedence!
@@ -443,34 +531,72 @@ class DemoReplayPlugin():
                 self._reset_esis()
 
     def _esi_check_xcp_version(self) -> None:
-        for esi in self._esi.devices:
+        self._esi_xcp_vars = []
+        self._esi_xcp_plans = {}
+        # The ESI units are checked concurrently so that a slow one does not
+        # delay the others.
+        results = run_concurrently(
+            [
+                (esi.xcp_session, functools.partial(self._read_esi_version, esi))
+                for esi in self._esi.devices
+            ],
+            timeout=ESI_XCP_VERSION_CHECK_TIMEOUT,
+        )
+
+        for esi, result in zip(self._esi.devices, results):
             self._logger.info(f'Checking firmware version of {esi}.')
-            with XCPInterface(esi.ip, esi.port, self._logger) as xcp_comm:
-                try:
-                    resp = xcp_comm.send(XCPCommand.CONNECT)
-                    if resp.type != XCPResponseType.RESPONSE:
-                        raise Exception(f'Failed to connect to {esi}')
-
-                    version = esi.xcp_infos.version
-                    self._logger.debug(f'Excepted version: {version}')
-                    read_version = ""
-                    for offset in range(len(version)):
-                        resp = xcp_comm.send(
-                            XCPCommand.SHORT_UPLOAD,
-                            esi.xcp_infos.version_address + offset,
-                            DataType.UBYTE,
-                        )
-                        read_version += chr(resp.value)
+            version = esi.xcp_infos.version
+            self._logger.debug(f'Excepted version: {version}')
+            if isinstance(result, XCPSessionTimeoutError):
+                self._logger.error(
+                    f'Disabling XCP variables for {esi}, reading the version '
+                    f'timed out after {ESI_XCP_VERSION_CHECK_TIMEOUT} seconds.'
+                )
+                continue
+            if isinstance(result, Exception):
+                self._logger.error(
+                    f'Disabling XCP variables for {esi}.',
+                    exc_info=result,
+                )
+                continue
+            if result != version:
+                self._logger.error(
+                    f'Disabling XCP variables for {esi}, read version '
+                    f'{result!r} instead.'
+                )
+                continue
 
-                    if read_version != version:
-                        xcp_comm.send(XCPCommand.DISCONNECT)
-                        raise ValueError(read_version, version)
+            self._esi_xcp_vars.append(esi)
+            variables = esi.xcp_infos.variables
+            self._esi_xcp_plans[esi.name] = XCPReadPlan(
+                variables.read_variables(
+                    variables.select(ESI_XCP_ALLOW_LIST)
+                )
+            )
 
-                    xcp_comm.send(XCPCommand.DISCONNECT)
-                except Exception:
-                    self._logger.exception(f'Disabling XCP variables for {esi}.')
-                else:
-                    self._esi_xcp_vars.append(esi)
+    def _read_esi_version(self, esi, xcp_comm):
+        # A request makes sure the connection is still alive (and its id
+        # current) before trusting a previous check.
+        xcp_comm.execute(XCPCommand.GET_STATUS)
+        version = esi.xcp_infos.version
+        key = (esi.ip, version, esi.xcp_session.connection_id)
+        if key in _verified_esi_firmwares:
+            self._logger.info(
+                f'Firmware version of {esi} already verified on this '
+                'connection.'
+            )
+            return version
+
+        characters = XCPReadPlan(
+            (offset, esi.xcp_infos.version_address + offset, DataType.UBYTE)
+            for offset in range(len(version))
+        ).read(xcp_comm)
+        read_version = ''.join(
+            chr(characters[offset]) for offset in range(len(version))
+        )
+        if read_version == version:
+            _verified_esi_firmwares.add(key)
+        return read_version
 
     def SCLX_model_config_StartStop(self) -> None:
         xil_paths = xil_variables.Enable
@@ -527,28 +653,33 @@ class DemoReplayPlugin():
 
         self._data_time_transmitted = BytesReceived
 
-    def get_replay_state(self, replay_state, logger) -> None:
+    def get_replay_state(self, logger) -> tuple:
+        """ Returns the elapsed time and the progress of the replay. """
         xil_paths = xil_variables.ReplayStateMonitor
 
-        # Write the eplapsed time back to drapi.
-        replay_duration = self._xil_api_maport.read_variable(xil_paths["replayDuration"])
-        replay_state.elapsed_time = replay_duration
+        replay_duration, replay_progress, new_replay_state = (
+            self._xil_api_maport.read_variables([
+                xil_paths["replayDuration"],
+                xil_paths["replayProgress"],
+                xil_paths["replayState"],
+            ])
+        )
 
-        # Write the progress back to drapi.
-        replay_progress = self._xil_api_maport.read_variable(xil_paths["replayProgress"])
-        replay_state.progress = round(replay_progress * 100)
+        progress = round(replay_progress * 100)
 
         old_replay_state = self.replayState
-        self.replayState = self._xil_api_maport.read_variable(xil_paths["replayState"])
+        self.replayState = new_replay_state
         if old_replay_state != self.replayState and self.replayState == 2:
             self._replay_length = self._xil_api_maport.read_variable(xil_paths["replayLength"])
 
         if logger:
             logger.info(f'replay Duration: {replay_duration}')
-            logger.info(f'progress: {replay_state.progress}%')
+            logger.info(f'progress: {progress}%')
             logger.info(f'replayState for model: {self.replayState}')
             logger.info(f'replayLength: {self._replay_length}')
-            
+
+        return replay_duration, progress
+
     def monitor_replaypc_load(self, url, logger):
         try:
             # set timeout 0.5s
@@ -601,9 +732,12 @@ class DemoReplayPlugin():
         )
 
     def _debug_xil_var_list(self, lst, logger) -> dict:
+        lst = list(lst)
         values = {}
-        for name, path in lst:
-            value = self._xil_api_maport.read_variable(path)
+        read_values = self._xil_api_maport.read_variables(
+            [path for _, path in lst]
+        )
+        for (name, _), value in zip(lst, read_values):
             logger.debug(f'{name}: {value}')
             values[name] = value
         return values
@@ -617,8 +751,16 @@ class DemoReplayPlugin():
             # before serialization.
             raise BadManipulationConfigurationError() from exc
 
+        logger = self._logger.getChild('data_manipulation')
+        # The XIL units are written one after the other and verified at once.
+        write_batch = XilWriteBatch(
+            self._xil_api_maport,
+            read_before=self._debug,
+            logger=logger,
+        )
         access_objects = {
             'maport': self._xil_api_maport,
+            'xil_write_batch': write_batch,
             'rtmaps': {
                 PlayerLocation.PC1: self._rtmaps,
                 PlayerLocation.PC2: self._remote_rtmaps,
@@ -628,18 +770,32 @@ class DemoReplayPlugin():
             manipulation_object = DataManipulation(
                 configuration=unit,
                 access_objects=access_objects,
-                logger=self._logger.getChild('data_manipulation'),
+                logger=logger,
             )
             manipulation_object.apply()
-
-    def _check_replay_data_files(self, connection_manager, pc1_path, pc2_path):
+        write_batch.verify()
+
+    def _check_replay_data_files(
+        self,
+        connection_manager,
+        pc1_path,
+        pc2_path,
+        workers=DATA_CHECK_WORKERS,
+    ):
         available = {}
+        valid_ranges = {}
         pc1_sensors = {
             'camera': [],
             'can': [],
             'lidar': [],
         }
-        pc2_args = [pc2_path, '-vvv']
+        pc2_args = [
+            pc2_path, '-vvv',
+            '--jobs', str(workers),
+            '--cache', DATA_CHECK_CACHE,
+            '--state', f'{DATA_CHECK_STATE_ROOT}/{Path(pc2_path).stem}',
+            '--state-max-age', str(DATA_CHECK_STATE_MAX_AGE),
+        ]
 
         for connection in connection_manager.get_port_connections():
             if connection.player.location == PlayerLocation.PC1:
@@ -647,23 +803,38 @@ class DemoReplayPlugin():
             else:
                 pc2_args.extend((f'--{connection.type}', connection.name))
 
-        # Running check on PC1.
-        logger = self._logger.getChild('IdxRecCompare')
-        compare_obj = idx_rec_compare.IdxRecCompare(
-            pc1_path,
-            pc1_sensors,
-            logger,
-        )
-        available[PlayerLocation.PC1], timestamp1 = compare_obj.data_check()
-
-        # Running check on PC2.
-        serialized_output, stderr = run_file_remotely(
-            idx_rec_compare.__file__,
-            *pc2_args,
-            remote_ip=REMOTE_IP,
-            username='dspace',
-            password='dspace',
-        )
+        # The disks of both PCs are independent, so the check on PC2 is
+        # started first and runs while PC1 is being checked.
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            remote_check = executor.submit(
+                run_file_remotely,
+                idx_rec_compare.__file__,
+                *pc2_args,
+                remote_ip=REMOTE_IP,
+                username='dspace',
+                password='dspace',
+            )
+
+            # Running check on PC1.
+            logger = self._logger.getChild('IdxRecCompare')
+            idx_rec_compare.remove_stale_states(
+                DATA_CHECK_STATE_ROOT,
+                DATA_CHECK_STATE_MAX_AGE,
+                logger,
+            )
+            compare_obj = idx_rec_compare.IdxRecCompare(
+                pc1_path,
+                pc1_sensors,
+                logger,
+                workers=workers,
+                cache_path=DATA_CHECK_CACHE,
+                state_dir=Path(DATA_CHECK_STATE_ROOT, Path(pc1_path).stem),
+            )
+            available[PlayerLocation.PC1], timestamp1 = compare_obj.data_check()
+            valid_ranges[PlayerLocation.PC1] = compare_obj.valid_ranges
+
+            # Collecting the results of PC2.
+            serialized_output, stderr = remote_check.result()
 
         if stderr.strip():
             for line in stderr.splitlines():
@@ -678,12 +849,22 @@ class DemoReplayPlugin():
         output = json.loads(serialized_output)
         available[PlayerLocation.PC2] = output['sensors']
         timestamp2 = int(output['ts_end'])
+        valid_ranges[PlayerLocation.PC2] = output.get('valid_ranges', {})
 
         for location, sensors in available.items():
             self._logger.debug(f'Data analysis results on {location}:')
             for name, data in sensors.items():
                 self._logger.debug(f'\t{name}: {data}')
 
+        # Invalid frames in the middle of a stream make the replay stall.
+        for location, sensors in valid_ranges.items():
+            for name, time_ranges in sensors.items():
+                if len(time_ranges) > 1:
+                    self._logger.warning(
+                        f'Stream {name} on {location} has invalid frames, '
+                        f'valid time ranges [us]: {time_ranges}'
+                    )
+
         self._logger.debug(f'End time PC1: {timestamp1}')
         self._logger.debug(f'End time PC2: {timestamp2}')
 
@@ -715,8 +896,15 @@ class DemoReplayPlugin():
         return found, min(timestamp1, timestamp2)
 
     def _prepare_someip_monitor_list(self):
+        catalogue = XilManipulationBase.get_known_paths()
+        if (catalogue.key is not None
+                and catalogue.key == self._someip_monitor_list_key):
+            # Same application as for the previous job.
+            return
+
         var_list = []
-        for entry in XilManipulationBase.get_known_paths():
+        # All the SOME/IP paths are below the Ethernet bus systems.
+        for entry in catalogue.under_segments(('BusSystems', 'Ethernet')):
             m = SOMEIP_SUBSCRIPTION_REGEX.match(entry)
             if m:
                 name = (
@@ -741,14 +929,19 @@ class DemoReplayPlugin():
                 continue
 
         var_list.sort()
-        self._someip_monitor_list = var_list
+        DemoReplayPlugin._someip_monitor_list = var_list
+        DemoReplayPlugin._someip_monitor_list_key = catalogue.key
 
     def _check_someip_subscriptions(self, logger):
-        for name, path in self._someip_monitor_list:
-            # ignore counters.
-            if not 'Subscription status' in name:
-                continue
-            value = self._xil_api_maport.read_variable(path)
+        # ignore counters.
+        subscriptions = [
+            (name, path) for name, path in self._someip_monitor_list
+            if 'Subscription status' in name
+        ]
+        values = self._xil_api_maport.read_variables(
+            [path for _, path in subscriptions]
+        )
+        for (name, _), value in zip(subscriptions, values):
             if value == 0:
                 logger.info(f'Unsubscribed service: {name}')
 
@@ -764,6 +957,20 @@ class DemoReplayPlugin():
         if self._debug:
             self._logger.warning('Debug mode activated!')
 
+        # Read the ESI variables recording flag.
+        self._record_esi_xcp = replay_data.get(
+            'record_esi_xcp', 'false',
+        ).lower() == 'true'
+
+        # Read the XIL capture flag. The monitored variables are captured
+        # unless disabled, the others are read with concurrent MAPort reads.
+        if replay_data.get('xil_capture', 'true').lower() == 'true':
+            self._xil_capture_task = replay_data.get(
+                'xil_capture_task', XIL_CAPTURE_TASK,
+            )
+        else:
+            self._xil_capture_task = None
+
         try:
             # First try!
             self._real_configure(
@@ -869,7 +1076,6 @@ class DemoReplayPlugin():
         # check ESI connection (it raises an exception if not reachable).
         self.ESI_check()
         self._esi_check_xcp_version()
-        self._last_esi_check = time.perf_counter()
 
         data_path_pc1 = replay_data['path1']
         data_path_pc2 = replay_data['path2']
@@ -970,6 +1176,180 @@ class DemoReplayPlugin():
             '%Y-%m-%d %H:%M:%S'
         )
         self._start_time = time.perf_counter()
+        self._start_esi_daq_streams()
+        self._start_xil_capture_monitor()
+        self._start_telemetry_sampler()
+
+    def _start_telemetry_sampler(self):
+        sampler = TelemetrySampler(
+            # The Pyro proxy is only used by the sampler during the replay.
+            initializer=self._claim_remote_rtmaps,
+            logger=self._logger,
+        )
+        sampler.add_task(
+            'remote RTMaps logs',
+            self._process_remote_rtmaps_logs,
+            REPLAY_STATE_SAMPLE_INTERVAL,
+        )
+        if self._xil_api_maport is not None:
+            # The MAPort calls of the lane and the other threads are
+            # serialized by the lock of the XILAPIMAPort.
+            sampler.add_task(
+                'replay state',
+                self._sample_replay_state,
+                REPLAY_STATE_SAMPLE_INTERVAL,
+                lane='XIL',
+            )
+            sampler.add_task(
+                'XIL monitoring',
+                self._sample_xil_monitoring,
+                PROGRESS_PRINT_INTERVAL,
+                lane='XIL',
+            )
+        sampler.add_task(
+            'replay PC load',
+            lambda: self.monitor_replaypc_load(
+                NETIO_URL,
+                self._logger.getChild("getProgress"),
+            ),
+            PROGRESS_PRINT_INTERVAL,
+            lane='NETIO',
+        )
+        sampler.add_task(
+            'ESI connection',
+            self.ESI_check,
+            ESI_CHECK_INTERVAL,
+            # Checked at the end of the configuration already.
+            delay=ESI_CHECK_INTERVAL,
+        )
+        sampler.add_task(
+            'replay monitoring',
+            self._sample_replay_monitoring,
+            PROGRESS_PRINT_INTERVAL,
+        )
+        sampler.start()
+        self._telemetry_sampler = sampler
+
+    def _stop_telemetry_sampler(self):
+        if self._telemetry_sampler is None:
+            return
+        try:
+            self._telemetry_sampler.stop()
+        except Exception:
+            self._logger.exception('Failed to stop the telemetry sampler.')
+        finally:
+            self._telemetry_sampler = None
+        self._claim_remote_rtmaps()
+
+    def _claim_remote_rtmaps(self):
+        # Pyro proxies can only be used by the thread owning them.
+        if self._remote_rtmaps is not None:
+            self._remote_rtmaps._pyroClaimOwnership()
+
+    def _sample_replay_state(self):
+        logger = self._logger.getChild("getProgress")
+        if time.perf_counter() - self._last_progress_print < PROGRESS_PRINT_INTERVAL:
+            progress_logger = None
+        else:
+            progress_logger = logger
+            self._last_progress_print = time.perf_counter()
+
+        try:
+            # Check if the RTPC has received the first and last time values.
+            self._check_sclx_time(logger)
+
+            # get Progress
+            return self.get_replay_state(progress_logger)
+        except TestbenchPortException as ex:
+            self._logger.exception(f'CodeDescription: {ex.CodeDescription}')
+            self._logger.error(
+                f'VendorCodeDescription: {ex.VendorCodeDescription}'
+            )
+            return None
+
+    def _sample_xil_monitoring(self):
+        progress_logger = self._logger.getChild("getProgress")
+
+        try:
+            # DuTSyncStartCalc
+            self.DuTSyncStartCalc(progress_logger)
+
+            # Replay System Monitoring
+            self._log_xil_capture_aggregates(progress_logger)
+            self.monitor_ESI1(progress_logger)
+            self.monitor_ESI2(progress_logger)
+            self.monitor_RTPC(progress_logger)
+            if self._debug:
+                self.monitor_someip(progress_logger)
+            else:
+                self._check_someip_subscriptions(progress_logger)
+
+        except TestbenchPortException as ex:
+            self._logger.exception(f'CodeDescription: {ex.CodeDescription}')
+            self._logger.error(
+                f'VendorCodeDescription: {ex.VendorCodeDescription}'
+            )
+
+    def _sample_replay_monitoring(self):
+        progress_logger = self._logger.getChild("getProgress")
+
+        self._check_real_replay_progress(progress_logger)
+        self._process_scalexio_messages(progress_logger)
+
+        # if self.replayState == 1 and self._debug:
+        if self.replayState == 1:
+            self._check_esi_variables(progress_logger)
+        elif self.replayState == 2:
+            self._check_player_percentage(progress_logger)
+
+    def _start_xil_capture_monitor(self):
+        # E.g. the one of a previous attempt.
+        self._stop_xil_capture_monitor()
+        if self._xil_capture_task is None:
+            return
+        monitor = XILCaptureMonitor(
+            self._xil_api_maport,
+            XIL_CAPTURE_VARIABLES,
+            task=self._xil_capture_task,
+            logger=self._logger,
+        )
+        try:
+            monitor.start()
+        except Exception:
+            self._logger.exception(
+                'Failed to start the XIL capture, polling the variables '
+                'instead.'
+            )
+            return
+        self._xil_capture_monitor = monitor
+        # The monitoring reads are served by the capture from now on.
+        self._xil_api_maport.batch_reader = monitor.read_variables
+
+    def _stop_xil_capture_monitor(self):
+        if self._xil_capture_monitor is None:
+            return
+        if self._xil_api_maport is not None:
+            self._xil_api_maport.batch_reader = None
+        try:
+            self._xil_capture_monitor.stop()
+        except Exception:
+            self._logger.exception('Failed to stop the XIL capture.')
+        finally:
+            self._xil_capture_monitor = None
+
+    def _log_xil_capture_aggregates(self, logger):
+        if self._xil_capture_monitor is None:
+            return
+        if not self._xil_capture_monitor.running:
+            logger.warning('The XIL capture stopped, polling the variables.')
+            self._stop_xil_capture_monitor()
+            return
+        for name, aggregate in self._xil_capture_monitor.aggregates().items():
+            logger.debug(
+                f'{name}: {aggregate.latest} (min: {aggregate.minimum}, '
+                f'max: {aggregate.maximum}, rate: {aggregate.rate:.3f}/s, '
+                f'samples: {aggregate.samples})'
+            )
 
     def _create_start_shmem(self):
         self._shmem = ReplayJobSharedMemory(self._job_name, create=True)
@@ -1177,40 +1557,195 @@ class DemoReplayPlugin():
                                 f"{data.name} is stale for {elapsed_time} seconds"
                             )
 
+    def _start_esi_daq_streams(self):
+        self._esi_daq_empty_checks.clear()
+        for esi in self._esi_xcp_vars:
+            variables = esi.xcp_infos.variables
+            streamed = set(variables.select(ESI_XCP_DAQ_LIST))
+            polled = [
+                index for index in variables.select(ESI_XCP_ALLOW_LIST)
+                if index not in streamed
+            ]
+            stream = XCPDaqStream(
+                variables.read_variables(sorted(streamed)),
+                event_channel=ESI_XCP_DAQ_EVENT_CHANNEL,
+            )
+            try:
+                esi.xcp_session.run(stream.start)
+            except Exception:
+                self._logger.exception(
+                    f'Failed to start the XCP DAQ stream of {esi}, polling '
+                    'its variables instead.'
+                )
+            else:
+                self._esi_daq_streams[esi.name] = (
+                    stream,
+                    XCPReadPlan(variables.read_variables(polled)),
+                )
+
+    def _stop_esi_daq_streams(self):
+        for esi in self._esi_xcp_vars:
+            if esi.name not in self._esi_daq_streams:
+                continue
+            stream, _ = self._esi_daq_streams.pop(esi.name)
+            if stream.communicator is not esi.xcp_session.communicator:
+                # The connection was lost and the stream with it.
+                continue
+            try:
+                esi.xcp_session.run(lambda _: stream.stop())
+            except Exception:
+                self._logger.exception(
+                    f'Failed to stop the XCP DAQ stream of {esi}.'
+                )
+
     def _check_esi_variables(self, logger):
         logger.debug(f'Reading ESI variables from {self._esi.devices}')
-        for esi in self._esi_xcp_vars:
+        # The ESI units are read concurrently so that a slow one does not
+        # delay the others.
+        results = run_concurrently(
+            [
+                (
+                    esi.xcp_session,
+                    functools.partial(self._read_esi_variables, esi, logger),
+                )
+                for esi in self._esi_xcp_vars
+            ],
+            timeout=ESI_XCP_TIMEOUT,
+        )
+
+        for esi, result in zip(self._esi_xcp_vars, results):
             logger.info(f'Getting XCP variables from {esi}')
+            if isinstance(result, XCPSessionTimeoutError):
+                logger.error(
+                    f'Reading the XCP variables timed out after '
+                    f'{ESI_XCP_TIMEOUT} seconds.'
+                )
+            elif isinstance(result, XCPSessionBusyError):
+                logger.warning(
+                    'Skipped reading the XCP variables, the previous read is '
+                    'still running.'
+                )
+            elif isinstance(result, Exception):
+                logger.error(
+                    'Failed to communicate with the ESI over XCP',
+                    exc_info=result,
+                )
+            else:
+                stream, samples, plan, timestamp, values = result
+                if stream is not None:
+                    self._log_esi_xcp_samples(stream.keys, samples, logger)
+                    self._record_esi_xcp_samples(
+                        esi, 'daq', stream.variables, samples,
+                    )
+                self._log_esi_xcp_values(plan, values, logger)
+                # Only complete reads are recorded, the columns have no gaps.
+                if len(values) == len(plan.variables):
+                    row = [values[name] for name, _, _ in plan.variables]
+                    self._record_esi_xcp_samples(
+                        esi, 'poll', plan.variables, [(timestamp, row)],
+                    )
+
+    def _read_esi_variables(self, esi, logger, xcp_comm):
+        stream, plan = self._esi_daq_streams.get(
+            esi.name,
+            (None, self._esi_xcp_plans[esi.name]),
+        )
+        if stream is not None and stream.communicator is not xcp_comm:
+            logger.warning(
+                f'XCP connection to {esi} was lost, restarting the DAQ stream.'
+            )
+            stream.start(xcp_comm)
+        samples = []
+        if stream is not None:
+            samples = stream.drain()
+            if samples:
+                self._esi_daq_empty_checks[esi.name] = 0
+            else:
+                # All the variables are polled until samples arrive again.
+                plan = self._esi_xcp_plans[esi.name]
+                self._esi_daq_empty_checks[esi.name] += 1
+                if (self._esi_daq_empty_checks[esi.name]
+                        >= ESI_XCP_DAQ_MAX_EMPTY_CHECKS):
+                    self._drop_esi_daq_stream(esi, stream, logger)
+        values = plan.read(xcp_comm)
+        return stream, samples, plan, time.monotonic(), values
+
+    def _drop_esi_daq_stream(self, esi, stream, logger):
+        logger.warning(
+            f'No XCP DAQ samples of {esi} in '
+            f'{ESI_XCP_DAQ_MAX_EMPTY_CHECKS} checks, check the event channel '
+            f'{ESI_XCP_DAQ_EVENT_CHANNEL}. Polling its variables instead.'
+        )
+        del self._esi_daq_streams[esi.name]
+        try:
+            stream.stop()
+        except Exception:
+            logger.exception(f'Failed to stop the XCP DAQ stream of {esi}.')
+
+    def _record_esi_xcp_samples(self, esi, source, variables, samples):
+        if not self._record_esi_xcp or not samples:
+            return
+        # A recorder only takes rows of the same columns, the polled
+        # variables change e.g. when a DAQ stream is replaced by polling.
+        key = (esi.name, source, tuple(name for name, _, _ in variables))
+        if key not in self._esi_xcp_recorders:
+            self._esi_xcp_recorders[key] = xcp_recorder.XCPRecorder(variables)
+        self._esi_xcp_recorders[key].extend(samples)
+
+    def _save_esi_xcp_recordings(self):
+        recorders = self._esi_xcp_recorders
+        self._esi_xcp_recorders = {}
+        if not recorders:
+            return
+
+        logfile = self._get_job_log_file()
+        if logfile is None:
+            self._logger.error(
+                "Failed to find the job's log file, discarding the ESI "
+                "variable recordings."
+            )
+            return
+        counts = collections.Counter()
+        for (esi_name, source, _), recorder in recorders.items():
+            name = f'{logfile.stem}_{esi_name}_{source}'
+            counts[esi_name, source] += 1
+            if counts[esi_name, source] > 1:
+                name = f'{name}_{counts[esi_name, source]}'
+            path = logfile.with_name(f'{name}{xcp_recorder.FILE_SUFFIX}')
             try:
-                with XCPInterface(esi.ip, esi.port, logger) as xcp_comm:
-                    resp = xcp_comm.send(XCPCommand.CONNECT)
-                    if resp.type != XCPResponseType.RESPONSE:
-                        logger.error(f'Failed to connect to {esi}')
-                        return
-
-                    for variable in esi.xcp_infos.variables:
-                        if any(map(
-                            variable.name.endswith,
-                            ESI_XCP_ALLOW_LIST,
-                        )):
-                            try:
-                                resp = xcp_comm.send(
-                                    XCPCommand.SHORT_UPLOAD,
-                                    variable.value.address,
-                                    variable.value.type,
-                                )
-                            except Exception:
-                                logger.exception(
-                                    f'Failed to read XCP variable: {variable}'
-                                )
-                            else:
-                                logger.info(f'    {variable.name}: {resp.value}')
-                    xcp_comm.send(XCPCommand.DISCONNECT)
-            except Exception:
-                logger.exception(
-                    'Failed to communicate with the ESI over XCP'
+                recorder.save(path)
+            except OSError:
+                self._logger.exception(f'Failed to save {path}.')
+            else:
+                self._logger.info(
+                    f'Saved {recorder.rows} samples of the {esi_name} '
+                    f'variables to {path}.'
                 )
 
+    @staticmethod
+    def _log_esi_xcp_values(plan, values, logger):
+        for name, _, _ in plan.variables:
+            if name in values:
+                logger.info(f'    {name}: {values[name]}')
+            else:
+                logger.error(f'Failed to read XCP variable: {name}')
+
+    @staticmethod
+    def _log_esi_xcp_samples(keys, samples, logger):
+        if not samples:
+            logger.warning(
+                'No XCP DAQ samples received, polling the streamed variables.'
+            )
+            return
+
+        logger.info(f'    {len(samples)} XCP DAQ samples received.')
+        columns = zip(*(values for _, values in samples))
+        for name, column in zip(keys, columns):
+            logger.info(
+                f'    {name}: {column[-1]} '
+                f'(min: {min(column)}, max: {max(column)})'
+            )
+
     def get_progress(self, replay_state):
         # Fill user data:
         for key, value in self._user_data.items():
@@ -1232,71 +1767,49 @@ class DemoReplayPlugin():
             else:
                 return
 
-        # check ESI connection (it raises an exception if not reachable).
-        if time.perf_counter() - self._last_esi_check >= ESI_CHECK_INTERVAL:
-            self.ESI_check()
-            self._last_esi_check = time.perf_counter()
-
         # Check if there are any pending exceptions (mostly form the rtmaps logs).
         if self._pending_exception is not None:
             tmp_exception = self._pending_exception
             self._pending_exception = None
             raise tmp_exception
 
-        self._process_remote_rtmaps_logs()
+        if self._telemetry_sampler is None:
+            # Already cleaned up.
+            return
+
+        # The monitoring runs in the telemetry sampler, only its latest results
+        # are consumed here so that a slow device can't delay the progress.
+        sampler_exception = self._telemetry_sampler.pop_exception()
+        if sampler_exception is not None:
+            raise sampler_exception
 
         if self._xil_api_maport is None:
             # There is nothing to read anyway.
             replay_state.state = datareplay_pb2.ERROR
             return
 
-        progress_logger = self._logger.getChild("getProgress")
-
-        try:
-            # Check if the RTPC has received the first and last time values.
-            self._check_sclx_time(progress_logger)
-
-            # DuTSyncStartCalc
-            self.DuTSyncStartCalc(progress_logger)
-
-            if time.perf_counter() - self._last_progress_print < PROGRESS_PRINT_INTERVAL:
-                progress_logger = None
-            else:
-                self._last_progress_print = time.perf_counter()
-
-            # get Progress
-            self.get_replay_state(replay_state, progress_logger)
-
-            # Replay System Monitoring
-            if progress_logger:
-                self.monitor_ESI1(progress_logger)
-                self.monitor_ESI2(progress_logger)
-                self.monitor_RTPC(progress_logger)
-                self.monitor_replaypc_load(NETIO_URL, progress_logger)
-                if self._debug:
-                    self.monitor_someip(progress_logger)
-                else:
-                    self._check_someip_subscriptions(progress_logger)
-
-        except TestbenchPortException as ex:
-            self._logger.exception(f'CodeDescription: {ex.CodeDescription}')
-            self._logger.error(
-                f'VendorCodeDescription: {ex.VendorCodeDescription}'
+        sample = self._telemetry_sampler.latest('replay state')
+        if sample is None:
+            return
+        sample_time, result = sample
+        sample_age = time.monotonic() - sample_time
+        if sample_age > REPLAY_STATE_STALE_TIMEOUT:
+            self._logger.warning(
+                f'The replay state was last read {sample_age:.1f}s ago.'
             )
-
-        if progress_logger:
-            self._check_real_replay_progress(progress_logger)
-            self._process_scalexio_messages(progress_logger)
-
-            # if self.replayState == 1 and self._debug:
-            if self.replayState == 1:
-                self._check_esi_variables(progress_logger)
-            elif self.replayState == 2:
-                self._check_player_percentage(progress_logger)
+        if result is None:
+            # The last read failed.
+            return
+        replay_state.elapsed_time, replay_state.progress = result
 
         if replay_state.progress == 100:
-            self._logger.info("Waiting for data transmission in 2s")
-            time.sleep(2)
+            if self._finish_time is None:
+                self._logger.info(
+                    f"Waiting for data transmission in {REPLAY_FINISH_DELAY}s"
+                )
+                self._finish_time = time.perf_counter()
+            if time.perf_counter() - self._finish_time < REPLAY_FINISH_DELAY:
+                return
 
             # get finish time
             replay_state.user_data['end_time'] = datetime.now().strftime(
@@ -1315,6 +1828,10 @@ class DemoReplayPlugin():
     def cleanup(self, reason, replay_data, final=True):
         self._logger.info(f"Starting cleanup process with reason {reason}.")
 
+        self._stop_telemetry_sampler()
+        self._stop_esi_daq_streams()
+        self._stop_xil_capture_monitor()
+
         # Read the ESI logs.
         if final and self._esi is not None:
             if reason != 2:
@@ -1340,6 +1857,8 @@ class DemoReplayPlugin():
         else:
             self._logger.info("Skipping ESI logs creation.")
 
+        self._save_esi_xcp_recordings()
+
         # Delete the shared memory if it exists:
         if self._shmem is not None:
             try:
@@ -1440,6 +1959,17 @@ class DemoReplayPlugin():
         )
         return handler.error_type
 
+    def _get_job_log_file(self):
+        file_handlers = list(filter(
+            lambda x: isinstance(x, logging.FileHandler),
+            self._logger.parent.handlers,
+        ))
+        if not file_handlers:
+            return None
+        # We assume the last file in the list is always the one belonging to
+        # the job only (last one added) (a bit hacky).
+        return Path(file_handlers[-1].baseFilename)
+
     def _create_esi_support(self, esi):
         self._logger.info(f"Reading ESI logs from {esi.name}...")
         # basedir = Path("/var/log/dspace")
@@ -1452,14 +1982,8 @@ class DemoReplayPlugin():
             tmp_dir.mkdir(parents=True, exist_ok=True)
 
             # Job log file.
-            file_handlers = list(filter(
-                lambda x: isinstance(x, logging.FileHandler),
-                self._logger.parent.handlers,
-            ))
-            if file_handlers:
-                # We assume the last file in the list is always the one
-                # belonging to the job only (last one added) (a bit hacky).
-                logfile = Path(file_handlers[-1].baseFilename)
+            logfile = self._get_job_log_file()
+            if logfile is not None:
                 if logfile.exists():
                     self._logger.info(
                         f"Collecting the job's log file: {logfile}"
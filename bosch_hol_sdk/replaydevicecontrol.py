@@ -7,8 +7,13 @@ the differenct replay devices.
     All rights reserved.
 """
 import enum
+import functools
+import logging
+import threading
 import typing
 
+from dspace.bosch_hol_sdk import a2l_loader
+from dspace.bosch_hol_sdk import defaults
 from dspace.bosch_hol_sdk import esi_xcp_variables
 from dspace.bosch_hol_sdk.devicecontrol import (
     ScalexioDeviceControl, EsiDeviceControl, EcuDeviceControl,
@@ -40,51 +45,80 @@ NETIO_CFG_51 = {
     'pwd': 'netio',
 }
 
-_netio_dev_50 = netio_powerdin_4pz_ctrl(**NETIO_CFG_50)
-_netio_dev_51 = netio_powerdin_4pz_ctrl(**NETIO_CFG_51)
-
-_replay_devices = {
-    ReplayDevice.ECU: EcuDeviceControl(
-        name=ReplayDevice.ECU,
-        ip='',
-        netio_socket=NetioSocket(_netio_dev_50, 4),
-        KL30=NetioSocket(_netio_dev_50, 3),
-    ),
-    ReplayDevice.SCALEXIO1: ScalexioDeviceControl(
-        name=ReplayDevice.SCALEXIO1,
-        ip='192.168.140.10',
-        netio_socket=NetioSocket(_netio_dev_50, 1),
-    ),
-    ReplayDevice.SCALEXIO2: ScalexioDeviceControl(
-        name=ReplayDevice.SCALEXIO2,
-        ip='192.168.140.11',
-        netio_socket=NetioSocket(_netio_dev_51, 1),
-        netio_reboot=False,
-    ),
-    ReplayDevice.ESI: AggregateEsiDeviceControls(
-        name=ReplayDevice.ESI,
-        devices=[
-            EsiDeviceControl(
-                name='ESI1',
-                ip='192.168.141.21',
-                port=30303,
-                netio_socket=NetioSocket(_netio_dev_51, 4),
-                data_interface='192.168.150.21',
-                xcp_infos=esi_xcp_variables.get_esi_info('ESI1'),
-            ),
-            EsiDeviceControl(
-                name='ESI2',
-                ip='192.168.141.22',
-                port=30303,
-                netio_socket=NetioSocket(_netio_dev_51, 4),
-                data_interface='192.168.151.22',
-                xcp_infos=esi_xcp_variables.get_esi_info('ESI2'),
-            ),
-        ],
-    ),
-}
+
+def _get_esi_info(esi_name):
+    """
+    Returns the XCP infos of the ESI unit from its deployed A2L file, so that
+    a firmware update does not require a new SDK, or the generated ones.
+    """
+    a2l_file = defaults.ESI_A2L_DIRECTORY / f'{esi_name}.a2l'
+    if a2l_file.exists():
+        try:
+            return a2l_loader.get_esi_info(esi_name, a2l_file)
+        except Exception:
+            logging.getLogger().exception(
+                f'Failed to load {a2l_file}, using the built-in variables.'
+            )
+    return esi_xcp_variables.get_esi_info(esi_name)
+
+
+_replay_devices_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_replay_devices():
+    """
+    Creates the devices on first use, since loading the ESI infos parses their
+    A2L files.
+    """
+    netio_dev_50 = netio_powerdin_4pz_ctrl(**NETIO_CFG_50)
+    netio_dev_51 = netio_powerdin_4pz_ctrl(**NETIO_CFG_51)
+
+    return {
+        ReplayDevice.ECU: EcuDeviceControl(
+            name=ReplayDevice.ECU,
+            ip='',
+            netio_socket=NetioSocket(netio_dev_50, 4),
+            KL30=NetioSocket(netio_dev_50, 3),
+        ),
+        ReplayDevice.SCALEXIO1: ScalexioDeviceControl(
+            name=ReplayDevice.SCALEXIO1,
+            ip='192.168.140.10',
+            netio_socket=NetioSocket(netio_dev_50, 1),
+        ),
+        ReplayDevice.SCALEXIO2: ScalexioDeviceControl(
+            name=ReplayDevice.SCALEXIO2,
+            ip='192.168.140.11',
+            netio_socket=NetioSocket(netio_dev_51, 1),
+            netio_reboot=False,
+        ),
+        ReplayDevice.ESI: AggregateEsiDeviceControls(
+            name=ReplayDevice.ESI,
+            devices=[
+                EsiDeviceControl(
+                    name='ESI1',
+                    ip='192.168.141.21',
+                    port=30303,
+                    netio_socket=NetioSocket(netio_dev_51, 4),
+                    data_interface='192.168.150.21',
+                    xcp_infos=_get_esi_info('ESI1'),
+                ),
+                EsiDeviceControl(
+                    name='ESI2',
+                    ip='192.168.141.22',
+                    port=30303,
+                    netio_socket=NetioSocket(netio_dev_51, 4),
+                    data_interface='192.168.151.22',
+                    xcp_infos=_get_esi_info('ESI2'),
+                ),
+            ],
+        ),
+    }
 
 
 def get_replay_device(device: typing.Union[ReplayDevice, str]):
     device = ReplayDevice[device.upper()]
-    return _replay_devices[device]
+    # The devices and their XCP sessions must only be created once.
+    with _replay_devices_lock:
+        devices = _get_replay_devices()
+    return devices[device]
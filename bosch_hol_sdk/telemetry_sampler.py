@@ -0,0 +1,178 @@
+"""
+Samples the telemetry of a replay job on background threads.
+
+The sampling tasks (device reads, log fetches, stall checks, ...) run on a
+schedule of their own, so a slow device never delays the consumers. Those
+only read the latest result of each task and the first exception raised by
+one of them.
+
+The tasks of a lane run one after the other on the thread of the lane, so
+the objects they use don't need to be thread-safe between each other (e.g.
+a Pyro proxy owned by that thread). A slow task only delays its own lane.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import dataclasses
+import logging
+import threading
+import time
+import typing
+
+DEFAULT_LANE = 'default'
+# Seconds stop waits for the current tasks of the lanes to finish.
+STOP_TIMEOUT = 10
+
+
+@dataclasses.dataclass
+class _SamplerTask:
+    name: str
+    function: typing.Callable
+    # Seconds between two runs.
+    period: float
+    # A run taking longer than that is logged, in seconds.
+    budget: float
+    # Seconds after the start of the sampler before the first run.
+    delay: float
+    next_run: float = 0
+
+
+class TelemetrySampler:
+    """
+    Runs the added tasks periodically until stopped.
+
+    The sampler stops at the first exception of a task, which is kept for
+    pop_exception.
+    """
+    def __init__(self, initializer=None, logger=None):
+        if logger is None:
+            logger = logging.getLogger()
+        self._logger = logger.getChild(self.__class__.__name__)
+        # Called on the thread of the default lane before its first task.
+        self._initializer = initializer
+        # Lane -> tasks.
+        self._lanes = {DEFAULT_LANE: []}
+        self._lock = threading.Lock()
+        # Task name -> (monotonic time, result) of the last run.
+        self._results = {}
+        self._exception = None
+        self._threads = []
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self):
+        return any(thread.is_alive() for thread in self._threads)
+
+    def add_task(
+        self,
+        name,
+        function,
+        period,
+        budget=None,
+        delay=0,
+        lane=DEFAULT_LANE,
+    ):
+        """ Runs function() every `period` seconds, see latest for its result. """
+        if self._threads:
+            raise RuntimeError('Tasks must be added before starting.')
+        self._lanes.setdefault(lane, []).append(_SamplerTask(
+            name=name,
+            function=function,
+            period=period,
+            budget=period if budget is None else budget,
+            delay=delay,
+        ))
+
+    def start(self):
+        self._stop_event.clear()
+        for lane, tasks in self._lanes.items():
+            thread = threading.Thread(
+                target=self._run,
+                args=(tasks, lane == DEFAULT_LANE),
+                name=f'{self._logger.name}.{lane}',
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+            self._logger.info(
+                f'Sampling {", ".join(task.name for task in tasks)} '
+                f'on the {lane} lane.'
+            )
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """
+        Stops the sampler, after the current tasks finished or `timeout`
+        seconds. Returns whether all the lanes stopped, the ones still running
+        are logged and left to finish on their own.
+        """
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0, deadline - time.monotonic()))
+        running = [thread.name for thread in self._threads if thread.is_alive()]
+        self._threads = []
+        if running:
+            self._logger.error(
+                f'Lanes still running after {timeout}s: {", ".join(running)}'
+            )
+        return not running
+
+    def latest(self, name):
+        """
+        Returns the (monotonic time, result) of the last run of a task, None if
+        it didn't run yet.
+        """
+        with self._lock:
+            return self._results.get(name)
+
+    def pop_exception(self):
+        """ Returns the exception which stopped the sampler once, or None. """
+        with self._lock:
+            exception, self._exception = self._exception, None
+        return exception
+
+    def _run(self, tasks, initialize):
+        try:
+            if initialize and self._initializer is not None:
+                self._initializer()
+        except Exception as exc:
+            self._set_exception(exc, 'initializer')
+            return
+
+        start = time.monotonic()
+        for task in tasks:
+            task.next_run = start + task.delay
+
+        while tasks:
+            task = min(tasks, key=lambda task: task.next_run)
+            if self._stop_event.wait(max(0, task.next_run - time.monotonic())):
+                break
+
+            run_start = time.monotonic()
+            try:
+                result = task.function()
+            except Exception as exc:
+                self._set_exception(exc, task.name)
+                break
+            run_end = time.monotonic()
+            with self._lock:
+                self._results[task.name] = (run_end, result)
+
+            duration = run_end - run_start
+            if duration > task.budget:
+                self._logger.warning(
+                    f'Sampling {task.name} took {duration:.3f}s, over its '
+                    f'budget of {task.budget}s.'
+                )
+            # Runs that are late are not caught up.
+            task.next_run = max(task.next_run + task.period, run_end)
+
+    def _set_exception(self, exception, name):
+        self._logger.error(
+            f'Sampling {name} failed, stopping: {exception!r}'
+        )
+        with self._lock:
+            self._exception = self._exception or exception
+        # Stops the other lanes too.
+        self._stop_event.set()
@@ -0,0 +1,143 @@
+"""
+Records sampled XCP variable values into typed columns, for post-run analysis.
+
+A recording file holds one column per variable plus the monotonic timestamps
+of the samples:
+
+    MAGIC
+    header size (uint32, little endian)
+    header (JSON): rows, byte order, wall clock offset and the (name, array
+        type code) of each column, timestamps first
+    the raw data of each column, in the order of the header
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+from array import array
+import dataclasses
+import json
+import pathlib
+import struct
+import sys
+import time
+
+MAGIC = b'XCPREC\x00\x01'
+FILE_SUFFIX = '.xcprec'
+# Rows preallocated per column, doubled whenever the columns are full.
+XCP_RECORDER_CAPACITY = 4096
+
+_HEADER_SIZE = struct.Struct('<L')
+# The array type codes matching the sizes of the struct format characters.
+_ARRAY_TYPE_CODES = {
+    'b': 'b', 'B': 'B', 'h': 'h', 'H': 'H', 'l': 'i', 'L': 'I',
+    'q': 'q', 'Q': 'Q', 'f': 'f', 'd': 'd',
+}
+
+
+class XCPRecorder:
+    """
+    Appends samples of a fixed set of variables into preallocated columns.
+
+    `variables` is an iterable of (key, address, datatype), like for
+    XCPReadPlan and XCPDaqStream. The values of a sample are given in that
+    order.
+    """
+    def __init__(self, variables, capacity=XCP_RECORDER_CAPACITY):
+        variables = list(variables)
+        self.keys = [str(key) for key, _, _ in variables]
+        self.rows = 0
+        # Maps the monotonic timestamps to the wall clock.
+        self.wall_clock_offset = time.time() - time.monotonic()
+        self._capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.columns = []
+        for _, _, datatype in variables:
+            column = array(_ARRAY_TYPE_CODES[datatype.value.format_char])
+            column.frombytes(bytes(column.itemsize * capacity))
+            self.columns.append(column)
+
+    def append(self, timestamp, values):
+        if self.rows == self._capacity:
+            self._grow()
+        row = self.rows
+        self.timestamps[row] = timestamp
+        for column, value in zip(self.columns, values):
+            column[row] = value
+        self.rows += 1
+
+    def extend(self, samples):
+        """ Appends (timestamp, values) samples, as drained from a stream. """
+        if not samples:
+            return
+        timestamps, rows = zip(*samples)
+        start = self.rows
+        end = start + len(timestamps)
+        while end > self._capacity:
+            self._grow()
+        self.timestamps[start:end] = array('d', timestamps)
+        for column, values in zip(self.columns, zip(*rows)):
+            column[start:end] = array(column.typecode, values)
+        self.rows = end
+
+    def save(self, path):
+        """ Writes the recorded rows to `path`, replacing it atomically. """
+        path = pathlib.Path(path)
+        columns = [('timestamp', self.timestamps)]
+        columns.extend(zip(self.keys, self.columns))
+        header = json.dumps({
+            'rows': self.rows,
+            'byteorder': sys.byteorder,
+            'wall_clock_offset': self.wall_clock_offset,
+            'columns': [(name, column.typecode) for name, column in columns],
+        }).encode('utf-8')
+
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as file:
+            file.write(MAGIC)
+            file.write(_HEADER_SIZE.pack(len(header)))
+            file.write(header)
+            for _, column in columns:
+                file.write(memoryview(column)[:self.rows])
+        tmp_path.replace(path)
+
+    def _grow(self):
+        for column in (self.timestamps, *self.columns):
+            column.frombytes(bytes(column.itemsize * self._capacity))
+        self._capacity *= 2
+
+
+@dataclasses.dataclass
+class XCPRecording:
+    # Monotonic timestamps, add `wall_clock_offset` to get the wall clock.
+    timestamps: array
+    wall_clock_offset: float
+    # Variable name -> values at the timestamps.
+    columns: dict
+
+
+def load_recording(path):
+    """ Returns the series of a file written by XCPRecorder.save. """
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not an XCP recording.')
+        header_size, = _HEADER_SIZE.unpack(file.read(_HEADER_SIZE.size))
+        header = json.loads(file.read(header_size))
+        rows = header['rows']
+
+        columns = {}
+        for name, typecode in header['columns']:
+            column = array(typecode)
+            data = file.read(column.itemsize * rows)
+            if len(data) != column.itemsize * rows:
+                raise ValueError(f'{path} is truncated.')
+            column.frombytes(data)
+            if header['byteorder'] != sys.byteorder:
+                column.byteswap()
+            columns[name] = column
+
+    return XCPRecording(
+        timestamps=columns.pop('timestamp'),
+        wall_clock_offset=header['wall_clock_offset'],
+        columns=columns,
+    )
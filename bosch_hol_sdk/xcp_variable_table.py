@@ -0,0 +1,112 @@
+"""
+A compact table of the XCP variables of a device.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+from array import array
+import sys
+import typing
+
+from dspace.bosch_hol_sdk.xcpinterface import DataType
+
+# A data type is coded by the byte of its struct format character.
+DATA_TYPE_CODES = {
+    datatype: ord(datatype.value.format_char) for datatype in DataType
+}
+DATA_TYPES = {code: datatype for datatype, code in DATA_TYPE_CODES.items()}
+
+
+class Variable(typing.NamedTuple):
+    type: DataType
+    address: int
+
+
+class VariableEntry(typing.NamedTuple):
+    """ A variable of a table, with the interface of an enum member. """
+    name: str
+    value: Variable
+
+
+class XCPVariableTable:
+    """
+    The variables of a device, sorted by address.
+
+    Names, addresses and data type codes are held in parallel sequences, so
+    a table costs a few objects regardless of its size. Variables are only
+    materialized as VariableEntry objects when iterating the table.
+    """
+    def __init__(self, names, addresses, type_codes):
+        order = sorted(range(len(names)), key=addresses.__getitem__)
+        self.names = tuple(sys.intern(names[index]) for index in order)
+        self.addresses = array('Q', (addresses[index] for index in order))
+        self.type_codes = array('B', (type_codes[index] for index in order))
+        self._indices = {name: index for index, name in enumerate(self.names)}
+        self._selections = {}
+
+    @classmethod
+    def from_variables(cls, variables):
+        """ Creates a table from (name, address, datatype) tuples. """
+        names, addresses, types = zip(*variables) if variables else ((),) * 3
+        return cls(
+            names,
+            addresses,
+            [DATA_TYPE_CODES[datatype] for datatype in types],
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield self.entry(index)
+
+    def __contains__(self, name):
+        return name in self._indices
+
+    def __getitem__(self, name):
+        return self.entry(self._indices[name])
+
+    def index(self, name):
+        return self._indices[name]
+
+    def entry(self, index):
+        return VariableEntry(
+            self.names[index],
+            Variable(DATA_TYPES[self.type_codes[index]], self.addresses[index]),
+        )
+
+    def select(self, suffixes):
+        """
+        Returns the indices of the variables ending with one of `suffixes`.
+
+        The selection is computed once per set of suffixes.
+        """
+        suffixes = tuple(suffixes)
+        try:
+            return self._selections[suffixes]
+        except KeyError:
+            pass
+        selection = tuple(
+            index for index, name in enumerate(self.names)
+            if name.endswith(suffixes)
+        )
+        self._selections[suffixes] = selection
+        return selection
+
+    def read_variables(self, indices=None):
+        """
+        Returns (name, address, datatype) of the variables at `indices` (all
+        by default), as expected by XCPReadPlan and XCPDaqStream.
+        """
+        if indices is None:
+            indices = range(len(self.names))
+        return [
+            (
+                self.names[index],
+                self.addresses[index],
+                DATA_TYPES[self.type_codes[index]],
+            )
+            for index in indices
+        ]
@@ -5,10 +5,37 @@ A basic XCP interface to send commands and interpret responses.
     Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
     All rights reserved.
 """
+import asyncio
+import collections
+from concurrent import futures
+import dataclasses
 import enum
 import logging
+import operator
+import queue
 import socket
 import struct
+import threading
+import time
+
+# Unused bytes between two variables up to which they are still read as one
+# block, since a round trip costs more than reading a few extra bytes.
+XCP_READ_MAX_GAP = 128
+# Timeout of the socket operations.
+XCP_TIMEOUT = 2  # seconds.
+# Maximum size of a command/response packet guaranteed by every slave.
+XCP_MIN_MAX_CTO = 8
+# Maximum size of a data transfer packet guaranteed by every slave.
+XCP_MIN_MAX_DTO = 8
+# LEN and CTR of the XCP on Ethernet packet header.
+_XCP_HEADER = struct.Struct('<HH')
+XCP_MAX_PACKET_SIZE = 0xFFFF
+# Samples kept by a DAQ stream until they are drained.
+XCP_DAQ_MAX_SAMPLES = 10000
+# Delay after a failed connection attempt of a session, doubled after every
+# further failure up to the maximum.
+XCP_SESSION_RETRY_DELAY = 1  # seconds.
+XCP_SESSION_MAX_RETRY_DELAY = 30  # seconds.
 
 
 class XCPError(enum.IntEnum):
@@ -50,18 +77,46 @@ class XCPError(enum.IntEnum):
     ERR_VERIFY = 0x32
 
 
+class XCPCommandError(Exception):
+    def __init__(self, command, error_code):
+        super().__init__(f'{command} failed with {error_code.name}')
+        self.command = command
+        self.error_code = error_code
+
+
+class XCPSessionBusyError(Exception):
+    """ A previous asynchronous call of the session is still running. """
+
+
+class XCPSessionTimeoutError(asyncio.TimeoutError):
+    """
+    An asynchronous call of the session didn't finish in time.
+
+    Unlike a timeout of the socket, which is raised by the call itself (and
+    is the same builtin TimeoutError as asyncio.TimeoutError since Python
+    3.11).
+    """
+
+
 class _DataTypeImpl:
     def __init__(self, fmt):
-        self._fmt = f'<{fmt}'
+        self._struct = struct.Struct(f'<{fmt}')
 
     def to_bytes(self, value):
-        return struct.pack(self._fmt, value)
+        return self._struct.pack(value)
 
     def from_bytes(self, value):
-        return struct.unpack(self._fmt, value)[0]
+        return self._struct.unpack(value)[0]
+
+    def unpack_from(self, buffer, offset=0):
+        return self._struct.unpack_from(buffer, offset)[0]
+
+    @property
+    def format_char(self):
+        return self._struct.format[1:]
 
     def __len__(self):
-        return struct.calcsize(self._fmt)
+        return self._struct.size
 
 
 class DataType(enum.Enum):
@@ -93,8 +148,44 @@ class XCPResponseType(enum.IntEnum):
     SERVICE = 0xFC
 
 
+class XCPEventCode(enum.IntEnum):
+    # Slave starting in RESUME mode.
+    EV_RESUME_MODE = 0x00
+    # The DAQ configuration in non-volatile memory has been cleared.
+    EV_CLEAR_DAQ = 0x01
+    # The DAQ configuration has been stored into non-volatile memory.
+    EV_STORE_DAQ = 0x02
+    # The calibration data has been stored into non-volatile memory.
+    EV_STORE_CAL = 0x03
+    # Slave requesting to restart the time-out detection.
+    EV_CMD_PENDING = 0x05
+    # DAQ processor overload.
+    EV_DAQ_OVERLOAD = 0x06
+    # Session terminated by the slave device.
+    EV_SESSION_TERMINATED = 0x07
+    # Transfer of externally triggered timestamp.
+    EV_TIME_SYNC = 0x08
+    # Indication of a STIM timeout.
+    EV_STIM_TIMEOUT = 0x09
+    # Slave entering SLEEP mode.
+    EV_SLEEP = 0x0A
+    # Slave leaving SLEEP mode.
+    EV_WAKE_UP = 0x0B
+    # User-defined event.
+    EV_USER = 0xFE
+    # Transport layer specific event.
+    EV_TRANSPORT = 0xFF
+
+
+class XCPServiceCode(enum.IntEnum):
+    # Slave requesting to be reset.
+    SERV_RESET = 0x00
+    # Slave transferring a plain ASCII text.
+    SERV_TEXT = 0x01
+
+
 class XCPResponseBase:
-    def __new__(cls, data):
+    def __new__(cls, data, *args):
         resp_type = XCPResponseType(data[0])
         if resp_type == XCPResponseType.RESPONSE:
             obj = super().__new__(cls)
@@ -103,100 +194,681 @@ class XCPResponseBase:
         else:
             raise NotImplementedError(resp_type)
         obj.__type = resp_type
+        obj._data = data
         return obj
 
+    def __init__(self, data, *args):
+        pass
+
     @property
     def type(self):
         return self.__type
 
 
 class XCPResponseError(XCPResponseBase):
-    def __init__(self, data):
-        self._data = data
-
     @property
     def error_code(self):
         return XCPError(self._data[1])
 
 
+class XCPResponseData(XCPResponseBase):
+    """ A response carrying the requested bytes after the PID. """
+    @property
+    def data(self):
+        return memoryview(self._data)[1:]
+
+
+class XCPResponseValue(XCPResponseBase):
+    """ A response carrying a value of a known data type after the PID. """
+    def __init__(self, data, datatype):
+        self._datatype = datatype
+
+    @property
+    def value(self):
+        return self._datatype.value.unpack_from(self._data, 1)
+
+
 class XCPCommandBase:
-    def __init__(self, data):
-        self._data = data
+    # The packet layout of the command and the response type.
+    FORMAT = None
+    Response = XCPResponseBase
+
+    def __init__(self, *values):
+        self._values = values
 
     @property
     def size(self):
-        return DataType.UWORD.value.to_bytes(len(self._data))
+        return self.FORMAT.size
 
     def serialize(self):
-        return bytes(self._data)
+        return self.FORMAT.pack(*self._values)
+
+    def pack_into(self, buffer, offset):
+        self.FORMAT.pack_into(buffer, offset, *self._values)
+
+    def response(self, data):
+        return self.Response(data)
 
 
 class XCPCommandConnect(XCPCommandBase):
+    FORMAT = struct.Struct('<BB')
+
     def __init__(self):
-        super().__init__([0xFF, 0x00])
+        super().__init__(0xFF, 0x00)
 
     class Response(XCPResponseBase):
-        size = 8
-        # We don't care much about the content of the response at the moment,
-        # just that it's a response, not an error.
+        _MAX_DTO = struct.Struct('<H')
+
+        @property
+        def max_cto(self):
+            return self._data[3]
+
+        @property
+        def max_dto(self):
+            return self._MAX_DTO.unpack_from(self._data, 4)[0]
+
+        @property
+        def block_mode(self):
+            # SLAVE_BLOCK_MODE bit of COMM_MODE_BASIC.
+            return bool(self._data[2] & 0x40)
 
 
 class XCPCommandDisconnect(XCPCommandBase):
-    def __init__(self):
-        super().__init__([0xFE])
+    FORMAT = struct.Struct('<B')
 
-    class Response(XCPResponseBase):
-        size = 1
+    def __init__(self):
+        super().__init__(0xFE)
 
 
 class XCPCommandShortUpload(XCPCommandBase):
+    FORMAT = struct.Struct('<BBBBL')
+    Response = XCPResponseValue
+
     def __init__(self, address, datatype):
         super().__init__(
-            [0xF4,
-             len(datatype.value),
-             0,
-             XCPAddressExtension.FREE,
-             *list(DataType.ULONG.value.to_bytes(address))
-             ],
+            0xF4,
+            len(datatype.value),
+            0,
+            XCPAddressExtension.FREE,
+            address,
         )
+        self._datatype = datatype
+
+    def response(self, data):
+        return self.Response(data, self._datatype)
+
+
+class XCPCommandSetMta(XCPCommandBase):
+    FORMAT = struct.Struct('<BBBBL')
+
+    def __init__(self, address):
+        super().__init__(0xF6, 0, 0, XCPAddressExtension.FREE, address)
+
+
+class XCPCommandUpload(XCPCommandBase):
+    FORMAT = struct.Struct('<BB')
+    Response = XCPResponseData
+
+    def __init__(self, num_bytes):
+        super().__init__(0xF5, num_bytes)
+
+
+class XCPCommandGetStatus(XCPCommandBase):
+    FORMAT = struct.Struct('<B')
+
+    def __init__(self):
+        super().__init__(0xFD)
+
+
+class XCPCommandFreeDaq(XCPCommandBase):
+    FORMAT = struct.Struct('<B')
+
+    def __init__(self):
+        super().__init__(0xD6)
+
+
+class XCPCommandAllocDaq(XCPCommandBase):
+    FORMAT = struct.Struct('<BBH')
+
+    def __init__(self, daq_count):
+        super().__init__(0xD5, 0, daq_count)
+
+
+class XCPCommandAllocOdt(XCPCommandBase):
+    FORMAT = struct.Struct('<BBHB')
+
+    def __init__(self, daq_list, odt_count):
+        super().__init__(0xD4, 0, daq_list, odt_count)
+
+
+class XCPCommandAllocOdtEntry(XCPCommandBase):
+    FORMAT = struct.Struct('<BBHBB')
+
+    def __init__(self, daq_list, odt, entry_count):
+        super().__init__(0xD3, 0, daq_list, odt, entry_count)
+
+
+class XCPCommandSetDaqPtr(XCPCommandBase):
+    FORMAT = struct.Struct('<BBHBB')
+
+    def __init__(self, daq_list, odt, entry):
+        super().__init__(0xE2, 0, daq_list, odt, entry)
+
+
+class XCPCommandWriteDaq(XCPCommandBase):
+    FORMAT = struct.Struct('<BBBBL')
+
+    def __init__(self, address, datatype):
+        super().__init__(
+            0xE1,
+            # No bit offset, the whole element is sampled.
+            0xFF,
+            len(datatype.value),
+            XCPAddressExtension.FREE,
+            address,
+        )
+
+
+class XCPCommandSetDaqListMode(XCPCommandBase):
+    FORMAT = struct.Struct('<BBHHBB')
+
+    def __init__(self, daq_list, event_channel, prescaler=1, priority=0):
+        super().__init__(
+            0xE0,
+            # Slave to master, without timestamp.
+            0x00,
+            daq_list,
+            event_channel,
+            prescaler,
+            priority,
+        )
+
+
+class XCPDaqListMode(enum.IntEnum):
+    STOP = 0
+    START = 1
+    SELECT = 2
+
+
+class XCPCommandStartStopDaqList(XCPCommandBase):
+    FORMAT = struct.Struct('<BBH')
+
+    def __init__(self, mode, daq_list):
+        super().__init__(0xDE, mode, daq_list)
+
+    class Response(XCPResponseBase):
+        @property
+        def first_pid(self):
+            return self._data[1]
+
 
-        class _Response(XCPResponseBase):
-            size = 1 + len(datatype.value)
+class XCPSynchMode(enum.IntEnum):
+    STOP_ALL = 0
+    START_SELECTED = 1
+    STOP_SELECTED = 2
 
-            def __init__(self, data):
-                super().__init__()
-                self._data = data
 
-            @property
-            def value(self):
-                return datatype.value.from_bytes(self._data[1:])
+class XCPCommandStartStopSynch(XCPCommandBase):
+    FORMAT = struct.Struct('<BB')
 
-        self.Response = _Response
+    def __init__(self, mode):
+        super().__init__(0xDD, mode)
 
 
 class XCPCommand(enum.Enum):
     CONNECT = XCPCommandConnect
     DISCONNECT = XCPCommandDisconnect
+    GET_STATUS = XCPCommandGetStatus
     SHORT_UPLOAD = XCPCommandShortUpload
+    SET_MTA = XCPCommandSetMta
+    UPLOAD = XCPCommandUpload
+    FREE_DAQ = XCPCommandFreeDaq
+    ALLOC_DAQ = XCPCommandAllocDaq
+    ALLOC_ODT = XCPCommandAllocOdt
+    ALLOC_ODT_ENTRY = XCPCommandAllocOdtEntry
+    SET_DAQ_PTR = XCPCommandSetDaqPtr
+    WRITE_DAQ = XCPCommandWriteDaq
+    SET_DAQ_LIST_MODE = XCPCommandSetDaqListMode
+    START_STOP_DAQ_LIST = XCPCommandStartStopDaqList
+    START_STOP_SYNCH = XCPCommandStartStopSynch
+
+
+@dataclasses.dataclass
+class XCPReadBlock:
+    address: int
+    size: int = 0
+    # (key, offset in the block, datatype) of each variable in the block.
+    variables: list = dataclasses.field(default_factory=list)
+
+
+class XCPReadPlan:
+    """
+    Reads a set of variables with as few contiguous uploads as possible.
+
+    `variables` is an iterable of (key, address, datatype). Variables that are
+    at most `max_gap` bytes apart are merged into one block, which is read with
+    a single SET_MTA followed by as many UPLOADs as needed.
+    """
+    def __init__(self, variables, max_gap=XCP_READ_MAX_GAP):
+        self.variables = list(variables)
+        self.blocks = []
+        block = None
+        for key, address, datatype in sorted(
+            self.variables,
+            key=operator.itemgetter(1),
+        ):
+            end = address + len(datatype.value)
+            if block is None or address - block.address - block.size > max_gap:
+                block = XCPReadBlock(address)
+                self.blocks.append(block)
+            block.size = max(block.size, end - block.address)
+            block.variables.append((key, address - block.address, datatype))
+
+    def read(self, communicator):
+        """
+        Returns the values of the variables by their key.
+
+        A block that can not be uploaded (e.g. because the slave does not
+        implement UPLOAD) is read variable by variable instead. Variables that
+        can not be read at all are missing from the result.
+        """
+        values = {}
+        for block in self.blocks:
+            try:
+                data = communicator.upload(block.address, block.size)
+            except XCPCommandError:
+                communicator.logger.debug(
+                    'Failed to upload %d bytes at 0x%08X, reading the '
+                    'variables one by one.', block.size, block.address,
+                    exc_info=True,
+                )
+                self._read_variables(communicator, block, values)
+                continue
+
+            for key, offset, datatype in block.variables:
+                values[key] = datatype.value.unpack_from(data, offset)
+        return values
+
+    @staticmethod
+    def _read_variables(communicator, block, values):
+        for key, offset, datatype in block.variables:
+            resp = communicator.send(
+                XCPCommand.SHORT_UPLOAD,
+                block.address + offset,
+                datatype,
+            )
+            if resp.type != XCPResponseType.RESPONSE:
+                communicator.logger.warning(
+                    'Failed to read XCP variable %s: %s',
+                    key, resp.error_code.name,
+                )
+            else:
+                values[key] = resp.value
+
+
+class XCPDaqStream:
+    """
+    Streams a set of variables from the slave with a dynamic DAQ list.
+
+    `variables` is an iterable of (key, address, datatype). The variables are
+    sampled by the slave on every `prescaler`-th occurrence of
+    `event_channel` and each complete sample is appended, with the monotonic
+    time it was received, to the bounded `samples` buffer.
+    """
+    DAQ_LIST = 0
+
+    def __init__(
+        self,
+        variables,
+        event_channel=0,
+        prescaler=1,
+        max_samples=XCP_DAQ_MAX_SAMPLES,
+    ):
+        self.variables = list(variables)
+        self.keys = [key for key, _, _ in self.variables]
+        self.samples = collections.deque(maxlen=max_samples)
+        self._event_channel = event_channel
+        self._prescaler = prescaler
+        self._communicator = None
+        self._first_pid = None
+        # (first variable index, variable count, struct) of each ODT.
+        self._odts = []
+        self._values = [None] * len(self.variables)
+
+    @property
+    def communicator(self):
+        return self._communicator
+
+    def _layout_odts(self, max_odt_size):
+        odts = []
+        odt_size = max_odt_size
+        for index, (key, _, datatype) in enumerate(self.variables):
+            size = len(datatype.value)
+            if size > max_odt_size:
+                raise ValueError(
+                    f'{key} does not fit into an ODT of {max_odt_size} bytes.'
+                )
+            if odt_size + size > max_odt_size:
+                odts.append([index, '<'])
+                odt_size = 0
+            odts[-1][1] += datatype.value.format_char
+            odt_size += size
+        return [
+            (first, len(fmt) - 1, struct.Struct(fmt)) for first, fmt in odts
+        ]
+
+    def start(self, communicator):
+        """ Configures the DAQ list on the slave and starts sampling. """
+        # One byte of every DTO is used by the PID.
+        self._odts = self._layout_odts(communicator.max_dto - 1)
+        self._communicator = communicator
+
+        communicator.execute(XCPCommand.FREE_DAQ)
+        communicator.execute(XCPCommand.ALLOC_DAQ, 1)
+        communicator.execute(XCPCommand.ALLOC_ODT, self.DAQ_LIST, len(self._odts))
+        for odt, (_, count, _) in enumerate(self._odts):
+            communicator.execute(
+                XCPCommand.ALLOC_ODT_ENTRY, self.DAQ_LIST, odt, count,
+            )
+        for odt, (first, count, _) in enumerate(self._odts):
+            # The DAQ pointer is post-incremented by every WRITE_DAQ.
+            communicator.execute(XCPCommand.SET_DAQ_PTR, self.DAQ_LIST, odt, 0)
+            for _, address, datatype in self.variables[first: first + count]:
+                communicator.execute(XCPCommand.WRITE_DAQ, address, datatype)
+        communicator.execute(
+            XCPCommand.SET_DAQ_LIST_MODE,
+            self.DAQ_LIST,
+            self._event_channel,
+            self._prescaler,
+        )
+        resp = communicator.execute(
+            XCPCommand.START_STOP_DAQ_LIST,
+            XCPDaqListMode.SELECT,
+            self.DAQ_LIST,
+        )
+        self._first_pid = resp.first_pid
+
+        communicator.start_receiving(self._on_dto)
+        communicator.execute(
+            XCPCommand.START_STOP_SYNCH,
+            XCPSynchMode.START_SELECTED,
+        )
+
+    def stop(self):
+        """ Stops sampling and releases the DAQ list on the slave. """
+        communicator = self._communicator
+        if communicator is None:
+            return
+        self._communicator = None
+        try:
+            communicator.execute(
+                XCPCommand.START_STOP_SYNCH,
+                XCPSynchMode.STOP_ALL,
+            )
+        finally:
+            communicator.stop_receiving()
+        communicator.execute(XCPCommand.FREE_DAQ)
+
+    def drain(self):
+        """ Returns and removes the buffered (timestamp, values) samples. """
+        samples = []
+        while self.samples:
+            samples.append(self.samples.popleft())
+        return samples
+
+    def _on_dto(self, packet):
+        odt = packet[0] - self._first_pid
+        if not 0 <= odt < len(self._odts):
+            return
+        first, count, odt_struct = self._odts[odt]
+        self._values[first: first + count] = odt_struct.unpack_from(packet, 1)
+        if odt == len(self._odts) - 1:
+            self.samples.append((time.monotonic(), tuple(self._values)))
+
+
+class XCPSessionState(enum.Enum):
+    CONNECTED = enum.auto()
+    DISCONNECTED = enum.auto()
+    # The last connection attempt failed and the next one is delayed.
+    RETRY_WAIT = enum.auto()
+
+
+class XCPSession:
+    """
+    A long-lived connection to one slave, shared by all of its users.
+
+    Commands are serialized with a lock. A connection that breaks is dropped
+    and transparently re-established, waiting between failed connection
+    attempts with an exponential backoff.
+    """
+    def __init__(
+        self,
+        ip,
+        port,
+        logger=None,
+        retry_delay=XCP_SESSION_RETRY_DELAY,
+        max_retry_delay=XCP_SESSION_MAX_RETRY_DELAY,
+        timeout=XCP_TIMEOUT,
+    ):
+        self._interface = XCPInterface(ip, port, logger, timeout)
+        self._logger = self._interface._logger
+        self._ip = ip
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._lock = threading.RLock()
+        self._communicator = None
+        self._executor = None
+        # The last call made by run_async.
+        self._call = None
+        self._next_attempt = 0
+        self.failures = 0
+        self.last_error = None
+        # Incremented for every new connection. A slave that rebooted breaks
+        # the connection, so an unchanged id means it was up all along.
+        self.connection_id = 0
+
+    @property
+    def communicator(self):
+        return self._communicator
+
+    @property
+    def state(self):
+        if self._communicator is not None:
+            return XCPSessionState.CONNECTED
+        if time.monotonic() < self._next_attempt:
+            return XCPSessionState.RETRY_WAIT
+        return XCPSessionState.DISCONNECTED
+
+    def run(self, function, *args, **kwargs):
+        """
+        Calls `function(communicator, *args, **kwargs)` on the connection.
+
+        If an already established connection turns out to be broken, the
+        call is repeated once on a new connection.
+        """
+        with self._lock:
+            while True:
+                reused = self._communicator is not None
+                communicator = self._connect()
+                try:
+                    return function(communicator, *args, **kwargs)
+                except (OSError, queue.Empty) as exc:
+                    self._drop(exc)
+                    if not reused:
+                        raise
+                    self._logger.info(
+                        'XCP connection to %s lost (%s), reconnecting.',
+                        self._ip, exc,
+                    )
+
+    def probe(self):
+        """
+        Sends a GET_STATUS, connecting right away even during a backoff.
+
+        Meant for readiness checks which retry on their own schedule and
+        would otherwise fail without a connection attempt while a backoff
+        of up to `max_retry_delay` seconds is running.
+        """
+        with self._lock:
+            self._next_attempt = 0
+            return self.run(
+                lambda communicator: communicator.execute(
+                    XCPCommand.GET_STATUS
+                )
+            )
+
+    async def run_async(self, function, *args, timeout=None, **kwargs):
+        """
+        Awaitable variant of `run`.
+
+        The call is made in a worker thread of the session, so a slow slave
+        only delays the calls to itself. After `timeout` seconds,
+        XCPSessionTimeoutError is raised while the call itself still finishes
+        in the background. Until it did, XCPSessionBusyError is raised instead of
+        queueing further calls behind it.
+        """
+        if self._call is not None and not self._call.done():
+            raise XCPSessionBusyError(
+                f'A previous call to {self._ip} is still running.'
+            )
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=self._logger.name,
+            )
+        self._call = self._executor.submit(
+            self.run, function, *args, **kwargs,
+        )
+        call = asyncio.wrap_future(self._call)
+        # Unlike wait_for, wait tells the timeout apart from a TimeoutError
+        # raised by the call.
+        done, _ = await asyncio.wait({call}, timeout=timeout)
+        if not done:
+            call.cancel()
+            raise XCPSessionTimeoutError(
+                f'The call to {self._ip} took longer than {timeout} seconds.'
+            )
+        return call.result()
+
+    def close(self):
+        with self._lock:
+            if self._communicator is not None:
+                try:
+                    self._communicator.send(XCPCommand.DISCONNECT)
+                except Exception:
+                    pass
+                self._drop(None)
+            # Whoever closes the session expects the slave to be gone
+            # (e.g. rebooting), so the next use connects right away.
+            self._next_attempt = 0
+            self.failures = 0
+
+    def _connect(self):
+        if self._communicator is not None:
+            return self._communicator
+
+        if time.monotonic() < self._next_attempt:
+            raise ConnectionError(
+                f'Not reconnecting to {self._ip} yet after '
+                f'{self.failures} failures: {self.last_error}'
+            )
+
+        communicator = None
+        try:
+            communicator = self._interface.open(keepalive=True)
+            communicator.execute(XCPCommand.CONNECT)
+        except (OSError, XCPCommandError) as exc:
+            if communicator is not None:
+                communicator.close()
+            self.failures += 1
+            self.last_error = exc
+            self._next_attempt = time.monotonic() + min(
+                self._retry_delay * 2 ** (self.failures - 1),
+                self._max_retry_delay,
+            )
+            raise
+
+        self._logger.debug('XCP session to %s connected.', self._ip)
+        self._communicator = communicator
+        self.failures = 0
+        self.connection_id += 1
+        return communicator
+
+    def _drop(self, error):
+        if error is not None:
+            self.last_error = error
+        if self._communicator is not None:
+            self._communicator.close()
+            self._communicator = None
+
+
+# Event loop of run_concurrently, running on a thread of its own.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name='xcp_session_loop',
+                daemon=True,
+            ).start()
+        return _loop
+
+
+def run_concurrently(calls, timeout=None):
+    """
+    Runs (session, function) calls concurrently on their sessions.
+
+    Returns the results in the order of `calls`. A call that failed returns
+    its exception instead and one that took longer than `timeout` seconds
+    XCPSessionTimeoutError, so the total time is that of the slowest session
+    rather than the sum of all of them. A session whose call of a previous
+    run is still running returns XCPSessionBusyError.
+    """
+    async def run_all():
+        return await asyncio.gather(
+            *(
+                session.run_async(function, timeout=timeout)
+                for session, function in calls
+            ),
+            return_exceptions=True,
+        )
+
+    return asyncio.run_coroutine_threadsafe(run_all(), _get_loop()).result()
 
 
 class XCPInterface:
-    def __init__(self, ip, port, logger=None):
+    def __init__(self, ip, port, logger=None, timeout=XCP_TIMEOUT):
         if logger is None:
             logger = logging.getLogger()
         self._logger = logger.getChild(f'{self.__class__.__name__}')
         self._ip = ip
         self._port = port
+        self._timeout = timeout
         self._communicator = None
 
-    def __enter__(self):
+    def open(self, keepalive=False):
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        sock.connect((self._ip, self._port))
-        self._communicator = self._Communicator(
+        sock.settimeout(self._timeout)
+        if keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        try:
+            sock.connect((self._ip, self._port))
+        except OSError:
+            sock.close()
+            raise
+        return self._Communicator(
             sock,
             self._logger.getChild(self._ip.replace(".", "_")),
         )
+
+    def __enter__(self):
+        self._communicator = self.open()
         return self._communicator
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -208,17 +880,37 @@ class XCPInterface:
             self._socket = socket
             self._logger = logger
             self._counter = 0
+            self._max_cto = XCP_MIN_MAX_CTO
+            self._max_dto = XCP_MIN_MAX_DTO
+            self._block_mode = False
+            self._responses = queue.Queue()
+            self._receiver = None
+            self._receiving = False
+            # Commands are packed into and packets received into preallocated
+            # buffers. `_received` is the number of bytes of the current
+            # packet in the receive buffer, so a receive interrupted by a
+            # timeout continues where it stopped.
+            self._send_buffer = bytearray(_XCP_HEADER.size + 0xFF)
+            self._send_view = memoryview(self._send_buffer)
+            self._receive_view = memoryview(
+                bytearray(_XCP_HEADER.size + XCP_MAX_PACKET_SIZE)
+            )
+            self._received = 0
 
         def __del__(self):
             self.close()
 
         def close(self):
+            self._receiving = False
             self._socket.close()
 
         @property
-        def counter(self):
-            self._counter += 1
-            return DataType.UWORD.value.to_bytes(self._counter)
+        def logger(self):
+            return self._logger
+
+        @property
+        def max_dto(self):
+            return self._max_dto
 
         def send(self, cmd, *args, **kwargs):
             if isinstance(cmd, XCPCommand):
@@ -226,11 +918,182 @@ class XCPInterface:
             elif not isinstance(cmd, XCPCommandBase):
                 raise TypeError(cmd)
 
-            cmd_bytes = cmd.size + self.counter + cmd.serialize()
-            self._logger.debug('Sending command: %s', cmd_bytes)
-            self._socket.send(cmd_bytes)
+            self._counter = (self._counter + 1) & 0xFFFF
+            size = _XCP_HEADER.size + cmd.size
+            _XCP_HEADER.pack_into(self._send_buffer, 0, cmd.size, self._counter)
+            cmd.pack_into(self._send_buffer, _XCP_HEADER.size)
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    'Sending command: %s',
+                    bytes(self._send_view[:size]),
+                )
+            self._socket.sendall(self._send_view[:size])
+
+            response = cmd.response(self._receive())
+            if (isinstance(cmd, XCPCommandConnect)
+                    and response.type == XCPResponseType.RESPONSE):
+                self._max_cto = response.max_cto
+                self._max_dto = response.max_dto
+                self._block_mode = response.block_mode
+            return response
+
+        def execute(self, cmd, *args, **kwargs):
+            """ Sends a command and raises XCPCommandError on errors. """
+            return self._check(cmd, self.send(cmd, *args, **kwargs))
+
+        def start_receiving(self, dto_handler):
+            """
+            Receives all packets in a background thread from now on.
+
+            Data transfer packets are passed to `dto_handler` while responses
+            are still returned by `send`, events and service requests are
+            logged. The DTO passed to the handler is a view of the receive
+            buffer, only valid during the call.
+            """
+            self._receiving = True
+            self._receiver = threading.Thread(
+                target=self._receive_packets,
+                args=(dto_handler,),
+                name=f'{self._logger.name}.receiver',
+                daemon=True,
+            )
+            self._receiver.start()
+
+        def stop_receiving(self):
+            if self._receiver is None:
+                return
+            self._receiving = False
+            # The receiver thread stops after the next response, so one is
+            # requested to stop it without waiting for a timeout.
+            try:
+                self.send(XCPCommand.GET_STATUS)
+            finally:
+                self._receiver.join()
+                self._receiver = None
+
+        def _receive_packets(self, dto_handler):
+            while True:
+                try:
+                    packet = self._receive_packet()
+                except socket.timeout:
+                    if not self._receiving:
+                        break
+                    continue
+                except OSError:
+                    if self._receiving:
+                        self._logger.exception('Receiving XCP packets failed.')
+                    break
+
+                if packet[0] >= XCPResponseType.ERROR:
+                    self._responses.put(bytes(packet))
+                    if not self._receiving:
+                        break
+                elif packet[0] >= XCPResponseType.SERVICE:
+                    self._log_request(packet)
+                else:
+                    try:
+                        dto_handler(packet)
+                    except Exception:
+                        self._logger.exception('Failed to handle a DTO.')
+
+        def upload(self, address, size):
+            """ Reads `size` bytes of the slave memory at `address`. """
+            self.execute(XCPCommand.SET_MTA, address)
+
+            # The MTA is post-incremented by every UPLOAD, so the following
+            # uploads continue where the previous ones stopped.
+            max_chunk = 0xFF if self._block_mode else self._max_cto - 1
+            data = bytearray(size)
+            offset = 0
+            while offset < size:
+                end = min(size, offset + max_chunk)
+                cmd = XCPCommandUpload(end - offset)
+                resp = self._check(XCPCommand.UPLOAD, self.send(cmd))
+                # In block mode, the slave sends the data in as many response
+                # packets as needed.
+                while True:
+                    received = resp.data[:end - offset]
+                    data[offset: offset + len(received)] = received
+                    offset += len(received)
+                    if offset >= end:
+                        break
+                    resp = self._check(
+                        XCPCommand.UPLOAD,
+                        cmd.response(self._receive()),
+                    )
+            return data
+
+        @staticmethod
+        def _check(command, response):
+            if response.type != XCPResponseType.RESPONSE:
+                raise XCPCommandError(command, response.error_code)
+            return response
+
+        def _receive(self):
+            if self._receiver is not None:
+                return self._responses.get(timeout=self._socket.gettimeout())
+            while True:
+                packet = self._receive_packet()
+                if packet[0] >= XCPResponseType.ERROR:
+                    return bytes(packet)
+                if packet[0] >= XCPResponseType.SERVICE:
+                    self._log_request(packet)
+                else:
+                    self._logger.debug('Dropping a DTO, no DAQ is running.')
+
+        def _log_request(self, packet):
+            """ Logs an event or a service request packet of the slave. """
+            if packet[0] == XCPResponseType.EVENT:
+                try:
+                    code = XCPEventCode(packet[1])
+                except (IndexError, ValueError):
+                    self._logger.warning(f'Unknown XCP event: {bytes(packet)}')
+                    return
+                level = logging.INFO
+                if code in (
+                        XCPEventCode.EV_DAQ_OVERLOAD,
+                        XCPEventCode.EV_SESSION_TERMINATED):
+                    level = logging.WARNING
+                self._logger.log(
+                    level,
+                    f'XCP event {code.name}: {bytes(packet[2:])}',
+                )
+                return
+
+            try:
+                code = XCPServiceCode(packet[1])
+            except (IndexError, ValueError):
+                self._logger.warning(
+                    f'Unknown XCP service request: {bytes(packet)}'
+                )
+                return
+            if code == XCPServiceCode.SERV_TEXT:
+                text = bytes(packet[2:]).split(b'\0', 1)[0]
+                self._logger.info(
+                    f'XCP slave text: {text.decode("ascii", "replace")}'
+                )
+            else:
+                self._logger.warning(f'XCP service request {code.name}.')
+
+        def _receive_packet(self):
+            """ Returns a view of the next packet in the receive buffer. """
+            self._receive_until(_XCP_HEADER.size)
+            packet_size, _ = _XCP_HEADER.unpack_from(self._receive_view)
+            end = _XCP_HEADER.size + packet_size
+            self._receive_until(end)
+            self._received = 0
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    'Received response: %s',
+                    bytes(self._receive_view[:end]),
+                )
+            return self._receive_view[_XCP_HEADER.size:end]
 
-            response_bytes = self._socket.recv(cmd.Response.size + 4)
-            self._logger.debug('Received response: %s', response_bytes)
-            response_size = DataType.UWORD.value.from_bytes(response_bytes[0:2])
-            return cmd.Response(response_bytes[4: 4 + response_size])
+        def _receive_until(self, size):
+            while self._received < size:
+                received = self._socket.recv_into(
+                    self._receive_view[self._received:size]
+                )
+                if not received:
+                    raise ConnectionError('XCP connection closed by the slave')
+                self._received += received
@@ -0,0 +1,430 @@
+"""
+A local XCP on TCP slave, standing in for an ESI unit in tests and benchmarks.
+
+The simulator serves the memory layout of an EsiInfo: the version string at
+its address and the variables of its table, initially zero. It implements the
+commands used by XCPInterface, including block mode uploads and DAQ, and can
+inject latency, lost packets and error responses.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import argparse
+import logging
+import random
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+from dspace.bosch_hol_sdk import esi_xcp_variables
+from dspace.bosch_hol_sdk.xcpinterface import (
+    XCPCommand, XCPDaqListMode, XCPError, XCPResponseType, XCPSynchMode,
+)
+
+XCP_SIMULATOR_PORT = 30303
+# Period of the DAQ event of the simulated slave.
+XCP_SIMULATOR_DAQ_PERIOD = 0.01  # seconds.
+
+_PAGE_SIZE = 0x1000
+_HEADER = struct.Struct('<HH')
+_PIDS = {
+    0xFF: XCPCommand.CONNECT,
+    0xFE: XCPCommand.DISCONNECT,
+    0xFD: XCPCommand.GET_STATUS,
+    0xF4: XCPCommand.SHORT_UPLOAD,
+    0xF6: XCPCommand.SET_MTA,
+    0xF5: XCPCommand.UPLOAD,
+    0xD6: XCPCommand.FREE_DAQ,
+    0xD5: XCPCommand.ALLOC_DAQ,
+    0xD4: XCPCommand.ALLOC_ODT,
+    0xD3: XCPCommand.ALLOC_ODT_ENTRY,
+    0xE2: XCPCommand.SET_DAQ_PTR,
+    0xE1: XCPCommand.WRITE_DAQ,
+    0xE0: XCPCommand.SET_DAQ_LIST_MODE,
+    0xDE: XCPCommand.START_STOP_DAQ_LIST,
+    0xDD: XCPCommand.START_STOP_SYNCH,
+}
+
+
+class SimulatedMemory:
+    """ A sparse, zero initialized memory, allocated in pages on write. """
+    def __init__(self):
+        self._pages = {}
+
+    def read(self, address, size):
+        data = bytearray(size)
+        offset = 0
+        while offset < size:
+            page, start = divmod(address + offset, _PAGE_SIZE)
+            count = min(size - offset, _PAGE_SIZE - start)
+            if page in self._pages:
+                data[offset: offset + count] = \
+                    self._pages[page][start: start + count]
+            offset += count
+        return data
+
+    def write(self, address, data):
+        offset = 0
+        while offset < len(data):
+            page, start = divmod(address + offset, _PAGE_SIZE)
+            count = min(len(data) - offset, _PAGE_SIZE - start)
+            if page not in self._pages:
+                self._pages[page] = bytearray(_PAGE_SIZE)
+            self._pages[page][start: start + count] = \
+                data[offset: offset + count]
+            offset += count
+
+
+class XCPSlaveSimulator:
+    """
+    Serves a simulated slave on `host`:`port` (a free port by default).
+
+    The fault injection attributes can be changed while the simulator runs:
+    `latency` seconds are waited before every response, a packet (response or
+    DTO) is dropped with the probability `packet_loss` and a command listed in
+    `errors` (XCPCommand: XCPError) is answered with that error.
+    """
+    def __init__(
+        self,
+        esi_info=None,
+        host='127.0.0.1',
+        port=0,
+        max_cto=0xFF,
+        max_dto=0x5DC,
+        block_mode=True,
+        latency=0,
+        packet_loss=0,
+        errors=None,
+        daq_period=XCP_SIMULATOR_DAQ_PERIOD,
+        seed=None,
+        logger=None,
+    ):
+        if logger is None:
+            logger = logging.getLogger()
+        self._logger = logger.getChild(self.__class__.__name__)
+        self.esi_info = esi_info
+        self.max_cto = max_cto
+        self.max_dto = max_dto
+        self.block_mode = block_mode
+        self.latency = latency
+        self.packet_loss = packet_loss
+        self.errors = dict(errors or {})
+        self.daq_period = daq_period
+        self.commands = 0
+        self.memory = SimulatedMemory()
+        self._random = random.Random(seed)
+        self._connections = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+        if esi_info is not None:
+            self.memory.write(
+                esi_info.version_address,
+                esi_info.version.encode('ascii'),
+            )
+
+        self._server = socketserver.ThreadingTCPServer(
+            (host, port),
+            _XCPConnectionHandler,
+            bind_and_activate=False,
+        )
+        self._server.allow_reuse_address = True
+        self._server.daemon_threads = True
+        self._server.simulator = self
+        self._server.server_bind()
+        self._server.server_activate()
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def write_variable(self, name, value):
+        """ Sets the value of a variable of the ESI table. """
+        variable = self.esi_info.variables[name].value
+        self.memory.write(variable.address, variable.type.value.to_bytes(value))
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name=self._logger.name,
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """ Stops serving and drops the open connections, like a reboot. """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self.drop_connections()
+
+    def drop_connections(self):
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            connection.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _lose_packet(self):
+        return self.packet_loss and self._random.random() < self.packet_loss
+
+
+class _XCPConnectionHandler(socketserver.StreamRequestHandler):
+    """ The state of the slave for one master connection. """
+    def setup(self):
+        super().setup()
+        # Block mode responses and DTOs are sent back to back.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.simulator = self.server.simulator
+        self._send_lock = threading.Lock()
+        self._counter = 0
+        self._mta = 0
+        self._daq_lists = []
+        self._daq_pointer = None
+        self._selected = set()
+        self._running = set()
+        self._daq_thread = None
+        with self.simulator._lock:
+            self.simulator._connections.add(self)
+
+    def finish(self):
+        self._running.clear()
+        with self.simulator._lock:
+            self.simulator._connections.discard(self)
+        try:
+            super().finish()
+        except OSError:
+            pass
+
+    def close(self):
+        self._running.clear()
+        # Wakes up the handler blocked in receiving.
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.connection.close()
+
+    def handle(self):
+        while True:
+            try:
+                header = self.rfile.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                size, _ = _HEADER.unpack(header)
+                packet = self.rfile.read(size)
+                if len(packet) < size:
+                    break
+                self.simulator.commands += 1
+                self._handle_command(packet)
+            except OSError:
+                break
+
+    def _send(self, payload):
+        if self.simulator._lose_packet():
+            return
+        with self._send_lock:
+            self._counter = (self._counter + 1) & 0xFFFF
+            self.connection.sendall(
+                _HEADER.pack(len(payload), self._counter) + bytes(payload)
+            )
+
+    def _respond(self, *payload):
+        self._send(bytes((XCPResponseType.RESPONSE, *payload)))
+
+    def _error(self, error):
+        self._send(bytes((XCPResponseType.ERROR, error)))
+
+    def _handle_command(self, packet):
+        command = _PIDS.get(packet[0])
+        if self.simulator.latency:
+            time.sleep(self.simulator.latency)
+        if command is None:
+            self._error(XCPError.ERR_CMD_UNKNOWN)
+            return
+        error = self.simulator.errors.get(command)
+        if error is not None:
+            self._error(error)
+            return
+
+        try:
+            handler = getattr(self, f'_handle_{command.name.lower()}')
+            handler(packet)
+        except (struct.error, IndexError):
+            self._error(XCPError.ERR_CMD_SYNTAX)
+
+    def _handle_connect(self, packet):
+        simulator = self.simulator
+        self._respond(
+            # Resources: DAQ.
+            0x04,
+            # Communication mode: little endian, byte granularity.
+            0x40 if simulator.block_mode else 0x00,
+            simulator.max_cto,
+            *struct.pack('<H', simulator.max_dto),
+            # Protocol and transport layer versions.
+            0x01,
+            0x01,
+        )
+
+    def _handle_disconnect(self, packet):
+        self._stop_daq()
+        self._respond()
+
+    def _handle_get_status(self, packet):
+        self._respond(0x40 if self._running else 0x00, 0, 0, 0, 0)
+
+    def _handle_short_upload(self, packet):
+        _, size, _, _, address = struct.unpack_from('<BBBBL', packet)
+        if size > self.simulator.max_cto - 1:
+            self._error(XCPError.ERR_OUT_OF_RANGE)
+            return
+        self._respond(*self.simulator.memory.read(address, size))
+
+    def _handle_set_mta(self, packet):
+        self._mta = struct.unpack_from('<BBBBL', packet)[4]
+        self._respond()
+
+    def _handle_upload(self, packet):
+        size = packet[1]
+        chunk_size = self.simulator.max_cto - 1
+        if size > chunk_size and not self.simulator.block_mode:
+            self._error(XCPError.ERR_OUT_OF_RANGE)
+            return
+        data = self.simulator.memory.read(self._mta, size)
+        self._mta += size
+        for offset in range(0, size, chunk_size):
+            self._respond(*data[offset: offset + chunk_size])
+
+    def _handle_free_daq(self, packet):
+        self._stop_daq()
+        self._daq_lists = []
+        self._daq_pointer = None
+        self._selected.clear()
+        self._respond()
+
+    def _handle_alloc_daq(self, packet):
+        count = struct.unpack_from('<BBH', packet)[2]
+        self._daq_lists = [[] for _ in range(count)]
+        self._respond()
+
+    def _handle_alloc_odt(self, packet):
+        _, _, daq_list, count = struct.unpack_from('<BBHB', packet)
+        self._daq_lists[daq_list] = [[] for _ in range(count)]
+        self._respond()
+
+    def _handle_alloc_odt_entry(self, packet):
+        _, _, daq_list, odt, _ = struct.unpack_from('<BBHBB', packet)
+        self._daq_lists[daq_list][odt]  # Validates the ODT.
+        self._respond()
+
+    def _handle_set_daq_ptr(self, packet):
+        _, _, daq_list, odt, _ = struct.unpack_from('<BBHBB', packet)
+        self._daq_pointer = self._daq_lists[daq_list][odt]
+        self._respond()
+
+    def _handle_write_daq(self, packet):
+        _, _, size, _, address = struct.unpack_from('<BBBBL', packet)
+        if self._daq_pointer is None:
+            self._error(XCPError.ERR_SEQUENCE)
+            return
+        self._daq_pointer.append((address, size))
+        self._respond()
+
+    def _handle_set_daq_list_mode(self, packet):
+        daq_list = struct.unpack_from('<BBHHBB', packet)[2]
+        self._daq_lists[daq_list]  # Validates the DAQ list.
+        self._respond()
+
+    def _handle_start_stop_daq_list(self, packet):
+        _, mode, daq_list = struct.unpack_from('<BBH', packet)
+        # The PIDs of the ODTs are numbered across all DAQ lists.
+        first_pid = sum(len(odts) for odts in self._daq_lists[:daq_list])
+        if mode == XCPDaqListMode.STOP:
+            self._running.discard(daq_list)
+        elif mode == XCPDaqListMode.START:
+            self._running.add(daq_list)
+            self._start_daq()
+        else:
+            self._selected.add(daq_list)
+        self._respond(first_pid)
+
+    def _handle_start_stop_synch(self, packet):
+        mode = packet[1]
+        if mode == XCPSynchMode.START_SELECTED:
+            self._running.update(self._selected)
+            self._start_daq()
+        elif mode == XCPSynchMode.STOP_SELECTED:
+            self._running.difference_update(self._selected)
+        else:
+            self._running.clear()
+        self._selected.clear()
+        self._respond()
+
+    def _start_daq(self):
+        if self._daq_thread is None or not self._daq_thread.is_alive():
+            self._daq_thread = threading.Thread(
+                target=self._run_daq,
+                daemon=True,
+            )
+            self._daq_thread.start()
+
+    def _stop_daq(self):
+        self._running.clear()
+
+    def _run_daq(self):
+        memory = self.simulator.memory
+        while self._running:
+            try:
+                for daq_list in sorted(self._running):
+                    pid = sum(len(odts) for odts in self._daq_lists[:daq_list])
+                    for odt in self._daq_lists[daq_list]:
+                        dto = bytearray((pid,))
+                        for address, size in odt:
+                            dto += memory.read(address, size)
+                        self._send(dto)
+                        pid += 1
+            except (OSError, IndexError):
+                break
+            time.sleep(self.simulator.daq_period)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('esi', choices=('ESI1', 'ESI2'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=XCP_SIMULATOR_PORT)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--packet-loss', type=float, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    simulator = XCPSlaveSimulator(
+        esi_xcp_variables.get_esi_info(args.esi),
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        packet_loss=args.packet_loss,
+    )
+    logging.info(f'Simulating {args.esi} on {simulator.address}.')
+    simulator.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
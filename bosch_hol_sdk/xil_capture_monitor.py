@@ -0,0 +1,230 @@
+"""
+Streams XIL variables in the background with a MAPort capture.
+
+The capture samples the variables at the rate of a model task. A background
+thread fetches the captured samples periodically into bounded ring buffers,
+so the latest values and aggregates of the variables can be read from memory
+instead of with synchronous MAPort reads.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import collections
+import dataclasses
+import logging
+import threading
+import time
+
+XIL_CAPTURE_TASK = 'Periodic Task 1'
+# Interval between two fetches of the captured samples.
+XIL_CAPTURE_FETCH_PERIOD = 0.2  # seconds.
+# Samples kept per variable.
+XIL_CAPTURE_CAPACITY = 10000
+# Values older than that are not returned by read_variables anymore.
+XIL_CAPTURE_MAX_AGE = 2  # seconds.
+
+
+@dataclasses.dataclass
+class CaptureAggregate:
+    latest: float
+    minimum: float
+    maximum: float
+    # Change of the value per second of model time.
+    rate: float
+    samples: int
+
+
+class _VariableStatistics:
+    """ The running aggregates of a variable since they were last reset. """
+    def __init__(self):
+        self.samples = 0
+        self.minimum = None
+        self.maximum = None
+        self.first = None
+        self.last = None
+
+    def update(self, times, values):
+        if not values:
+            return
+        if self.samples == 0:
+            self.minimum = min(values)
+            self.maximum = max(values)
+            if self.first is None:
+                self.first = (times[0], values[0])
+        else:
+            self.minimum = min(self.minimum, min(values))
+            self.maximum = max(self.maximum, max(values))
+        self.samples += len(values)
+        self.last = (times[-1], values[-1])
+
+    def aggregate(self):
+        (first_time, first_value), (last_time, last_value) = \
+            self.first, self.last
+        duration = last_time - first_time
+        return CaptureAggregate(
+            latest=last_value,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            rate=(last_value - first_value) / duration if duration else 0.0,
+            samples=self.samples,
+        )
+
+    def reset(self):
+        # The next rate is computed from the last sample on.
+        self.samples = 0
+        self.first = self.last
+
+
+class XILCaptureMonitor:
+    """
+    Captures `variables` ((name, path) pairs) on `task` of the application.
+
+    read_variables can be used as the batch reader of the XILAPIMAPort, to
+    serve the captured variables without reading them again.
+    """
+    def __init__(
+        self,
+        maport,
+        variables,
+        task=XIL_CAPTURE_TASK,
+        downsampling=1,
+        fetch_period=XIL_CAPTURE_FETCH_PERIOD,
+        capacity=XIL_CAPTURE_CAPACITY,
+        max_age=XIL_CAPTURE_MAX_AGE,
+        logger=None,
+    ):
+        if logger is None:
+            logger = logging.getLogger()
+        self._logger = logger.getChild(self.__class__.__name__)
+        self._maport = maport
+        self.variables = dict(variables)
+        self._paths = list(dict.fromkeys(self.variables.values()))
+        self._task = task
+        self._downsampling = downsampling
+        self._fetch_period = fetch_period
+        self._max_age = max_age
+        # Path -> (model time, value) samples.
+        self._buffers = {
+            path: collections.deque(maxlen=capacity) for path in self._paths
+        }
+        self._statistics = {path: _VariableStatistics() for path in self._paths}
+        self._lock = threading.Lock()
+        self._last_fetch = None
+        # Paths which got new samples in the last fetch.
+        self._fresh = set()
+        self._capture = None
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._capture = self._maport.create_capture(
+            self._paths,
+            self._task,
+            self._downsampling,
+        )
+        started = False
+        try:
+            with self._maport.lock:
+                self._capture.Start()
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=self._logger.name,
+                daemon=True,
+            )
+            self._thread.start()
+            started = True
+        finally:
+            if not started:
+                # Releases the capture (and its thread) on the platform.
+                self.stop()
+        self._logger.info(
+            f'Capturing {len(self._paths)} variables on {self._task}.'
+        )
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._capture is not None:
+            try:
+                with self._maport.lock:
+                    self._capture.Stop()
+            except Exception:
+                self._logger.exception('Failed to stop the capture.')
+            self._capture = None
+        with self._lock:
+            self._last_fetch = None
+            self._fresh = set()
+
+    def read_variables(self, paths):
+        """
+        Returns the latest values of `paths`, None for the ones that are not
+        captured or whose values are outdated, i.e. which got no new samples
+        in the last fetch.
+        """
+        with self._lock:
+            if (self._last_fetch is None
+                    or time.monotonic() - self._last_fetch > self._max_age):
+                return [None] * len(paths)
+            return [
+                self._buffers[path][-1][1] if path in self._fresh else None
+                for path in paths
+            ]
+
+    def samples(self, name):
+        """ Returns the buffered (model time, value) samples of a variable. """
+        with self._lock:
+            return list(self._buffers[self.variables[name]])
+
+    def aggregates(self):
+        """
+        Returns the aggregates of the variables by name, since the previous
+        call.
+        """
+        with self._lock:
+            aggregates = {}
+            for name, path in self.variables.items():
+                statistics = self._statistics[path]
+                if statistics.samples:
+                    aggregates[name] = statistics.aggregate()
+            for statistics in self._statistics.values():
+                statistics.reset()
+        return aggregates
+
+    def _run(self):
+        while not self._stop_event.wait(self._fetch_period):
+            try:
+                self._fetch()
+            except Exception:
+                # The users fall back to reading the variables themselves
+                # once the values are outdated.
+                self._logger.exception(
+                    'Fetching the captured samples failed, stopping.'
+                )
+                break
+
+    def _fetch(self):
+        fetched = []
+        with self._maport.lock:
+            result = self._capture.Fetch(False)
+            for path in self._paths:
+                signal = result.ExtractSignalValue(self._task, path)
+                fetched.append((
+                    path,
+                    list(signal.XVector.Value),
+                    list(signal.FcnValues.Value),
+                ))
+
+        with self._lock:
+            for path, times, values in fetched:
+                self._buffers[path].extend(zip(times, values))
+                self._statistics[path].update(times, values)
+            self._fresh = {path for path, _, values in fetched if values}
+            self._last_fetch = time.monotonic()
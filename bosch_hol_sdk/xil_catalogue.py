@@ -0,0 +1,120 @@
+"""
+The catalogue of the XIL variables of a real-time application.
+
+Enumerating the variables over the MAPort takes a while, so the catalogue is
+persisted on disk, keyed by the hash of the SDF file and of the files it
+references (TRC files, ...).
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import hashlib
+import logging
+import pathlib
+import re
+
+from dspace.bosch_hol_sdk import defaults
+
+CATALOGUE_VERSION = 1
+
+# The entries of an SDF file referencing other files of the application.
+_SDF_FILE_REGEX = re.compile(r'^\s*(?:File|TraceFile)\s*=\s*(.+?)\s*$', re.M)
+
+
+class XilVariableCatalogue:
+    """ The variable paths, with a set for membership tests. """
+    def __init__(self, paths, key=None):
+        # The hash of the application, None if unknown.
+        self.key = key
+        self.paths = tuple(sorted(set(paths)))
+        self._path_set = frozenset(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __contains__(self, path):
+        return path in self._path_set
+
+    def under_segments(self, segments):
+        """
+        Returns the paths under any occurrence of the consecutive `segments`
+        (e.g. ('BusSystems', 'Ethernet')) in the path.
+        """
+        infix = '/' + '/'.join(segments) + '/'
+        return [path for path in self.paths if infix in path]
+
+    def save(self, file):
+        file = pathlib.Path(file)
+        tmp_file = file.with_suffix('.tmp')
+        tmp_file.write_text(
+            '\n'.join((str(CATALOGUE_VERSION), *self.paths)),
+            encoding='utf-8',
+        )
+        tmp_file.replace(file)
+
+    @classmethod
+    def load(cls, file, key=None):
+        version, *paths = pathlib.Path(file).read_text(
+            encoding='utf-8',
+        ).split('\n')
+        if version != str(CATALOGUE_VERSION):
+            raise ValueError(version)
+        return cls(paths, key)
+
+
+def get_application_key(sdf_file):
+    """ Returns the hash of the SDF file and of the files it references. """
+    sdf_file = pathlib.Path(sdf_file)
+    content = sdf_file.read_bytes()
+    digest = hashlib.sha256(content)
+    for name in _SDF_FILE_REGEX.findall(content.decode('latin-1')):
+        digest.update(name.encode('utf-8'))
+        digest.update((sdf_file.parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+def load_xil_catalogue(maport, current=None, cache_directory=None, logger=None):
+    """
+    Returns the catalogue of the application of `maport` (a XILAPIMAPort).
+
+    `current` is returned if it belongs to the same application, otherwise
+    the catalogue is loaded from the cache or enumerated and cached.
+    """
+    if cache_directory is None:
+        cache_directory = defaults.XIL_CATALOGUE_DIRECTORY
+    if logger is None:
+        logger = logging.getLogger()
+    logger = logger.getChild('XilCatalogue')
+
+    try:
+        key = get_application_key(maport.sdf_file)
+    except OSError:
+        logger.warning(
+            f'Failed to hash {maport.sdf_file}, enumerating the variables.',
+            exc_info=True,
+        )
+        return XilVariableCatalogue(map(str, maport.get_variables()))
+
+    if current is not None and current.key == key:
+        return current
+
+    cache_file = pathlib.Path(cache_directory, f'{key}.txt')
+    try:
+        catalogue = XilVariableCatalogue.load(cache_file, key)
+    except (OSError, ValueError):
+        logger.info('Enumerating the XIL variables.')
+    else:
+        logger.debug(f'Loaded {len(catalogue)} XIL variables from {cache_file}.')
+        return catalogue
+
+    catalogue = XilVariableCatalogue(map(str, maport.get_variables()), key)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        catalogue.save(cache_file)
+    except OSError:
+        logger.warning('Failed to cache the XIL variables.', exc_info=True)
+    return catalogue
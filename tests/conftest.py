@@ -0,0 +1,30 @@
+"""
+Makes the package of this checkout importable as dspace.bosch_hol_sdk.
+
+The tests only use modules of the package, so its __init__ (and the gRPC
+modules imported by it) is not executed.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+from pathlib import Path
+import sys
+import types
+
+PACKAGE_DIRECTORY = Path(__file__).resolve().parents[1] / 'bosch_hol_sdk'
+
+
+def _add_package(name, path):
+    package = types.ModuleType(name)
+    package.__path__ = [str(path)] if path else []
+    sys.modules[name] = package
+    return package
+
+
+if 'dspace' not in sys.modules:
+    _add_package('dspace', None)
+sys.modules['dspace'].bosch_hol_sdk = _add_package(
+    'dspace.bosch_hol_sdk',
+    PACKAGE_DIRECTORY,
+)
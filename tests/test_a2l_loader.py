@@ -0,0 +1,120 @@
+"""
+Tests of the parsing and caching of A2L files.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import json
+import logging
+
+import pytest
+
+from dspace.bosch_hol_sdk import a2l_loader
+from dspace.bosch_hol_sdk.xcp_variable_table import Variable
+from dspace.bosch_hol_sdk.xcpinterface import DataType
+
+A2L = b'''
+ASAP2_VERSION 1 71
+/begin PROJECT Test ""
+  /begin MODULE ESI "The module"
+    /begin MOD_PAR ""
+      /* The software version. */
+      EPK "ESI_1.2.3 \\"release\\""
+      ADDR_EPK 0x80001000
+    /end MOD_PAR
+    /begin MEASUREMENT Replay_frameCounter "Frame counter"
+      ULONG NO_COMPU_METHOD 0 0 0 4294967295
+      ECU_ADDRESS 0x80002000
+      /begin IF_DATA XCP
+        /begin DAQ_EVENT VARIABLE /end DAQ_EVENT
+      /end IF_DATA
+    /end MEASUREMENT
+    // A measurement of an unsupported type.
+    /begin MEASUREMENT Replay_text "Some /end MEASUREMENT text"
+      ASCII NO_COMPU_METHOD 0 0 0 255
+      ECU_ADDRESS 0x80002100
+    /end MEASUREMENT
+    /begin MEASUREMENT Replay_noAddress ""
+      UWORD NO_COMPU_METHOD 0 0 0 65535
+    /end MEASUREMENT
+    /begin MEASUREMENT Replay_array ""
+      SWORD NO_COMPU_METHOD 0 0 -32768 32767
+      ARRAY_SIZE 3
+      ECU_ADDRESS 0x80003000
+    /end MEASUREMENT
+    /begin MEASUREMENT Replay_matrix ""
+      FLOAT32_IEEE NO_COMPU_METHOD 0 0 -1e9 1e9
+      MATRIX_DIM 2 3 1
+      ECU_ADDRESS 0x80004000
+    /end MEASUREMENT
+    /begin MEASUREMENT Replay_single ""
+      UBYTE NO_COMPU_METHOD 0 0 0 255
+      MATRIX_DIM 1
+      ECU_ADDRESS 0x80005000
+    /end MEASUREMENT
+  /end MODULE
+/end PROJECT
+'''
+
+
+def test_parse_a2l():
+    content = a2l_loader.parse_a2l(A2L)
+    assert content.epk == 'ESI_1.2.3 \\"release\\"'
+    assert content.epk_address == 0x80001000
+
+    variables = {name: value for name, value in content.variables}
+    assert variables == {
+        'Replay_frameCounter': Variable(DataType.ULONG, 0x80002000),
+        'Replay_array[0]': Variable(DataType.SWORD, 0x80003000),
+        'Replay_array[1]': Variable(DataType.SWORD, 0x80003002),
+        'Replay_array[2]': Variable(DataType.SWORD, 0x80003004),
+        'Replay_matrix[0][0]': Variable(DataType.FLOAT32_IEEE, 0x80004000),
+        'Replay_matrix[0][1]': Variable(DataType.FLOAT32_IEEE, 0x80004004),
+        'Replay_matrix[0][2]': Variable(DataType.FLOAT32_IEEE, 0x80004008),
+        'Replay_matrix[1][0]': Variable(DataType.FLOAT32_IEEE, 0x8000400c),
+        'Replay_matrix[1][1]': Variable(DataType.FLOAT32_IEEE, 0x80004010),
+        'Replay_matrix[1][2]': Variable(DataType.FLOAT32_IEEE, 0x80004014),
+        'Replay_single': Variable(DataType.UBYTE, 0x80005000),
+    }
+
+
+def test_load_a2l_cache(tmp_path, monkeypatch):
+    a2l_file = tmp_path / 'ESI.a2l'
+    a2l_file.write_bytes(A2L)
+    cache_directory = tmp_path / 'cache'
+    logger = logging.getLogger('test')
+
+    parsed = a2l_loader.load_a2l(a2l_file, cache_directory, logger)
+    cache_files = list(cache_directory.iterdir())
+    assert [path.suffix for path in cache_files] == ['.json']
+
+    def parse_a2l(data):
+        raise AssertionError('Parsed again')
+
+    monkeypatch.setattr(a2l_loader, 'parse_a2l', parse_a2l)
+    cached = a2l_loader.load_a2l(a2l_file, cache_directory, logger)
+    assert (cached.epk, cached.epk_address) == (parsed.epk, parsed.epk_address)
+    assert list(cached.variables) == list(parsed.variables)
+
+    # A cache of another version is ignored.
+    content = json.loads(cache_files[0].read_text())
+    content['version'] = a2l_loader.CACHE_VERSION - 1
+    cache_files[0].write_text(json.dumps(content))
+    monkeypatch.undo()
+    reparsed = a2l_loader.load_a2l(a2l_file, cache_directory, logger)
+    assert list(reparsed.variables) == list(parsed.variables)
+    content = json.loads(cache_files[0].read_text())
+    assert content['version'] == a2l_loader.CACHE_VERSION
+
+
+def test_get_esi_info_requires_epk(tmp_path):
+    a2l_file = tmp_path / 'ESI.a2l'
+    a2l_file.write_bytes(A2L.replace(b'ADDR_EPK', b'ADDR_OTHER'))
+    with pytest.raises(ValueError):
+        a2l_loader.get_esi_info('ESI1', a2l_file, tmp_path / 'cache')
+
+    a2l_file.write_bytes(A2L)
+    esi_info = a2l_loader.get_esi_info('ESI1', a2l_file, tmp_path / 'cache')
+    assert esi_info.version_address == 0x80001000
+    assert 'Replay_frameCounter' in esi_info.variables
@@ -0,0 +1,513 @@
+"""
+Tests of the checks of the idx-files.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import array
+import logging
+import os
+from pathlib import Path
+import random
+import struct
+import sys
+import time
+
+import pytest
+
+# idx_rec_compare is a standalone script (it's also executed on PC2).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'bosch_hol_sdk'))
+import idx_rec_compare  # noqa: E402
+
+
+def _write_idx(path, offsets, trailing=b''):
+    entries = array.array('q', offsets)
+    if sys.byteorder != 'little':
+        entries.byteswap()
+    path.write_bytes(entries.tobytes() + trailing)
+    return path
+
+
+def _scan(offsets, file_size, maximum_index):
+    """ The backwards walk of the idx-file, as reference. """
+    start_index = min(len(offsets) - 1, maximum_index)
+    for idx in range(start_index, 0, -1):
+        if offsets[idx] <= file_size:
+            return idx, offsets[idx - 1], offsets[idx]
+    return -1, 0, 0
+
+
+@pytest.fixture
+def compare():
+    return idx_rec_compare.IdxRecCompare(
+        'data@1.rec',
+        {},
+        logging.getLogger('test'),
+    )
+
+
+def test_find_invalid_frames():
+    offsets = [0, 10, 20, 20, 50, 40, 300]
+    # Frame 3 is empty, 4 too large, 5 negative and 6 beyond the file.
+    assert idx_rec_compare.find_invalid_frames(
+        offsets, 6, 100, max_frame_size=25,
+    ) == [3, 4, 5, 6]
+    assert idx_rec_compare.find_invalid_frames(offsets, 6, 100) == [3, 5, 6]
+    assert idx_rec_compare.find_invalid_frames(
+        offsets, 6, 100, first_frame=4,
+    ) == [5, 6]
+    assert idx_rec_compare.find_invalid_frames(offsets, 2, 100) == []
+
+
+def test_find_invalid_frames_mapped(tmp_path):
+    offsets = [0, 10, 20, 20, 50, 40, 300]
+    index_file = _write_idx(tmp_path / 'data.idx', offsets)
+    with idx_rec_compare.open_index_offsets(index_file) as mapped:
+        assert idx_rec_compare.find_invalid_frames(
+            mapped, 6, 100, max_frame_size=25,
+        ) == [3, 4, 5, 6]
+
+
+def test_get_last_complete_frame_and_ranges():
+    offsets = [0, 10, 20, 30, 200, 40]
+    assert idx_rec_compare.get_last_complete_frame(offsets, 5, 100) == 3
+    assert idx_rec_compare.get_last_complete_frame(offsets, 3, 100) == 3
+    assert idx_rec_compare.get_valid_frame_ranges([2, 3, 6], 8) == [
+        (1, 1), (4, 5), (7, 8),
+    ]
+    assert idx_rec_compare.get_valid_frame_ranges([], 3) == [(1, 3)]
+
+
+@pytest.mark.parametrize('file_size, maximum_index, expected', [
+    # Complete data file.
+    (1000, 10, (10, 900, 1000)),
+    # Truncated data file.
+    (555, 10, (5, 400, 500)),
+    (500, 10, (5, 400, 500)),
+    # The frames of the rec-file end earlier.
+    (1000, 3, (3, 200, 300)),
+    # Not even the first frame fits.
+    (50, 10, (-1, 0, 0)),
+])
+def test_get_last_frame_info(
+        compare, tmp_path, file_size, maximum_index, expected):
+    index_file = _write_idx(
+        tmp_path / 'data.idx',
+        range(0, 1100, 100),
+        # An incomplete entry at the end is ignored.
+        trailing=b'\x01\x02\x03',
+    )
+    assert compare._get_last_frame_info(
+        index_file, file_size, maximum_index,
+    ) == expected
+
+
+def test_get_last_frame_info_empty(compare, tmp_path):
+    index_file = _write_idx(tmp_path / 'data.idx', [])
+    assert compare._get_last_frame_info(index_file, 100, 10) == (-1, 0, 0)
+
+
+def test_get_last_frame_info_non_monotonic(compare, tmp_path):
+    # A binary search would stop at frame 2.
+    offsets = [0, 10, 500, 20, 30, 600]
+    index_file = _write_idx(tmp_path / 'data.idx', offsets)
+    assert compare._get_last_frame_info(index_file, 100, 5) == (4, 20, 30)
+
+
+def test_get_last_frame_info_matches_scan(compare, tmp_path):
+    rng = random.Random(0)
+    index_file = tmp_path / 'data.idx'
+    window = idx_rec_compare.MONOTONIC_CHECK_WINDOW
+    for _ in range(500):
+        offsets = sorted(rng.randrange(10000) for _ in range(rng.randrange(200)))
+        file_size = rng.randrange(11000)
+        maximum_index = rng.randrange(250)
+        if offsets and rng.random() < 0.3:
+            # Corrupt an entry next to the last fitting frame.
+            idx, _, _ = _scan(offsets, file_size, maximum_index)
+            position = max(0, idx) + rng.randrange(-window, window + 1)
+            if 0 < position < len(offsets):
+                offsets[position] = rng.randrange(10000)
+        _write_idx(index_file, offsets)
+        assert compare._get_last_frame_info(
+            index_file, file_size, maximum_index,
+        ) == _scan(offsets, file_size, maximum_index)
+
+
+def _format_timestamp(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f'00:{int(minutes):02d}:{seconds:09.6f}'
+
+
+def _write_rec(path, frame_sizes, samples):
+    """ Write a rec-file with the (seconds, sensor name) samples. """
+    lines = ['[Header]', 'Version=2.0', '', '[Data]']
+    lines += [
+        f'{_format_timestamp(0)} @ Record {name}(output[MAPS::Stream8,1,{size}])'
+        for name, size in frame_sizes.items()
+    ]
+    lines += [
+        f'{_format_timestamp(ts)} / {name}#0 {name}.output'
+        for ts, name in samples
+    ]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+@pytest.fixture
+def rec_compare(tmp_path):
+    samples = sorted(
+        [(frame / 10, 'Cam') for frame in range(10)]
+        + [(frame / 4 + 0.05, 'Can') for frame in range(5)]
+    )
+    rec_file = _write_rec(
+        tmp_path / 'DSU1@20230809_155456973558.rec',
+        {'Cam': 1024, 'Can': 64},
+        samples,
+    )
+    compare = idx_rec_compare.IdxRecCompare(
+        rec_file,
+        {'camera': ['Cam'], 'can': ['Can']},
+        logging.getLogger('test'),
+    )
+    compare.read_rec()
+    return compare
+
+
+def _count_rec_reads(compare, monkeypatch):
+    reads = []
+    iter_rec_data = compare._iter_rec_data
+
+    def counting(*args, **kwargs):
+        reads.append(args)
+        return iter_rec_data(*args, **kwargs)
+
+    monkeypatch.setattr(compare, '_iter_rec_data', counting)
+    return reads
+
+
+def test_read_rec(rec_compare):
+    camera = rec_compare.sensor_data['Cam']
+    assert (camera.count, camera.frame_size) == (10, 1024)
+    assert camera.first_timestamp == '00:00:00.000000'
+    assert camera.get_timestamp(9) == '00:00:00.900000'
+    assert camera.get_timestamp(8) == '00:00:00.800000'
+    with pytest.raises(IndexError):
+        camera.get_timestamp(5)
+
+    can = rec_compare.sensor_data['Can']
+    assert (can.count, can.frame_size) == (5, 64)
+    assert can.first_timestamp == '00:00:00.050000'
+
+
+def test_get_sample_time(rec_compare):
+    for index in range(-10, 10):
+        expected = round((index % 10) * 100000)
+        assert rec_compare.get_sample_time('Cam', index) == expected
+    with pytest.raises(IndexError):
+        rec_compare.get_sample_time('Cam', 10)
+
+
+def test_resolve_sample_times_from_memory(rec_compare, monkeypatch):
+    reads = _count_rec_reads(rec_compare, monkeypatch)
+    rec_compare.ts_sensor = {'Cam': (None, 10), 'Can': (None, 4)}
+    rec_compare._frame_ranges = {'Cam': [(1, 10)], 'Can': [(1, 4)]}
+
+    rec_compare._resolve_sample_times()
+
+    assert not reads
+    assert rec_compare.ts_sensor == {'Cam': (900000, 10), 'Can': (800000, 4)}
+    assert rec_compare.valid_ranges == {
+        'Cam': [(0, 900000)],
+        'Can': [(50000, 800000)],
+    }
+
+
+def test_resolve_sample_times_searches_once(rec_compare, monkeypatch):
+    reads = _count_rec_reads(rec_compare, monkeypatch)
+    rec_compare.ts_sensor = {'Cam': (None, 10)}
+    rec_compare._frame_ranges = {'Cam': [(1, 3), (6, 10)], 'Can': [(2, 3)]}
+
+    rec_compare._resolve_sample_times()
+
+    assert len(reads) == 1
+    assert rec_compare.valid_ranges == {
+        'Cam': [(0, 200000), (500000, 900000)],
+        'Can': [(300000, 550000)],
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return idx_rec_compare.ResultCache(
+        tmp_path / 'cache' / 'results.db',
+        logging.getLogger('test'),
+    )
+
+
+def test_result_cache_round_trip(cache):
+    key = cache.make_key({'camera': ['Cam']}, [])
+    assert cache.get(key) is None
+    cache.put(key, ({'Cam': (900000, 10)}, 900000, {'Cam': [(0, 900000)]}))
+    assert cache.get(key) == (
+        {'Cam': (900000, 10)}, 900000, {'Cam': [(0, 900000)]},
+    )
+
+
+@pytest.mark.parametrize('change', ['size', 'mtime', 'inode'])
+def test_result_cache_key_changes(tmp_path, change):
+    data_file = tmp_path / 'Cam.idx'
+    data_file.write_bytes(bytes(16))
+    sensors = {'camera': ['Cam']}
+    key = idx_rec_compare.ResultCache.make_key(sensors, [data_file])
+    assert idx_rec_compare.ResultCache.make_key(sensors, [data_file]) == key
+
+    stat = data_file.stat()
+    if change == 'size':
+        with open(data_file, 'ab') as file:
+            file.write(bytes(8))
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    elif change == 'mtime':
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    else:
+        # Keep the old file alive, so its inode isn't reused.
+        moved = data_file.rename(tmp_path / 'Cam.old')
+        data_file.write_bytes(bytes(16))
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert moved.stat().st_ino != data_file.stat().st_ino
+
+    assert idx_rec_compare.ResultCache.make_key(sensors, [data_file]) != key
+
+
+def test_data_check_uses_cache(rec_compare, tmp_path, monkeypatch):
+    rec_compare.cache_path = tmp_path / 'results.db'
+    checks = []
+    result = ({'Cam': (900000, 10)}, 900000)
+
+    def data_check():
+        checks.append(None)
+        return result
+
+    monkeypatch.setattr(rec_compare, '_data_check', data_check)
+    assert rec_compare.data_check() == result
+    assert rec_compare.data_check() == result
+    assert len(checks) == 1
+
+    # Growing rec-file.
+    with open(rec_compare.data_path, 'a') as file:
+        file.write('00:00:01.000000 / Cam#0 Cam.output\n')
+    rec_compare.data_check()
+    assert len(checks) == 2
+
+
+def test_result_cache_failure_is_not_fatal(tmp_path):
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    cache = idx_rec_compare.ResultCache(
+        blocker / 'results.db',
+        logging.getLogger('test'),
+    )
+    cache.put('key', ({}, 0, {}))
+    assert cache.get('key') is None
+
+
+ASC_HEADER = (
+    'date Wed Aug 9 03:54:56.973 pm 2023\n'
+    'base hex  timestamps absolute\n'
+    '// version 8.1.0\n'
+)
+ASC_FRAME = '   0.010000 CANFD   1 Rx        18d  Frame  1 0 8  8 00 11 22 33\n'
+
+
+@pytest.mark.parametrize('content, expected', [
+    (ASC_HEADER + ASC_FRAME * 3, 3),
+    # Unterminated last line.
+    (ASC_HEADER + ASC_FRAME * 3 + ASC_FRAME.rstrip('\n'), 4),
+    (ASC_HEADER.replace('\n', '\r\n') + ASC_FRAME * 2, 2),
+    (ASC_HEADER, 0),
+    # The marker only counts at the beginning of a line.
+    ('x // version 8.1.0\n' + ASC_FRAME, 0),
+    ('', 0),
+])
+def test_get_asc_frame_count(compare, tmp_path, content, expected):
+    asc_file = tmp_path / 'Can.asc'
+    asc_file.write_bytes(content.encode('utf-8'))
+    assert compare.get_asc_frame_count(asc_file) == expected
+
+
+def test_get_asc_frame_count_blocks(compare, tmp_path, monkeypatch):
+    monkeypatch.setattr(idx_rec_compare, 'ASC_BLOCK_SIZE', 7)
+    asc_file = tmp_path / 'Can.asc'
+    asc_file.write_text(ASC_HEADER + ASC_FRAME * 50)
+    assert compare.get_asc_frame_count(asc_file) == 50
+
+
+def test_get_asc_frame_count_resumes(compare, tmp_path):
+    asc_file = tmp_path / 'Can.asc'
+    asc_file.write_text(ASC_HEADER + ASC_FRAME * 2 + ASC_FRAME[:10])
+    asc_state = {}
+    assert compare.get_asc_frame_count(asc_file, asc_state) == 3
+    assert asc_state['count'] == 2
+
+    with open(asc_file, 'a') as file:
+        file.write(ASC_FRAME[10:] + ASC_FRAME)
+    assert compare.get_asc_frame_count(asc_file, asc_state) == 4
+    assert asc_state['count'] == 4
+
+
+def _write_pcap(path, packets, byte_order='<', magic=0xa1b2c3d4, truncate=0):
+    """ Write the (seconds, fraction, payload size) packets to a pcap-file. """
+    record_header = struct.Struct(f'{byte_order}IIII')
+    data = bytearray(struct.pack(f'{byte_order}IHHiIII', magic, 2, 4, 0, 0, 65535, 1))
+    offsets = []
+    for ts_sec, ts_frac, size in packets:
+        offsets.append(len(data))
+        data += record_header.pack(ts_sec, ts_frac, size, size) + bytes(size)
+    path.write_bytes(data[:len(data) - truncate])
+    return offsets, len(data)
+
+
+@pytest.mark.parametrize('byte_order', ('<', '>'))
+def test_get_pcap_max_timestamp(tmp_path, byte_order):
+    pcap_file = tmp_path / 'Lidar.pcap'
+    # Timestamps aren't ordered within a frame.
+    offsets, size = _write_pcap(
+        pcap_file,
+        [(1, 500, 100), (3, 250000, 10), (2, 0, 1000), (5, 0, 20)],
+        byte_order=byte_order,
+    )
+    assert idx_rec_compare.get_pcap_max_timestamp(
+        pcap_file, offsets[0], offsets[3],
+    ) == 3.25
+    assert idx_rec_compare.get_pcap_max_timestamp(
+        pcap_file, offsets[0], size,
+    ) == 5
+    assert idx_rec_compare.get_pcap_max_timestamp(
+        pcap_file, offsets[1], offsets[1],
+    ) == 0
+
+
+def test_get_pcap_max_timestamp_nanoseconds(tmp_path):
+    pcap_file = tmp_path / 'Lidar.pcap'
+    offsets, size = _write_pcap(
+        pcap_file, [(1, 500000000, 10)], magic=0xa1b23c4d,
+    )
+    assert idx_rec_compare.get_pcap_max_timestamp(
+        pcap_file, offsets[0], size,
+    ) == 1.5
+
+
+def test_get_pcap_max_timestamp_truncated(tmp_path):
+    pcap_file = tmp_path / 'Lidar.pcap'
+    # The record header of the last packet is cut off.
+    offsets, size = _write_pcap(
+        pcap_file, [(1, 0, 10), (2, 0, 10)], truncate=10 + 8,
+    )
+    assert idx_rec_compare.get_pcap_max_timestamp(
+        pcap_file, offsets[0], size,
+    ) == 1
+
+
+@pytest.mark.parametrize('content', (b'', bytes(24)))
+def test_get_pcap_max_timestamp_invalid(tmp_path, content):
+    pcap_file = tmp_path / 'Lidar.pcap'
+    pcap_file.write_bytes(content)
+    with pytest.raises(ValueError):
+        idx_rec_compare.get_pcap_max_timestamp(pcap_file, 24, 100)
+
+
+def _write_can_recording(directory, num_frames):
+    rec_file = _write_rec(
+        directory / 'DSU1@20230809_155456973558.rec',
+        {'Can': 64},
+        [(frame / 100, 'Can') for frame in range(num_frames)],
+    )
+    asc_file = directory / 'Can@20230809_155456973558.asc'
+    asc_file.write_text(ASC_HEADER + ASC_FRAME * num_frames)
+    return rec_file
+
+
+def _check(rec_file, state_dir, monkeypatch=None):
+    compare = idx_rec_compare.IdxRecCompare(
+        rec_file,
+        {'can': ['Can']},
+        logging.getLogger('test'),
+        state_dir=state_dir,
+    )
+    reads = [] if monkeypatch is None else _count_rec_reads(compare, monkeypatch)
+    return compare.data_check(), reads
+
+
+def test_resume_from_state(tmp_path, monkeypatch):
+    recording = tmp_path / 'recording'
+    recording.mkdir()
+    state_dir = tmp_path / 'state'
+    rec_file = _write_can_recording(recording, 1000)
+    assert _check(rec_file, state_dir)[0] == ({'Can': (9980000, 999)}, 9980000)
+
+    # The recording grows.
+    rec_size = rec_file.stat().st_size
+    with open(rec_file, 'a') as file:
+        file.writelines(
+            f'{_format_timestamp(frame / 100)} / Can#0 Can.output\n'
+            for frame in range(1000, 1500)
+        )
+    with open(recording / 'Can@20230809_155456973558.asc', 'a') as file:
+        file.write(ASC_FRAME * 500)
+
+    result, reads = _check(rec_file, state_dir, monkeypatch)
+    assert result == ({'Can': (14980000, 1499)}, 14980000)
+    # Parsing continued behind the previously parsed lines.
+    assert reads[0][0] == rec_size
+    assert result == _check(rec_file, None)[0]
+
+
+def test_resume_after_replaced_rec_file(tmp_path, monkeypatch):
+    recording = tmp_path / 'recording'
+    recording.mkdir()
+    state_dir = tmp_path / 'state'
+    _check(_write_can_recording(recording, 1000), state_dir)
+
+    (recording / 'DSU1@20230809_155456973558.rec').rename(tmp_path / 'old.rec')
+    result, reads = _check(
+        _write_can_recording(recording, 10), state_dir, monkeypatch,
+    )
+    assert result == ({'Can': (80000, 9)}, 80000)
+    assert reads[0][0] == 0
+
+
+def test_unusable_state_directory(tmp_path, caplog):
+    recording = tmp_path / 'recording'
+    recording.mkdir()
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    rec_file = _write_can_recording(recording, 10)
+    assert _check(rec_file, blocker / 'state')[0] == ({'Can': (80000, 9)}, 80000)
+    assert 'Failed to load the check state' in caplog.text
+
+
+def test_remove_stale_states(tmp_path):
+    recording = tmp_path / 'recording'
+    recording.mkdir()
+    root = tmp_path / 'states'
+    _check(_write_can_recording(recording, 10), root / 'stale')
+    _check(_write_can_recording(recording, 10), root / 'fresh')
+    foreign = root / 'foreign'
+    foreign.mkdir()
+    (foreign / idx_rec_compare.ValidationState.FILE_NAME).write_text('{}')
+    (foreign / 'data.bin').write_text('')
+    empty = root / 'empty'
+    empty.mkdir()
+
+    old = time.time() - 100
+    for path in (
+            root / 'stale' / idx_rec_compare.ValidationState.FILE_NAME,
+            foreign / idx_rec_compare.ValidationState.FILE_NAME,
+            empty):
+        os.utime(path, (old, old))
+
+    idx_rec_compare.remove_stale_states(root, 50)
+    assert sorted(path.name for path in root.iterdir()) == [
+        'empty', 'foreign', 'fresh',
+    ]
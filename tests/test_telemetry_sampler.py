@@ -0,0 +1,134 @@
+"""
+Tests of the background sampling of the replay telemetry.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import threading
+import time
+
+import pytest
+
+from dspace.bosch_hol_sdk.telemetry_sampler import TelemetrySampler
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('Timed out')
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def sampler():
+    sampler = TelemetrySampler()
+    yield sampler
+    sampler.stop(timeout=1)
+
+
+def test_latest(sampler):
+    counter = iter(range(1000))
+    sampler.add_task('counter', lambda: next(counter), period=0.01)
+    assert sampler.latest('counter') is None
+
+    sampler.start()
+    _wait_for(lambda: (sampler.latest('counter') or (0, 0))[1] >= 3)
+    timestamp, _ = sampler.latest('counter')
+    assert timestamp <= time.monotonic()
+    assert sampler.running
+    assert sampler.pop_exception() is None
+    with pytest.raises(RuntimeError):
+        sampler.add_task('late', lambda: None, period=1)
+
+    assert sampler.stop()
+    assert not sampler.running
+
+
+def test_lanes(sampler):
+    threads = {}
+    blocked = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        threads['slow'] = threading.current_thread().name
+        blocked.set()
+        release.wait(5)
+
+    def fast():
+        threads['fast'] = threading.current_thread().name
+        return threads['fast']
+
+    sampler.add_task('slow', slow, period=0.01)
+    sampler.add_task('fast', fast, period=0.01, lane='fast')
+    sampler.start()
+    try:
+        blocked.wait(5)
+        # Runs while the default lane is blocked.
+        first = sampler.latest('fast')
+        _wait_for(lambda: sampler.latest('fast') != first)
+    finally:
+        release.set()
+    assert threads['slow'] != threads['fast']
+    assert threads['fast'].endswith('.fast')
+
+
+def test_delay(sampler):
+    sampler.add_task('delayed', lambda: True, period=0.01, delay=0.2)
+    sampler.start()
+    time.sleep(0.05)
+    assert sampler.latest('delayed') is None
+    _wait_for(lambda: sampler.latest('delayed') is not None)
+
+
+def test_exception_stops_all_lanes(sampler):
+    error = ValueError('failed')
+
+    def fail():
+        raise error
+
+    sampler.add_task('ok', lambda: None, period=0.01)
+    sampler.add_task('fail', fail, period=0.01, delay=0.05, lane='other')
+    sampler.start()
+    _wait_for(lambda: not sampler.running)
+    assert sampler.pop_exception() is error
+    # Only returned once.
+    assert sampler.pop_exception() is None
+
+
+def test_initializer_exception():
+    error = RuntimeError('no proxy')
+
+    def initializer():
+        raise error
+
+    sampler = TelemetrySampler(initializer=initializer)
+    sampler.add_task('never', lambda: None, period=0.01)
+    sampler.start()
+    try:
+        _wait_for(lambda: not sampler.running)
+        assert sampler.pop_exception() is error
+        assert sampler.latest('never') is None
+    finally:
+        sampler.stop()
+
+
+def test_bounded_stop(sampler, caplog):
+    release = threading.Event()
+    running = threading.Event()
+
+    def stuck():
+        running.set()
+        release.wait(5)
+
+    sampler.add_task('stuck', stuck, period=0.01, lane='stuck')
+    sampler.start()
+    try:
+        running.wait(5)
+        start = time.monotonic()
+        assert not sampler.stop(timeout=0.1)
+        assert time.monotonic() - start < 1
+        assert 'stuck' in caplog.text
+    finally:
+        release.set()
@@ -0,0 +1,67 @@
+"""
+Tests of the recording of XCP variable samples.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import pytest
+
+from dspace.bosch_hol_sdk.xcp_recorder import (
+    FILE_SUFFIX,
+    XCPRecorder,
+    load_recording,
+)
+from dspace.bosch_hol_sdk.xcpinterface import DataType
+
+VARIABLES = [
+    ('counter', 0x1000, DataType.ULONG),
+    ('offset', 0x1004, DataType.SWORD),
+    ('total', 0x1008, DataType.A_UINT64),
+    ('level', 0x1010, DataType.FLOAT64_IEEE),
+]
+
+
+def _sample(row):
+    return (row, -row, 2**40 + row, row / 4)
+
+
+def test_round_trip(tmp_path):
+    # Small enough to grow the columns a few times.
+    recorder = XCPRecorder(VARIABLES, capacity=4)
+    for row in range(5):
+        recorder.append(row * 0.1, _sample(row))
+    recorder.extend([(row * 0.1, _sample(row)) for row in range(5, 20)])
+    recorder.extend([])
+
+    path = tmp_path / f'ESI1{FILE_SUFFIX}'
+    recorder.save(path)
+    recording = load_recording(path)
+
+    assert list(recording.timestamps) == [row * 0.1 for row in range(20)]
+    assert recording.wall_clock_offset == recorder.wall_clock_offset
+    assert list(recording.columns) == [key for key, _, _ in VARIABLES]
+    rows = list(zip(*recording.columns.values()))
+    assert rows == [_sample(row) for row in range(20)]
+
+
+def test_empty_recording(tmp_path):
+    path = tmp_path / f'ESI1{FILE_SUFFIX}'
+    XCPRecorder(VARIABLES).save(path)
+    recording = load_recording(path)
+    assert not recording.timestamps
+    assert all(not column for column in recording.columns.values())
+
+
+def test_invalid_recording(tmp_path):
+    path = tmp_path / f'ESI1{FILE_SUFFIX}'
+    path.write_bytes(b'not a recording')
+    with pytest.raises(ValueError, match='not an XCP recording'):
+        load_recording(path)
+
+    recorder = XCPRecorder(VARIABLES)
+    recorder.append(0.0, _sample(1))
+    recorder.save(path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match='truncated'):
+        load_recording(path)
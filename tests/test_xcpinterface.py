@@ -0,0 +1,252 @@
+"""
+Tests of the XCP interface against the simulated ESI slave.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import logging
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from dspace.bosch_hol_sdk import esi_xcp_variables
+from dspace.bosch_hol_sdk.xcpinterface import (
+    XCPCommand,
+    XCPCommandError,
+    XCPDaqStream,
+    XCPError,
+    XCPInterface,
+    XCPReadPlan,
+    XCPResponseType,
+    XCPSession,
+    XCPSessionBusyError,
+    XCPSessionState,
+    XCPSessionTimeoutError,
+    run_concurrently,
+)
+from dspace.bosch_hol_sdk.xcpsimulator import XCPSlaveSimulator
+
+# Variables of the ESI table written and read back by the tests.
+VARIABLES = {
+    '_debug_eth_image_frame_count': 1234,
+    '_debug_eth_dropped_pkt_count': 5,
+    '_ram_buffer_fill_percent': 42,
+}
+
+
+@pytest.fixture
+def esi_info():
+    return esi_xcp_variables.get_esi_info('ESI1')
+
+
+@pytest.fixture
+def simulator(esi_info):
+    simulator = XCPSlaveSimulator(esi_info, seed=0, daq_period=0.005)
+    simulator.start()
+    yield simulator
+    simulator.stop()
+
+
+def _variables(esi_info):
+    table = esi_info.variables
+    return table.read_variables(table.select(VARIABLES))
+
+
+def _write_values(simulator, esi_info, offset=0):
+    for name, _, _ in _variables(esi_info):
+        suffix = next(suffix for suffix in VARIABLES if name.endswith(suffix))
+        simulator.write_variable(name, VARIABLES[suffix] + offset)
+
+
+def test_connect_and_upload_version(simulator, esi_info):
+    with XCPInterface(*simulator.address) as xcp_comm:
+        response = xcp_comm.execute(XCPCommand.CONNECT)
+        assert response.type == XCPResponseType.RESPONSE
+        assert response.max_cto == simulator.max_cto
+
+        version = xcp_comm.upload(
+            esi_info.version_address,
+            len(esi_info.version),
+        )
+        assert version.decode('ascii') == esi_info.version
+
+
+@pytest.mark.parametrize('block_mode', (True, False))
+def test_read_plan(simulator, esi_info, block_mode):
+    simulator.block_mode = block_mode
+    _write_values(simulator, esi_info)
+    variables = _variables(esi_info)
+
+    with XCPInterface(*simulator.address) as xcp_comm:
+        xcp_comm.execute(XCPCommand.CONNECT)
+        values = XCPReadPlan(variables).read(xcp_comm)
+
+    assert len(values) == len(variables)
+    for name, value in values.items():
+        suffix = next(suffix for suffix in VARIABLES if name.endswith(suffix))
+        assert value == VARIABLES[suffix]
+
+
+def test_command_error(simulator):
+    simulator.errors[XCPCommand.GET_STATUS] = XCPError.ERR_CMD_BUSY
+
+    with XCPInterface(*simulator.address) as xcp_comm:
+        xcp_comm.execute(XCPCommand.CONNECT)
+        with pytest.raises(XCPCommandError) as exc_info:
+            xcp_comm.execute(XCPCommand.GET_STATUS)
+
+    assert exc_info.value.error_code == XCPError.ERR_CMD_BUSY
+
+
+def test_daq_stream(simulator, esi_info):
+    _write_values(simulator, esi_info)
+    stream = XCPDaqStream(_variables(esi_info))
+
+    with XCPInterface(*simulator.address) as xcp_comm:
+        xcp_comm.execute(XCPCommand.CONNECT)
+        stream.start(xcp_comm)
+        try:
+            time.sleep(0.1)
+            first = stream.drain()
+            # Commands are still answered while the DTOs are received.
+            xcp_comm.execute(XCPCommand.GET_STATUS)
+            _write_values(simulator, esi_info, offset=1)
+            time.sleep(0.1)
+            second = stream.drain()
+        finally:
+            stream.stop()
+        # The connection is usable without the receiver thread again.
+        xcp_comm.execute(XCPCommand.GET_STATUS)
+
+    assert first and second
+    expected = [
+        VARIABLES[next(suffix for suffix in VARIABLES if key.endswith(suffix))]
+        for key in stream.keys
+    ]
+    assert list(first[0][1]) == expected
+    assert list(second[-1][1]) == [value + 1 for value in expected]
+    timestamps = [timestamp for timestamp, _ in first + second]
+    assert timestamps == sorted(timestamps)
+
+
+def test_session_reconnects(simulator):
+    session = XCPSession(*simulator.address, retry_delay=0)
+    try:
+        session.run(lambda xcp_comm: xcp_comm.execute(XCPCommand.GET_STATUS))
+        assert session.connection_id == 1
+
+        # Like a reboot of the slave, the next call reconnects.
+        simulator.drop_connections()
+        session.run(lambda xcp_comm: xcp_comm.execute(XCPCommand.GET_STATUS))
+        assert session.connection_id == 2
+        assert session.state == XCPSessionState.CONNECTED
+    finally:
+        session.close()
+
+
+def test_session_backoff_and_probe():
+    # A port without a slave.
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        address = sock.getsockname()
+    session = XCPSession(*address, retry_delay=60, timeout=0.5)
+
+    with pytest.raises(OSError):
+        session.run(lambda xcp_comm: None)
+    assert session.state == XCPSessionState.RETRY_WAIT
+    # No connection attempt during the backoff.
+    with pytest.raises(ConnectionError, match='Not reconnecting'):
+        session.run(lambda xcp_comm: None)
+    assert session.failures == 1
+
+    # A readiness probe still tries to connect.
+    with pytest.raises(OSError):
+        session.probe()
+    assert session.failures == 2
+
+
+def test_run_concurrently(simulator):
+    slow = XCPSlaveSimulator(seed=0).start()
+    sessions = [
+        XCPSession(*simulator.address, retry_delay=0),
+        XCPSession(*slow.address, retry_delay=0),
+    ]
+
+    def get_status(xcp_comm):
+        return xcp_comm.execute(XCPCommand.GET_STATUS).type
+
+    calls = [(session, get_status) for session in sessions]
+    try:
+        slow.latency = 0.5
+        results = run_concurrently(calls, timeout=0.2)
+        assert results[0] == XCPResponseType.RESPONSE
+        assert isinstance(results[1], XCPSessionTimeoutError)
+
+        # The timed out call still runs, its session is skipped.
+        results = run_concurrently(calls, timeout=0.2)
+        assert results[0] == XCPResponseType.RESPONSE
+        assert isinstance(results[1], XCPSessionBusyError)
+
+        slow.latency = 0
+        time.sleep(1)
+        results = run_concurrently(calls, timeout=0.2)
+        assert results == [XCPResponseType.RESPONSE] * 2
+    finally:
+        for session in sessions:
+            session.close()
+        slow.stop()
+
+
+def test_socket_timeout_is_not_a_run_timeout(simulator):
+    session = XCPSession(*simulator.address, retry_delay=0, timeout=0.1)
+
+    def get_status(xcp_comm):
+        return xcp_comm.execute(XCPCommand.GET_STATUS).type
+
+    try:
+        session.run(get_status)
+        simulator.latency = 0.3
+        result, = run_concurrently([(session, get_status)], timeout=5)
+        assert isinstance(result, OSError)
+        assert not isinstance(result, XCPSessionTimeoutError)
+    finally:
+        simulator.latency = 0
+        session.close()
+
+
+def test_events_are_not_responses(caplog):
+    xcp_socket, slave_socket = socket.socketpair()
+    xcp_socket.settimeout(2)
+    xcp_comm = XCPInterface._Communicator(
+        xcp_socket,
+        logging.getLogger('test'),
+    )
+
+    def packet(counter, *payload):
+        return struct.pack('<HH', len(payload), counter) + bytes(payload)
+
+    def slave():
+        slave_socket.recv(0xFF)
+        slave_socket.sendall(
+            # EV_DAQ_OVERLOAD, SERV_TEXT and a DTO before the response.
+            packet(1, 0xFD, 0x06)
+            + packet(2, 0xFC, 0x01, *b'hello\0')
+            + packet(3, 0x00, 0x01)
+            + packet(4, 0xFF, 0, 0, 0, 0, 0)
+        )
+
+    thread = threading.Thread(target=slave)
+    thread.start()
+    with caplog.at_level(logging.INFO):
+        response = xcp_comm.execute(XCPCommand.GET_STATUS)
+    thread.join()
+    xcp_comm.close()
+    slave_socket.close()
+
+    assert response.type == XCPResponseType.RESPONSE
+    assert 'EV_DAQ_OVERLOAD' in caplog.text
+    assert 'hello' in caplog.text
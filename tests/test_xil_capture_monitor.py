@@ -0,0 +1,154 @@
+"""
+Tests of the XIL capture monitor against a fake MAPort.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import threading
+import types
+
+import pytest
+
+from dspace.bosch_hol_sdk.xil_capture_monitor import XILCaptureMonitor
+
+TASK = 'Periodic Task 1'
+
+
+class FakeCapture:
+    def __init__(self, fail_start=False):
+        self.fail_start = fail_start
+        self.started = False
+        self.stopped = False
+        # Path -> (times, values) returned by the next fetch.
+        self.samples = {}
+
+    def Start(self):
+        if self.fail_start:
+            raise RuntimeError('Start failed')
+        self.started = True
+
+    def Stop(self):
+        self.stopped = True
+
+    def Fetch(self, _):
+        samples, self.samples = self.samples, {}
+
+        def extract(task, path):
+            times, values = samples.get(path, ([], []))
+            return types.SimpleNamespace(
+                XVector=types.SimpleNamespace(Value=times),
+                FcnValues=types.SimpleNamespace(Value=values),
+            )
+        return types.SimpleNamespace(ExtractSignalValue=extract)
+
+
+class FakeMAPort:
+    def __init__(self, capture):
+        self.lock = threading.RLock()
+        self.capture = capture
+        self.captured = None
+
+    def create_capture(self, variables, task, downsampling=1):
+        self.captured = (list(variables), task)
+        return self.capture
+
+
+@pytest.fixture
+def capture():
+    return FakeCapture()
+
+
+@pytest.fixture
+def monitor(capture):
+    # Fetched by the tests, not by the thread.
+    monitor = XILCaptureMonitor(
+        FakeMAPort(capture),
+        [('a', 'path/a'), ('b', 'path/b'), ('a2', 'path/a')],
+        task=TASK,
+        fetch_period=3600,
+    )
+    monitor.start()
+    yield monitor
+    monitor.stop()
+
+
+def test_capture_paths(monitor, capture):
+    assert capture.started
+    assert monitor._maport.captured == (['path/a', 'path/b'], TASK)
+
+
+def test_read_variables_fresh_paths(monitor, capture):
+    paths = ['path/a', 'path/b', 'path/other']
+    # Nothing fetched yet.
+    assert monitor.read_variables(paths) == [None] * 3
+
+    capture.samples = {'path/a': ([0.1, 0.2], [1, 2]), 'path/b': ([0.2], [5])}
+    monitor._fetch()
+    assert monitor.read_variables(paths) == [2, 5, None]
+
+    # path/b got no samples, its value is outdated.
+    capture.samples = {'path/a': ([0.3], [3])}
+    monitor._fetch()
+    assert monitor.read_variables(paths) == [3, None, None]
+    assert monitor.samples('a') == [(0.1, 1), (0.2, 2), (0.3, 3)]
+
+
+def test_read_variables_max_age(monitor, capture, monkeypatch):
+    capture.samples = {'path/a': ([0.1], [1])}
+    monitor._fetch()
+    monkeypatch.setattr(monitor, '_max_age', -1)
+    assert monitor.read_variables(['path/a']) == [None]
+
+
+def test_aggregates(monitor, capture):
+    capture.samples = {'path/a': ([0.0, 1.0], [1, 3])}
+    monitor._fetch()
+    capture.samples = {'path/a': ([2.0], [2])}
+    monitor._fetch()
+    aggregate = monitor.aggregates()['a']
+    assert (aggregate.latest, aggregate.minimum, aggregate.maximum) == (2, 1, 3)
+    assert aggregate.rate == 0.5
+    assert aggregate.samples == 3
+    assert 'b' not in monitor.aggregates()
+
+    # The rate continues from the last sample.
+    capture.samples = {'path/a': ([4.0], [6])}
+    monitor._fetch()
+    aggregate = monitor.aggregates()['a']
+    assert (aggregate.rate, aggregate.samples) == (2.0, 1)
+
+
+def test_stop_releases_capture(monitor, capture):
+    capture.samples = {'path/a': ([0.1], [1])}
+    monitor._fetch()
+    monitor.stop()
+    assert capture.stopped
+    assert not monitor.running
+    assert monitor.read_variables(['path/a']) == [None]
+
+
+def test_failed_start_releases_capture():
+    capture = FakeCapture(fail_start=True)
+    monitor = XILCaptureMonitor(FakeMAPort(capture), [('a', 'path/a')])
+    with pytest.raises(RuntimeError):
+        monitor.start()
+    assert capture.stopped
+    assert not monitor.running
+    assert monitor._capture is None
+
+
+def test_failed_fetch_stops_thread(capture):
+    def fetch(_):
+        raise RuntimeError('Fetch failed')
+
+    capture.Fetch = fetch
+    monitor = XILCaptureMonitor(
+        FakeMAPort(capture), [('a', 'path/a')], fetch_period=0.01,
+    )
+    monitor.start()
+    try:
+        monitor._thread.join(5)
+        assert not monitor.running
+    finally:
+        monitor.stop()
@@ -0,0 +1,116 @@
+"""
+Tests of the catalogue of the XIL variables.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import logging
+
+import pytest
+
+from dspace.bosch_hol_sdk import xil_catalogue
+from dspace.bosch_hol_sdk.xil_catalogue import XilVariableCatalogue
+
+PATHS = [
+    'SCALEXIO()://App/BusSystems/Ethernet/ECU1/Service1/Subscribed',
+    'SCALEXIO()://App/Model Root/BusSystems/Ethernet/ECU2/Counter',
+    'SCALEXIO()://App/BusSystems/EthernetX/ECU3/Subscribed',
+    'SCALEXIO()://App/BusSystems/CAN/ECU4/Counter',
+    'SCALEXIO()://App/Model Root/Enable/Value',
+]
+
+
+class FakeMAPort:
+    def __init__(self, sdf_file, paths=PATHS):
+        self.sdf_file = str(sdf_file)
+        self.paths = paths
+        self.enumerations = 0
+
+    def get_variables(self):
+        self.enumerations += 1
+        return list(self.paths)
+
+
+@pytest.fixture
+def sdf_file(tmp_path):
+    (tmp_path / 'App.trc').write_text('trace')
+    sdf_file = tmp_path / 'App.sdf'
+    sdf_file.write_text('[Application]\nTraceFile = App.trc\n')
+    return sdf_file
+
+
+def test_catalogue():
+    catalogue = XilVariableCatalogue(PATHS + PATHS[:2], key='key')
+    assert len(catalogue) == len(PATHS)
+    assert list(catalogue) == sorted(PATHS)
+    assert PATHS[0] in catalogue
+    assert 'SCALEXIO()://App/Other' not in catalogue
+    assert catalogue.under_segments(('BusSystems', 'Ethernet')) == sorted(PATHS[:2])
+    assert catalogue.under_segments(('Ethernet',)) == sorted(PATHS[:2])
+    assert catalogue.under_segments(('Model Root', 'Enable')) == [PATHS[4]]
+
+
+def test_save_and_load(tmp_path):
+    catalogue = XilVariableCatalogue(PATHS)
+    cache_file = tmp_path / 'catalogue.txt'
+    catalogue.save(cache_file)
+    loaded = XilVariableCatalogue.load(cache_file, key='key')
+    assert loaded.paths == catalogue.paths
+    assert loaded.key == 'key'
+
+    cache_file.write_text('0\n' + '\n'.join(PATHS))
+    with pytest.raises(ValueError):
+        XilVariableCatalogue.load(cache_file)
+
+
+def test_application_key(sdf_file):
+    key = xil_catalogue.get_application_key(sdf_file)
+    assert xil_catalogue.get_application_key(sdf_file) == key
+
+    # A referenced file changes.
+    (sdf_file.parent / 'App.trc').write_text('other trace')
+    assert xil_catalogue.get_application_key(sdf_file) != key
+
+
+def test_load_xil_catalogue(sdf_file, tmp_path):
+    cache_directory = tmp_path / 'cache'
+    logger = logging.getLogger('test')
+    maport = FakeMAPort(sdf_file)
+
+    catalogue = xil_catalogue.load_xil_catalogue(
+        maport, cache_directory=cache_directory, logger=logger,
+    )
+    assert catalogue.key == xil_catalogue.get_application_key(sdf_file)
+    assert list(catalogue) == sorted(PATHS)
+    assert maport.enumerations == 1
+
+    # The same application.
+    assert xil_catalogue.load_xil_catalogue(
+        maport, catalogue, cache_directory, logger,
+    ) is catalogue
+    # From the cache.
+    loaded = xil_catalogue.load_xil_catalogue(
+        maport, cache_directory=cache_directory, logger=logger,
+    )
+    assert loaded.paths == catalogue.paths
+    assert maport.enumerations == 1
+
+    # Another application.
+    sdf_file.write_text('[Application]\n')
+    maport.paths = PATHS[:1]
+    other = xil_catalogue.load_xil_catalogue(
+        maport, catalogue, cache_directory, logger,
+    )
+    assert other.key != catalogue.key
+    assert list(other) == PATHS[:1]
+    assert maport.enumerations == 2
+
+
+def test_load_xil_catalogue_without_sdf(tmp_path):
+    maport = FakeMAPort(tmp_path / 'missing.sdf')
+    catalogue = xil_catalogue.load_xil_catalogue(
+        maport, cache_directory=tmp_path / 'cache',
+    )
+    assert catalogue.key is None
+    assert list(catalogue) == sorted(PATHS)
@@ -0,0 +1,152 @@
+"""
+Tests of the batched XIL writes of the data manipulation against a fake
+MAPort.
+
+@copyright
+    Copyright 2024, dSPACE Mechatronic Control Technology (Shanghai) Co., Ltd.
+    All rights reserved.
+"""
+import re
+
+import pytest
+
+from dspace.bosch_hol_sdk.bus_manipulation import manipulationbase
+from dspace.bosch_hol_sdk.bus_manipulation import (
+    XilManipulationBase,
+    XilWriteBatch,
+)
+from dspace.bosch_hol_sdk.replay_plugin_exceptions import (
+    XilWriteVerificationError,
+)
+
+_ELEMENT_REGEX = re.compile(r'(?P<path>.+)\[(?P<index>\d+)\]$')
+
+
+class FakeMAPort:
+    """ Holds the variables in memory and counts the calls into it. """
+    def __init__(self, values):
+        self.values = dict(values)
+        # Vectors which are longer in the model than the written values.
+        self.longer_vectors = set()
+        self.writes = []
+        self.batch_reads = []
+
+    def write_variable(self, path, value):
+        self.writes.append(path)
+        m = _ELEMENT_REGEX.match(path)
+        if m:
+            self.values[m.group('path')][int(m.group('index'))] = value
+        elif isinstance(value, list):
+            if path in self.longer_vectors:
+                raise RuntimeError(f'Size mismatch of {path}')
+            self.values[path] = list(value)
+        else:
+            self.values[path] = value
+
+    def read_variable(self, path):
+        return self.values[path]
+
+    def read_variables(self, paths):
+        self.batch_reads.append(list(paths))
+        return [self.values[path] for path in paths]
+
+
+@pytest.fixture(autouse=True)
+def elementwise_paths():
+    XilWriteBatch.reset_elementwise_paths()
+    yield
+    XilWriteBatch.reset_elementwise_paths()
+
+
+@pytest.fixture
+def maport():
+    return FakeMAPort({
+        'scalar': 0,
+        'vector': [0.0, 0.0, 0.0],
+        'longer': [0, 0, 0, 0, 0],
+    })
+
+
+def test_write_whole_vector(maport):
+    batch = XilWriteBatch(maport)
+    batch.write('vector', (1.0, 2.0, 3.0), 'configuration')
+    batch.write('scalar', 5, 'configuration')
+    assert maport.writes == ['vector', 'scalar']
+    batch.verify()
+    assert maport.values['vector'] == [1.0, 2.0, 3.0]
+
+
+def test_fallback_to_elementwise(maport):
+    maport.longer_vectors.add('longer')
+    batch = XilWriteBatch(maport)
+    batch.write('longer', [1, 2, 3], 'configuration')
+    assert maport.writes == ['longer', 'longer[0]', 'longer[1]', 'longer[2]']
+    assert 'longer' in XilWriteBatch._elementwise_paths
+    # The model vector is longer, only the written elements are compared.
+    batch.verify()
+    assert maport.values['longer'] == [1, 2, 3, 0, 0]
+
+    # Remembered, no whole-vector write is tried anymore.
+    maport.writes.clear()
+    batch = XilWriteBatch(maport)
+    batch.write('longer', [4, 5, 6], 'configuration')
+    assert maport.writes == ['longer[0]', 'longer[1]', 'longer[2]']
+
+
+def test_mixed_type_vector(maport):
+    batch = XilWriteBatch(maport)
+    batch.write('vector', [1, 2.5, 3], 'configuration')
+    assert maport.writes == ['vector[0]', 'vector[1]', 'vector[2]']
+    # Not a failure of the path.
+    assert not XilWriteBatch._elementwise_paths
+    # The element types are kept.
+    assert [type(value) for value in maport.values['vector']] == [
+        int, float, int,
+    ]
+
+
+def test_reset_elementwise_paths_for_new_application(maport, monkeypatch):
+    # The catalogue of the loaded application.
+    application = {'catalogue': object()}
+
+    def load_xil_catalogue(maport, current=None):
+        return application['catalogue']
+
+    monkeypatch.setattr(manipulationbase, 'load_xil_catalogue', load_xil_catalogue)
+    monkeypatch.setattr(XilManipulationBase, '_known_paths', None)
+    XilManipulationBase.reload_known_paths(maport)
+    XilWriteBatch._elementwise_paths.add('longer')
+
+    XilManipulationBase.reload_known_paths(maport)
+    assert XilWriteBatch._elementwise_paths == {'longer'}
+
+    application['catalogue'] = object()
+    XilManipulationBase.reload_known_paths(maport)
+    assert not XilWriteBatch._elementwise_paths
+
+
+def test_verify_reads_once(maport):
+    batch = XilWriteBatch(maport)
+    batch.write('vector', [1.0, 2.0, 3.0], 'configuration')
+    batch.write('scalar', 5, 'configuration')
+    batch.verify()
+    assert maport.batch_reads == [['vector', 'scalar']]
+
+    # Nothing pending anymore.
+    batch.verify()
+    assert len(maport.batch_reads) == 1
+
+
+@pytest.mark.parametrize('path, value, read_back', [
+    ('scalar', 5, 6),
+    ('vector', [1.0, 2.0, 3.0], [1.0, 2.0, 4.0]),
+    # Shorter than the written vector.
+    ('vector', [1.0, 2.0, 3.0], [1.0, 2.0]),
+    ('vector', [1.0, 2.0, 3.0], 1.0),
+])
+def test_verify_mismatch(maport, path, value, read_back):
+    batch = XilWriteBatch(maport)
+    batch.write(path, value, 'configuration')
+    maport.values[path] = read_back
+    with pytest.raises(XilWriteVerificationError):
+        batch.verify()